@@ -0,0 +1,80 @@
+import json
+import time
+from typing import Any
+
+from fastapi import HTTPException
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+import redis.asyncio as aioredis
+
+from app.api.v1.v1_mappers import compute_inputs_hash
+from app.core.config import get_settings
+from app.db.queries import fetch_job, fetch_job_status, insert_or_reuse_job
+from app.engine.openmotor_ai.engine_versions import openmotor_motorlib_version, trajectory_engine_version
+from app.workers.events import TERMINAL_EVENTS, job_events_channel
+from app.workers.tasks import run_sync_job_task
+
+
+async def _wait_for_terminal_event(pubsub, timeout_s: float) -> None:
+    deadline = time.monotonic() + timeout_s
+    while (remaining := deadline - time.monotonic()) > 0:
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+        if message is not None and json.loads(message["data"])["event"] in TERMINAL_EVENTS:
+            return
+
+
+async def run_offloaded(
+    job_type: str,
+    params: dict[str, Any],
+    *,
+    file_keys: tuple[str, ...] = (),
+    error_prefix: str = "",
+):
+    """Run endpoint work on the interactive queue and answer inline if it finishes within the latency budget.
+
+    Identical inputs reuse the earlier job, so a repeated request is served from its stored result. Work still
+    running after ``SYNC_ENDPOINT_WAIT_S`` gets a 202 with the job id; the result is then at ``/jobs/{job_id}``.
+    """
+    settings = get_settings()
+    inputs_hash = await run_in_threadpool(compute_inputs_hash, params, file_keys)
+    job_id, created = await run_in_threadpool(
+        insert_or_reuse_job,
+        job_type,
+        params,
+        inputs_hash,
+        {
+            "openmotor_motorlib": openmotor_motorlib_version(),
+            "trajectory_engine": trajectory_engine_version(),
+        },
+        settings.celery_task_time_limit,
+    )
+    client = aioredis.Redis.from_url(settings.redis_url)
+    pubsub = client.pubsub()
+    try:
+        # Subscribe before enqueueing, so a job that finishes quickly cannot publish its end unseen.
+        await pubsub.subscribe(job_events_channel(job_id))
+        if created:
+            await run_in_threadpool(
+                run_sync_job_task.apply_async,
+                args=(job_id, job_type, params),
+                task_id=job_id,
+            )
+        job = await run_in_threadpool(fetch_job_status, job_id)
+        if job["status"] not in TERMINAL_EVENTS:
+            await _wait_for_terminal_event(pubsub, settings.sync_endpoint_wait_s)
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
+
+    job = await run_in_threadpool(fetch_job, job_id)
+    if job["status"] == "completed":
+        return job["result"]
+    if job["status"] == "failed":
+        status_code = (job.get("result") or {}).get("error_status", 500)
+        raise HTTPException(status_code=status_code, detail=f"{error_prefix}{job['error']}")
+    status_url = f"/api/v1/jobs/{job_id}"
+    return JSONResponse(
+        status_code=202,
+        content={"job_id": job_id, "status": job["status"], "status_url": status_url},
+        headers={"Location": status_url},
+    )
@@ -7,6 +7,7 @@ from pathlib import Path
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile
 from pydantic import BaseModel, Field
 
+from app.api.v1.offload import run_offloaded
 from app.module_r.generator import PhysicsEngine, RICParser, SmartRocketGenerator
 from app.module_r.openrocket_exporter import export_openrocket_ork
 from app.module_r.schemas import (
@@ -166,7 +167,7 @@ def _build_parametric_assembly(
     return assembly
 
 
-def _run_parametric_build(
+def run_parametric_build(
     *,
     ric_path: str,
     upper_length_m: float,
@@ -204,8 +205,17 @@ def _run_parametric_build(
     )
 
 
+_BUILD_ERROR_PREFIX = "smart parametric build failed: "
+
+
+async def _offload_parametric_build(**params):
+    return await run_offloaded(
+        "module_r_auto_build", params, file_keys=("ric_path",), error_prefix=_BUILD_ERROR_PREFIX
+    )
+
+
 @router.post("/auto-build", response_model=ModuleRAutoBuildResponse)
-def module_r_auto_build(request: AutoBuildRequest):
+async def module_r_auto_build(request: AutoBuildRequest):
     ric_paths = [
         path
         for path in (request.ric_paths or ([request.ric_path] if request.ric_path else []))
@@ -213,22 +223,19 @@ def module_r_auto_build(request: AutoBuildRequest):
     ]
     if not ric_paths:
         raise HTTPException(status_code=400, detail="uploaded file is empty")
-    try:
-        return _run_parametric_build(
-            ric_path=ric_paths[0],
-            upper_length_m=request.constraints.upper_length_m,
-            upper_mass_kg=request.constraints.upper_mass_kg,
-            target_apogee_m=request.constraints.target_apogee_m,
-            include_ballast=request.include_ballast,
-            include_telemetry=request.include_telemetry,
-            include_parachute=request.include_parachute,
-        )
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"smart parametric build failed: {exc}") from exc
+    return await _offload_parametric_build(
+        ric_path=ric_paths[0],
+        upper_length_m=request.constraints.upper_length_m,
+        upper_mass_kg=request.constraints.upper_mass_kg,
+        target_apogee_m=request.constraints.target_apogee_m,
+        include_ballast=request.include_ballast,
+        include_telemetry=request.include_telemetry,
+        include_parachute=request.include_parachute,
+    )
 
 
 @router.post("/auto-build/upload", response_model=ModuleRAutoBuildResponse)
-def module_r_auto_build_upload(
+async def module_r_auto_build_upload(
     ric_file: list[UploadFile] = File(...),
     upper_length_m: float = Form(...),
     upper_mass_kg: float = Form(...),
@@ -249,7 +256,7 @@ def module_r_auto_build_upload(
     output_root.mkdir(parents=True, exist_ok=True)
     ric_paths: list[str] = []
     for upload in ric_file:
-        content = upload.file.read()
+        content = await upload.read()
         if not content:
             continue
         suffix = Path(upload.filename or "").suffix.lower()
@@ -259,22 +266,19 @@ def module_r_auto_build_upload(
         ric_paths.append(str(ric_path))
     if not ric_paths:
         raise HTTPException(status_code=400, detail="uploaded file is empty")
-    try:
-        return _run_parametric_build(
-            ric_path=ric_paths[0],
-            upper_length_m=upper_length_m,
-            upper_mass_kg=upper_mass_kg,
-            target_apogee_m=target_apogee_m,
-            include_ballast=include_ballast,
-            include_telemetry=include_telemetry,
-            include_parachute=include_parachute,
-        )
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"smart parametric build failed: {exc}") from exc
+    return await _offload_parametric_build(
+        ric_path=ric_paths[0],
+        upper_length_m=upper_length_m,
+        upper_mass_kg=upper_mass_kg,
+        target_apogee_m=target_apogee_m,
+        include_ballast=include_ballast,
+        include_telemetry=include_telemetry,
+        include_parachute=include_parachute,
+    )
 
 
 @router.post("/auto-build/upload-legacy", response_model=ModuleRAutoBuildResponse)
-def module_r_auto_build_upload_legacy(
+async def module_r_auto_build_upload_legacy(
     ric_file: list[UploadFile] = File(...),
     upper_length_m: float = Form(...),
     upper_mass_kg: float = Form(...),
@@ -286,7 +290,7 @@ def module_r_auto_build_upload_legacy(
     random_seed: int | None = Form(default=None),
     stage_count: int | None = Form(default=None),
 ):
-    return module_r_auto_build_upload(
+    return await module_r_auto_build_upload(
         ric_file=ric_file,
         upper_length_m=upper_length_m,
         upper_mass_kg=upper_mass_kg,
@@ -1,6 +1,10 @@
+import json
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Header, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+import redis.asyncio as aioredis
 
 from app.api.v1.schemas import (
     JobResponse,
@@ -8,23 +12,49 @@ from app.api.v1.schemas import (
     MissionTargetWeights,
     OptimizationInputRequest,
     OptimizationRequest,
+    V1JobProgressEvent,
+    V1JobProgressResponse,
     V1JobResponse,
     V1ManualTestReport,
     V1MotorFirstRequest,
     V1MissionTargetRequest,
+    V1ParetoRerankRequest,
+    V1ParetoRerankResponse,
+    V1ResultSectionPage,
     V1TargetOnlyMissionRequest,
 )
 from app.api.v1.units import f_to_k, ft_to_m, in_to_m, lb_to_kg, mph_to_m_s, m_to_in
-from app.api.v1.v1_mappers import build_v1_job_response
+from app.api.v1.v1_mappers import JOB_INPUT_FILE_KEYS, build_v1_job_response, compute_inputs_hash
 from app.api.v1.units import convert_mass_length_payload
-from app.db.queries import fetch_job, insert_job
+from app.core.config import get_settings
+from app.db.queries import (
+    cancel_queued_job,
+    fetch_job,
+    fetch_job_progress,
+    fetch_job_status,
+    insert_job,
+    insert_or_reuse_job,
+)
+from app.engine.openmotor_ai.engine_versions import openmotor_motorlib_version, trajectory_engine_version
+from app.engine.openmotor_ai.scoring import ScoreWeights, rerank_pareto
+from app.services.result_store import RESULT_SECTIONS, parse_result_filters, read_result_section
 from app.workers.tasks import (
     run_input_optimization_task,
     run_mission_target_task,
     run_motor_first_task,
     run_optimization_task,
 )
+from app.workers.celery_app import celery_app
+from app.workers.routing import job_route
+from app.workers.events import (
+    TERMINAL_EVENTS,
+    job_event_name,
+    job_events_channel,
+    publish_job_event,
+    request_job_cancel,
+)
 from app.engine.openrocket.runner import run_openrocket_geometry, run_openrocket_core_masscalc
+from app.engine.optimizer.evolutionary import _parse_bounds
 from app.engine.integration.ork_rkt import calculate_stack_length_m
 
 router = APIRouter(tags=["optimization"])
@@ -108,6 +138,10 @@ def _build_mission_target_params(request: V1MissionTargetRequest) -> dict:
             throat_scales=design_space.throat_scales,
             exit_scales=design_space.exit_scales,
             grain_count=design_space.grain_count,
+            strategy=design_space.strategy,
+            max_simulations=design_space.max_simulations,
+            batch_size=design_space.batch_size,
+            workers=design_space.workers,
         )
     else:
         if request.stage_count == 2:
@@ -228,6 +262,10 @@ def _build_target_only_params(request: V1TargetOnlyMissionRequest) -> dict:
             throat_scales=design_space.throat_scales,
             exit_scales=design_space.exit_scales,
             grain_count=design_space.grain_count,
+            strategy=design_space.strategy,
+            max_simulations=design_space.max_simulations,
+            batch_size=design_space.batch_size,
+            workers=design_space.workers,
         )
     elif request.search:
         search = request.search
@@ -350,15 +388,34 @@ def _build_target_only_params(request: V1TargetOnlyMissionRequest) -> dict:
     }
 
 
+def _enqueue_deduplicated(job_type: str, params: dict, task) -> tuple[str, bool]:
+    # Identical inputs on the same engines give the same result, so repeat submissions share one job.
+    job_id, created = insert_or_reuse_job(
+        job_type=job_type,
+        params=params,
+        inputs_hash=compute_inputs_hash(params, JOB_INPUT_FILE_KEYS[job_type]),
+        engine_versions={
+            "openmotor_motorlib": openmotor_motorlib_version(),
+            "trajectory_engine": trajectory_engine_version(),
+        },
+        in_flight_max_age_s=get_settings().celery_task_time_limit,
+    )
+    if created:
+        task.apply_async(args=(job_id, params), task_id=job_id, **job_route(job_type, params))
+    else:
+        logger.info("reusing %s job %s for identical inputs", job_type, job_id)
+    return job_id, created
+
+
 @router.post("/optimize/mission-target", response_model=V1JobResponse)
 def enqueue_mission_target(request: V1MissionTargetRequest):
     params = _build_mission_target_params(request)
-    job_id = insert_job(job_type="mission_target", params=params)
-    run_mission_target_task.apply_async(args=(job_id, params), task_id=job_id)
+    job_id, created = _enqueue_deduplicated("mission_target", params, run_mission_target_task)
     return build_v1_job_response(
         fetch_job(job_id),
         job_kind="mission_target",
         submitted_params=request.model_dump(),
+        deduplicated=not created,
     )
 
 
@@ -368,12 +425,12 @@ def enqueue_mission_target_target_only(request: V1TargetOnlyMissionRequest):
         params = _build_target_only_params(request)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
-    job_id = insert_job(job_type="mission_target", params=params)
-    run_mission_target_task.apply_async(args=(job_id, params), task_id=job_id)
+    job_id, created = _enqueue_deduplicated("mission_target", params, run_mission_target_task)
     return build_v1_job_response(
         fetch_job(job_id),
         job_kind="mission_target",
         submitted_params=request.model_dump(),
+        deduplicated=not created,
     )
 
 
@@ -400,9 +457,8 @@ def _build_motor_first_params(request: V1MotorFirstRequest) -> dict:
 @router.post("/optimize/motor-first", response_model=V1JobResponse)
 def enqueue_motor_first(request: V1MotorFirstRequest):
     params = _build_motor_first_params(request)
-    job_id = insert_job(job_type="motor_first", params=params)
-    run_motor_first_task.apply_async(args=(job_id, params), task_id=job_id)
-    return build_v1_job_response(fetch_job(job_id), job_kind="motor_first")
+    job_id, created = _enqueue_deduplicated("motor_first", params, run_motor_first_task)
+    return build_v1_job_response(fetch_job(job_id), job_kind="motor_first", deduplicated=not created)
 
 
 @router.get("/optimize/motor-first/{job_id}", response_model=V1JobResponse)
@@ -425,10 +481,46 @@ def get_mission_target(job_id: str):
     return build_v1_job_response(job, job_kind="mission_target")
 
 
-def _build_manual_report(job: dict[str, object]) -> V1ManualTestReport:
+@router.post("/optimize/mission-target/{job_id}/cancel", response_model=V1JobResponse)
+def cancel_mission_target(job_id: str):
+    job = fetch_job_status(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="job not found")
+    if job.get("type") != "mission_target":
+        raise HTTPException(status_code=400, detail="job is not mission_target")
+    if job["status"] in TERMINAL_EVENTS:
+        raise HTTPException(status_code=409, detail=f"job already {job['status']}")
+    # Set the flag first: a worker picking the job up right now still sees it.
+    request_job_cancel(job_id)
+    if cancel_queued_job(job_id):
+        celery_app.control.revoke(job_id)
+        publish_job_event(job_id, "cancelled", {})
+    return build_v1_job_response(fetch_job(job_id), job_kind="mission_target")
+
+
+def _completed_mission_result(job_id: str) -> dict:
+    job = fetch_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="job not found")
+    if job.get("type") != "mission_target":
+        raise HTTPException(status_code=400, detail="job is not mission_target")
+    if job.get("status") != "completed" or not job.get("result"):
+        raise HTTPException(status_code=409, detail="job not completed")
+    return job
+
+
+def _read_mission_section(job: dict, section: str, **kwargs) -> tuple[int, list[dict]]:
+    motorlib = job["result"].get("openmotor_motorlib_result") or {}
+    try:
+        return read_result_section(motorlib, section, **kwargs)
+    except FileNotFoundError:
+        raise HTTPException(status_code=410, detail=f"stored {section} for this job are no longer available")
+
+
+def _build_manual_report(job: dict[str, object], offset: int = 0, limit: int | None = None) -> V1ManualTestReport:
     result = job.get("result") or {}
     motorlib = result.get("openmotor_motorlib_result") or {}
-    candidates = motorlib.get("candidates") or []
+    _, candidates = _read_mission_section(job, "candidates", offset=offset, limit=limit)
     report_candidates = []
     for candidate in candidates:
         metrics = convert_mass_length_payload(candidate.get("metrics") or {})
@@ -481,21 +573,162 @@ def _build_manual_report(job: dict[str, object]) -> V1ManualTestReport:
 
 
 @router.get("/optimize/mission-target/{job_id}/manual-report", response_model=V1ManualTestReport)
-def get_mission_target_manual_report(job_id: str):
+def get_mission_target_manual_report(
+    job_id: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int | None = Query(default=None, ge=1, le=1000),
+):
+    return _build_manual_report(_completed_mission_result(job_id), offset=offset, limit=limit)
+
+
+@router.get("/optimize/mission-target/{job_id}/results/{section}", response_model=V1ResultSectionPage)
+def get_mission_target_result_section(
+    job_id: str,
+    section: str,
+    offset: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+    filters: list[str] = Query(default=[], alias="filter"),
+):
+    if section not in RESULT_SECTIONS:
+        raise HTTPException(status_code=404, detail=f"unknown result section: {section}")
+    try:
+        parsed_filters = parse_result_filters(filters)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    job = _completed_mission_result(job_id)
+    total, items = _read_mission_section(job, section, offset=offset, limit=limit, filters=parsed_filters)
+    return V1ResultSectionPage(
+        job_id=str(job["id"]),
+        section=section,
+        total=total,
+        offset=offset,
+        limit=limit,
+        items=[convert_mass_length_payload(item) for item in items],
+    )
+
+
+@router.post("/optimize/mission-target/{job_id}/rerank", response_model=V1ParetoRerankResponse)
+def rerank_mission_target(job_id: str, request: V1ParetoRerankRequest):
+    job = _completed_mission_result(job_id)
+    motorlib = job["result"].get("openmotor_motorlib_result") or {}
+    report = motorlib.get("pareto")
+    if not report:
+        raise HTTPException(status_code=409, detail="job result has no stored objective vectors")
+    # The job row may only hold the first few entries inline; re-scoring needs all of them.
+    _, entries = _read_mission_section(
+        job, "pareto.candidates", filters={"pareto_rank": "0"} if request.front_only else None
+    )
+    report = {**report, "candidates": entries}
+    ranked = rerank_pareto(report, ScoreWeights(**request.weights.model_dump()))
+    return V1ParetoRerankResponse(
+        job_id=str(job["id"]),
+        weights=request.weights,
+        objectives=report.get("objectives") or [],
+        front=report.get("front") or [],
+        ranked=ranked,
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+def get_job(job_id: str):
     job = fetch_job(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="job not found")
-    if job.get("type") != "mission_target":
-        raise HTTPException(status_code=400, detail="job is not mission_target")
-    if job.get("status") != "completed" or not job.get("result"):
-        raise HTTPException(status_code=409, detail="job not completed")
-    return _build_manual_report(job)
+    return job
+
+
+@router.get("/jobs/{job_id}/progress", response_model=V1JobProgressResponse)
+def get_job_progress(
+    job_id: str,
+    since: int = Query(default=0, ge=0),
+    limit: int = Query(default=100, ge=1, le=1000),
+):
+    job = fetch_job_status(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="job not found")
+    events = fetch_job_progress(job_id, after_seq=since, limit=limit)
+    return V1JobProgressResponse(
+        job_id=str(job["id"]),
+        status=job["status"],
+        since=since,
+        last_seq=events[-1]["seq"] if events else since,
+        events=[V1JobProgressEvent(**event) for event in events],
+    )
+
+
+def _sse_frame(event: str, payload: dict, seq: int | None = None) -> str:
+    lines = [f"id: {seq}"] if seq is not None else []
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(payload, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def _job_event_stream(request: Request, job_id: str, since: int):
+    client = aioredis.Redis.from_url(get_settings().redis_url)
+    pubsub = client.pubsub()
+    try:
+        # Subscribe before replaying job_progress, so events published during the replay are not lost.
+        await pubsub.subscribe(job_events_channel(job_id))
+        last_seq = since
+        while True:
+            events = await run_in_threadpool(fetch_job_progress, job_id, last_seq, 500)
+            for event in events:
+                last_seq = event["seq"]
+                yield _sse_frame(job_event_name(event["payload"]), event["payload"], last_seq)
+            if len(events) < 500:
+                break
+        job = await run_in_threadpool(fetch_job_status, job_id)
+        if job and job["status"] in TERMINAL_EVENTS:
+            yield _sse_frame(job["status"], {})
+            return
+        while not await request.is_disconnected():
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=15.0)
+            if message is None:
+                yield ": keep-alive\n\n"
+                continue
+            data = json.loads(message["data"])
+            seq = data.get("seq")
+            if seq is not None:
+                if seq <= last_seq:
+                    continue
+                last_seq = seq
+            yield _sse_frame(data["event"], data.get("payload") or {}, seq)
+            if data["event"] in TERMINAL_EVENTS:
+                return
+    finally:
+        await pubsub.aclose()
+        await client.aclose()
+
+
+@router.get("/jobs/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    request: Request,
+    since: int = Query(default=0, ge=0),
+    last_event_id: str | None = Header(default=None),
+):
+    job = await run_in_threadpool(fetch_job_status, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="job not found")
+    if last_event_id and last_event_id.isdigit():
+        since = max(since, int(last_event_id))
+    return StreamingResponse(
+        _job_event_stream(request, job_id, since),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @router.post("/optimize", response_model=JobResponse)
 def enqueue_optimization(request: OptimizationRequest):
+    try:
+        _parse_bounds(request.params.get("bounds"))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
     job_id = insert_job(job_type="optimize", params=request.params)
-    run_optimization_task.apply_async(args=(job_id, request.params), task_id=job_id)
+    run_optimization_task.apply_async(
+        args=(job_id, request.params), task_id=job_id, **job_route("optimize", request.params)
+    )
     return fetch_job(job_id)
 
 
@@ -505,7 +738,7 @@ def enqueue_input_optimization(input_id: str, request: OptimizationInputRequest)
     params["input_id"] = input_id
     job_id = insert_job(job_type="optimize_input", params=params)
     run_input_optimization_task.apply_async(
-        args=(job_id, input_id, params), task_id=job_id
+        args=(job_id, input_id, params), task_id=job_id, **job_route("optimize_input", params)
     )
     return fetch_job(job_id)
 
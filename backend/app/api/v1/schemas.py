@@ -67,6 +67,10 @@ class MissionTargetSearch(BaseModel):
     throat_scales: list[float]
     exit_scales: list[float]
     grain_count: int | None = None
+    strategy: Literal["grid", "bayesian", "bisect"] = "grid"
+    max_simulations: int | None = Field(default=None, gt=0)
+    batch_size: int = Field(default=4, gt=0)
+    workers: int = Field(default=1, gt=0)
 
 
 class MissionTargetWeights(BaseModel):
@@ -129,8 +133,16 @@ class OrkUploadResponse(BaseModel):
 
 class JobResponse(BaseModel):
     id: str
-    type: Literal["simulate", "optimize", "optimize_input", "mission_target"]
-    status: Literal["queued", "running", "completed", "failed"]
+    type: Literal[
+        "simulate",
+        "optimize",
+        "optimize_input",
+        "mission_target",
+        "motor_first",
+        "module_r_auto_build",
+        "openrocket_like_legacy",
+    ]
+    status: Literal["queued", "running", "completed", "failed", "cancelled"]
     params: dict[str, Any] = Field(default_factory=dict)
     result: dict[str, Any] | None = None
     error: str | None = None
@@ -148,7 +160,7 @@ class V1JobResponse(BaseModel):
     api_version: Literal["v1"] = "v1"
     job_kind: Literal["simulate", "mission_target", "motor_first"]
     id: str
-    status: Literal["queued", "running", "completed", "failed"]
+    status: Literal["queued", "running", "completed", "failed", "cancelled"]
     params: dict[str, Any] = Field(default_factory=dict)
     submitted_params: dict[str, Any] | None = None
     result: dict[str, Any] | None = None
@@ -158,6 +170,9 @@ class V1JobResponse(BaseModel):
     type: Literal["simulate", "mission_target", "motor_first"] | None = Field(
         default=None, description="Deprecated alias for job_kind"
     )
+    deduplicated: bool = Field(
+        default=False, description="True when an identical earlier job was returned instead of enqueuing a new one"
+    )
 
 
 class V1Objective(BaseModel):
@@ -192,6 +207,10 @@ class V1DesignSpace(BaseModel):
     throat_scales: list[float] = Field(..., description="scale factor")
     exit_scales: list[float] = Field(..., description="scale factor")
     grain_count: int | None = Field(default=None, gt=0)
+    strategy: Literal["grid", "bayesian", "bisect"] = "grid"
+    max_simulations: int | None = Field(default=None, gt=0)
+    batch_size: int = Field(default=4, gt=0)
+    workers: int = Field(default=1, gt=0)
 
 
 class V1SolverConfig(BaseModel):
@@ -385,6 +404,45 @@ class V1ManualTestCandidate(BaseModel):
     )
 
 
+class V1ParetoRerankRequest(BaseModel):
+    weights: MissionTargetWeights = Field(default_factory=MissionTargetWeights)
+    front_only: bool = False
+
+
+class V1ParetoRerankResponse(BaseModel):
+    api_version: Literal["v1"] = "v1"
+    job_id: str
+    weights: MissionTargetWeights
+    objectives: list[str]
+    front: list[str] = Field(default_factory=list)
+    ranked: list[dict[str, Any]] = Field(default_factory=list)
+
+
+class V1JobProgressEvent(BaseModel):
+    seq: int
+    payload: dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime
+
+
+class V1JobProgressResponse(BaseModel):
+    api_version: Literal["v1"] = "v1"
+    job_id: str
+    status: Literal["queued", "running", "completed", "failed", "cancelled"]
+    since: int
+    last_seq: int
+    events: list[V1JobProgressEvent] = Field(default_factory=list)
+
+
+class V1ResultSectionPage(BaseModel):
+    api_version: Literal["v1"] = "v1"
+    job_id: str
+    section: Literal["candidates", "ranked", "rejected"]
+    total: int
+    offset: int
+    limit: int
+    items: list[dict[str, Any]] = Field(default_factory=list)
+
+
 class V1ManualTestReport(BaseModel):
     api_version: Literal["v1"] = "v1"
     job_kind: Literal["mission_target"] = "mission_target"
@@ -6,9 +6,20 @@ from typing import Any, Literal
 
 from app.api.v1.schemas import V1Error, V1JobResponse
 from app.api.v1.units import convert_mass_length_payload
+from app.engine.openmotor_ai.stage_planner import file_digest
 
 
-def compute_inputs_hash(payload: dict[str, Any]) -> str:
+# Params that name input files. They are hashed by content, so a copy under a new path still matches the earlier
+# job and a file edited in place does not.
+JOB_INPUT_FILE_KEYS: dict[str, tuple[str, ...]] = {
+    "mission_target": ("base_ric_path", "stage1_ric_path", "rkt_path", "preset_path", "ork_path"),
+    "motor_first": ("motor_ric_path",),
+}
+
+
+def compute_inputs_hash(payload: dict[str, Any], file_keys: tuple[str, ...] = ()) -> str:
+    if file_keys:
+        payload = {**payload, **{key: file_digest(payload.get(key)) or payload.get(key) for key in file_keys}}
     normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
 
@@ -17,6 +28,7 @@ def build_v1_job_response(
     job: dict[str, Any],
     job_kind: Literal["simulate", "mission_target", "motor_first"],
     submitted_params: dict[str, Any] | None = None,
+    deduplicated: bool = False,
 ) -> V1JobResponse:
     error = None
     if job.get("error"):
@@ -40,4 +52,5 @@ def build_v1_job_response(
         created_at=job["created_at"],
         updated_at=job["updated_at"],
         type=job_kind,
+        deduplicated=deduplicated,
     )
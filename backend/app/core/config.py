@@ -7,6 +7,9 @@ from functools import lru_cache
 class Settings:
     env: str
     postgres_dsn: str
+    postgres_pool_min: int
+    postgres_pool_max: int
+    postgres_pool_timeout_s: float
     redis_url: str
     motors_dir: str
     motor_upload_dir: str
@@ -14,6 +17,12 @@ class Settings:
     cors_origins: list[str]
     celery_task_soft_time_limit: int
     celery_task_time_limit: int
+    interactive_max_cost: int
+    sync_endpoint_wait_s: float
+    result_inline_top_k: int
+    worker_warmup: bool
+    worker_warmup_openrocket: bool
+    worker_proc_alive_timeout_s: float
 
 
 def _split_csv(value: str | None) -> list[str]:
@@ -31,6 +40,9 @@ def get_settings() -> Settings:
     base_dir = _project_root()
     env = os.getenv("ENV", "development")
     postgres_dsn = os.getenv("POSTGRES_DSN", "")
+    postgres_pool_min = int(os.getenv("POSTGRES_POOL_MIN", "1"))
+    postgres_pool_max = max(int(os.getenv("POSTGRES_POOL_MAX", "10")), postgres_pool_min, 1)
+    postgres_pool_timeout_s = float(os.getenv("POSTGRES_POOL_TIMEOUT_S", "10"))
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     motors_dir = os.getenv("MOTORS_DIR", "resources/motors")
     if not os.path.isabs(motors_dir):
@@ -46,10 +58,19 @@ def get_settings() -> Settings:
     cors_origins = _split_csv(os.getenv("CORS_ORIGINS"))
     celery_task_soft_time_limit = int(os.getenv("CELERY_TASK_SOFT_TIME_LIMIT", "300"))
     celery_task_time_limit = int(os.getenv("CELERY_TASK_TIME_LIMIT", "600"))
+    interactive_max_cost = int(os.getenv("INTERACTIVE_MAX_COST", "2000"))
+    sync_endpoint_wait_s = float(os.getenv("SYNC_ENDPOINT_WAIT_S", "20"))
+    result_inline_top_k = max(int(os.getenv("RESULT_INLINE_TOP_K", "10")), 1)
+    worker_warmup = os.getenv("WORKER_WARMUP", "1").lower() not in ("0", "false", "no")
+    worker_warmup_openrocket = os.getenv("WORKER_WARMUP_OPENROCKET", "0").lower() in ("1", "true", "yes")
+    worker_proc_alive_timeout_s = float(os.getenv("WORKER_PROC_ALIVE_TIMEOUT_S", "60"))
 
     return Settings(
         env=env,
         postgres_dsn=postgres_dsn,
+        postgres_pool_min=postgres_pool_min,
+        postgres_pool_max=postgres_pool_max,
+        postgres_pool_timeout_s=postgres_pool_timeout_s,
         redis_url=redis_url,
         motors_dir=motors_dir,
         motor_upload_dir=motor_upload_dir,
@@ -57,4 +78,10 @@ def get_settings() -> Settings:
         cors_origins=cors_origins,
         celery_task_soft_time_limit=celery_task_soft_time_limit,
         celery_task_time_limit=celery_task_time_limit,
+        interactive_max_cost=interactive_max_cost,
+        sync_endpoint_wait_s=sync_endpoint_wait_s,
+        result_inline_top_k=result_inline_top_k,
+        worker_warmup=worker_warmup,
+        worker_warmup_openrocket=worker_warmup_openrocket,
+        worker_proc_alive_timeout_s=worker_proc_alive_timeout_s,
     )
@@ -1,10 +1,10 @@
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from psycopg2.extras import Json
 
-from app.db.session import get_connection
+from app.db.session import execute_prepared, get_connection
 
 
 def create_jobs_table() -> None:
@@ -24,6 +24,31 @@ def create_jobs_table() -> None:
                 )
                 """
             )
+            cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS inputs_hash TEXT")
+            cur.execute("ALTER TABLE jobs ADD COLUMN IF NOT EXISTS engine_versions JSONB")
+            cur.execute(
+                """
+                CREATE INDEX IF NOT EXISTS jobs_inputs_hash_idx
+                ON jobs (type, inputs_hash)
+                WHERE inputs_hash IS NOT NULL
+                """
+            )
+
+
+def create_job_progress_table() -> None:
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                CREATE TABLE IF NOT EXISTS job_progress (
+                    job_id TEXT NOT NULL,
+                    seq BIGINT NOT NULL,
+                    payload JSONB NOT NULL,
+                    created_at TIMESTAMPTZ NOT NULL,
+                    PRIMARY KEY (job_id, seq)
+                )
+                """
+            )
 
 
 def create_user_inputs_table() -> None:
@@ -76,19 +101,79 @@ def fetch_user_input(input_id: str) -> dict[str, Any] | None:
     }
 
 
-def insert_job(job_type: str, params: dict[str, Any]) -> str:
+def _insert_job_row(
+    cur,
+    job_type: str,
+    params: dict[str, Any],
+    inputs_hash: str | None,
+    engine_versions: dict[str, Any] | None,
+) -> str:
     job_id = str(uuid.uuid4())
     now = datetime.now(timezone.utc)
+    execute_prepared(
+        cur,
+        "insert_job",
+        """
+        INSERT INTO jobs (id, type, status, params, created_at, updated_at, inputs_hash, engine_versions)
+        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+        """,
+        (
+            job_id,
+            job_type,
+            "queued",
+            Json(params),
+            now,
+            now,
+            inputs_hash,
+            Json(engine_versions) if engine_versions is not None else None,
+        ),
+    )
+    return job_id
+
+
+def insert_job(job_type: str, params: dict[str, Any]) -> str:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
+            return _insert_job_row(cur, job_type, params, None, None)
+
+
+def insert_or_reuse_job(
+    job_type: str,
+    params: dict[str, Any],
+    inputs_hash: str,
+    engine_versions: dict[str, Any],
+    in_flight_max_age_s: float,
+) -> tuple[str, bool]:
+    # Completed jobs are reused unless their search was stopped early (a deadline leaves a best-effort result that a
+    # rerun could improve on); queued or running ones only while younger than in_flight_max_age_s, since older
+    # in-flight rows belong to lost workers. Failed jobs are never reused.
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=in_flight_max_age_s)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            # Serializes identical submissions, so two concurrent requests cannot both miss and enqueue twice.
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"{job_type}:{inputs_hash}",))
+            execute_prepared(
+                cur,
+                "find_reusable_job",
                 """
-                INSERT INTO jobs (id, type, status, params, created_at, updated_at)
-                VALUES (%s, %s, %s, %s, %s, %s)
+                SELECT id
+                FROM jobs
+                WHERE type = $1
+                  AND inputs_hash = $2
+                  AND engine_versions = $3
+                  AND (
+                    (status = 'completed' AND result #>> '{openmotor_motorlib_result,summary,stopped}' IS NULL)
+                    OR (status IN ('queued', 'running') AND updated_at >= $4)
+                  )
+                ORDER BY status = 'completed' DESC, updated_at DESC
+                LIMIT 1
                 """,
-                (job_id, job_type, "queued", Json(params), now, now),
+                (job_type, inputs_hash, Json(engine_versions), stale_before),
             )
-    return job_id
+            row = cur.fetchone()
+            if row:
+                return row[0], False
+            return _insert_job_row(cur, job_type, params, inputs_hash, engine_versions), True
 
 
 def update_job(
@@ -100,14 +185,16 @@ def update_job(
     now = datetime.now(timezone.utc)
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
+            execute_prepared(
+                cur,
+                "update_job",
                 """
                 UPDATE jobs
-                SET status = %s,
-                    result = %s,
-                    error = %s,
-                    updated_at = %s
-                WHERE id = %s
+                SET status = $1,
+                    result = $2,
+                    error = $3,
+                    updated_at = $4
+                WHERE id = $5
                 """,
                 (status, Json(result) if result is not None else None, error, now, job_id),
             )
@@ -116,11 +203,13 @@ def update_job(
 def fetch_job(job_id: str) -> dict[str, Any] | None:
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
+            execute_prepared(
+                cur,
+                "fetch_job",
                 """
                 SELECT id, type, status, params, result, error, created_at, updated_at
                 FROM jobs
-                WHERE id = %s
+                WHERE id = $1
                 """,
                 (job_id,),
             )
@@ -137,3 +226,86 @@ def fetch_job(job_id: str) -> dict[str, Any] | None:
         "created_at": row[6],
         "updated_at": row[7],
     }
+
+
+def cancel_queued_job(job_id: str) -> bool:
+    # Only a job no worker has picked up yet can be cancelled here; running jobs stop cooperatively.
+    now = datetime.now(timezone.utc)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE jobs
+                SET status = 'cancelled', updated_at = %s
+                WHERE id = %s AND status = 'queued'
+                RETURNING id
+                """,
+                (now, job_id),
+            )
+            row = cur.fetchone()
+    return row is not None
+
+
+def fetch_job_status(job_id: str) -> dict[str, Any] | None:
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            execute_prepared(
+                cur,
+                "fetch_job_status",
+                """
+                SELECT id, type, status, updated_at
+                FROM jobs
+                WHERE id = $1
+                """,
+                (job_id,),
+            )
+            row = cur.fetchone()
+    if not row:
+        return None
+    return {
+        "id": row[0],
+        "type": row[1],
+        "status": row[2],
+        "updated_at": row[3],
+    }
+
+
+def append_job_progress(job_id: str, payload: dict[str, Any]) -> int:
+    # Sharded jobs report from several workers at once; the per-job lock keeps MAX(seq) + 1 unique.
+    now = datetime.now(timezone.utc)
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (f"job_progress:{job_id}",))
+            execute_prepared(
+                cur,
+                "append_job_progress",
+                """
+                INSERT INTO job_progress (job_id, seq, payload, created_at)
+                SELECT $1, COALESCE(MAX(seq), 0) + 1, $2, $3
+                FROM job_progress
+                WHERE job_id = $1
+                RETURNING seq
+                """,
+                (job_id, Json(payload), now),
+            )
+            seq = cur.fetchone()[0]
+    return int(seq)
+
+
+def fetch_job_progress(job_id: str, after_seq: int = 0, limit: int = 100) -> list[dict[str, Any]]:
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            execute_prepared(
+                cur,
+                "fetch_job_progress",
+                """
+                SELECT seq, payload, created_at
+                FROM job_progress
+                WHERE job_id = $1 AND seq > $2
+                ORDER BY seq
+                LIMIT $3
+                """,
+                (job_id, after_seq, limit),
+            )
+            rows = cur.fetchall()
+    return [{"seq": row[0], "payload": row[1], "created_at": row[2]} for row in rows]
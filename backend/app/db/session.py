@@ -1,21 +1,172 @@
+import os
+import threading
 from contextlib import contextmanager
+from typing import Any, Sequence
 
 import psycopg2
+from psycopg2 import extensions
+from psycopg2.pool import ThreadedConnectionPool
 
 from app.core.config import get_settings
 
 
+class PooledConnection(extensions.connection):
+    """A connection that remembers which statements it has prepared on the server."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.prepared: set[str] = set()
+
+
+class _ProcessPool:
+    # ThreadedConnectionPool raises as soon as it is exhausted; the semaphore makes callers wait for a free slot.
+    def __init__(self, dsn: str, minconn: int, maxconn: int, timeout_s: float) -> None:
+        self.pid = os.getpid()
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout_s = timeout_s
+        self.pool = ThreadedConnectionPool(minconn, maxconn, dsn, connection_factory=PooledConnection)
+        self.slots = threading.BoundedSemaphore(maxconn)
+        self.lock = threading.Lock()
+        self.in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.discarded = 0
+
+    def acquire(self) -> PooledConnection:
+        if not self.slots.acquire(blocking=False):
+            with self.lock:
+                self.waits += 1
+            if not self.slots.acquire(timeout=self.timeout_s):
+                with self.lock:
+                    self.timeouts += 1
+                raise RuntimeError(f"no database connection available after {self.timeout_s:g}s")
+        try:
+            conn = self.pool.getconn()
+        except Exception:
+            self.slots.release()
+            raise
+        with self.lock:
+            self.in_use += 1
+            self.checkouts += 1
+        return conn
+
+    def release(self, conn: PooledConnection, discard: bool = False) -> None:
+        try:
+            self.pool.putconn(conn, close=discard or bool(conn.closed))
+        finally:
+            with self.lock:
+                self.in_use -= 1
+                if discard:
+                    self.discarded += 1
+            self.slots.release()
+
+    def stats(self) -> dict[str, Any]:
+        with self.lock:
+            return {
+                "pid": self.pid,
+                "minconn": self.minconn,
+                "maxconn": self.maxconn,
+                "open": len(self.pool._used) + len(self.pool._pool),
+                "in_use": self.in_use,
+                "idle": len(self.pool._pool),
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "discarded": self.discarded,
+            }
+
+
+_pool: _ProcessPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _forget_pool() -> None:
+    # A forked child shares the parent's sockets; closing them here would end the parent's sessions, so the
+    # inherited pool is dropped without touching its connections.
+    global _pool, _pool_lock
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_pool)
+
+
+def _get_pool() -> _ProcessPool:
+    global _pool
+    pool = _pool
+    if pool is not None and pool.pid == os.getpid():
+        return pool
+    with _pool_lock:
+        if _pool is None or _pool.pid != os.getpid():
+            settings = get_settings()
+            if not settings.postgres_dsn:
+                raise RuntimeError("POSTGRES_DSN is not set")
+            _pool = _ProcessPool(
+                settings.postgres_dsn,
+                settings.postgres_pool_min,
+                settings.postgres_pool_max,
+                settings.postgres_pool_timeout_s,
+            )
+        return _pool
+
+
+def pool_stats() -> dict[str, Any] | None:
+    pool = _pool
+    if pool is None or pool.pid != os.getpid():
+        return None
+    return pool.stats()
+
+
+def close_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.pool.closeall()
+        _pool = None
+
+
 @contextmanager
 def get_connection():
-    settings = get_settings()
-    if not settings.postgres_dsn:
-        raise RuntimeError("POSTGRES_DSN is not set")
-    conn = psycopg2.connect(settings.postgres_dsn)
+    pool = _get_pool()
+    conn = pool.acquire()
+    discard = False
     try:
         yield conn
         conn.commit()
     except Exception:
-        conn.rollback()
+        discard = not _reset_after_error(conn)
         raise
     finally:
-        conn.close()
+        pool.release(conn, discard=discard)
+
+
+def _reset_after_error(conn: PooledConnection) -> bool:
+    if conn.closed:
+        return False
+    try:
+        conn.rollback()
+        # A PREPARE issued in the failed transaction may or may not have survived; start from a clean slate.
+        with conn.cursor() as cur:
+            cur.execute("DEALLOCATE ALL")
+        conn.commit()
+    except psycopg2.Error:
+        return False
+    conn.prepared.clear()
+    return True
+
+
+def execute_prepared(cur, name: str, sql: str, params: Sequence[Any]) -> None:
+    """Run ``sql`` (written with $1..$n placeholders) as a server-side prepared statement.
+
+    The statement is prepared once per pooled connection and executed by name afterwards, so the hot job queries
+    skip parsing and planning on every call.
+    """
+    conn = cur.connection
+    if name not in conn.prepared:
+        cur.execute(f"PREPARE {name} AS {sql}")
+        conn.prepared.add(name)
+    placeholders = ", ".join(["%s"] * len(params))
+    cur.execute(f"EXECUTE {name} ({placeholders})" if params else f"EXECUTE {name}", tuple(params))
@@ -1,10 +1,41 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
 import sys
 from typing import Iterable, Tuple
 
-from app.engine.openmotor_ai.spec import MotorSpec
+from app.engine.openmotor_ai.spec import BATESGrain, FMMGrain, MotorSpec
+
+
+@dataclass(frozen=True)
+class SimulationLimits:
+    max_pressure_pa: float | None = None
+    max_kn: float | None = None
+    max_mass_flux_kg_m2_s: float | None = None
+
+    def to_motorlib(self) -> dict[str, float | None]:
+        return {
+            "pressure": self.max_pressure_pa,
+            "kn": self.max_kn,
+            "massFlux": self.max_mass_flux_kg_m2_s,
+        }
+
+
+_LIMIT_CONSTRAINTS = {
+    "pressure": "peak_chamber_pressure",
+    "kn": "peak_kn",
+    "massFlux": "peak_mass_flux",
+}
+
+
+class ConstraintViolation(RuntimeError):
+    def __init__(self, constraint: str, limit: float, value: float, time_s: float) -> None:
+        super().__init__(f"{constraint} {value:.6g} exceeded limit {limit:.6g} at t={time_s:.4f}s")
+        self.constraint = constraint
+        self.limit = limit
+        self.value = value
+        self.time_s = time_s
 
 
 def _ensure_motorlib() -> None:
@@ -45,18 +76,7 @@ def _motor_dict(spec: MotorSpec) -> dict:
                 for tab in spec.propellant.tabs
             ],
         },
-        "grains": [
-            {
-                "type": "BATES",
-                "properties": {
-                    "diameter": grain.diameter_m,
-                    "coreDiameter": grain.core_diameter_m,
-                    "length": grain.length_m,
-                    "inhibitedEnds": grain.inhibited_ends,
-                },
-            }
-            for grain in spec.grains
-        ],
+        "grains": [_grain_dict(grain) for grain in spec.grains],
         "config": {
             "ambPressure": spec.config.amb_pressure_pa,
             "burnoutThrustThres": spec.config.burnout_thrust_threshold_n,
@@ -70,6 +90,18 @@ def _motor_dict(spec: MotorSpec) -> dict:
     }
 
 
+def _grain_dict(grain: BATESGrain | FMMGrain) -> dict:
+    properties = {
+        "diameter": grain.diameter_m,
+        "coreDiameter": grain.core_diameter_m,
+        "length": grain.length_m,
+        "inhibitedEnds": grain.inhibited_ends,
+    }
+    if isinstance(grain, FMMGrain):
+        return {"type": grain.grain_type, "properties": {**properties, **dict(grain.properties)}}
+    return {"type": "BATES", "properties": properties}
+
+
 def _safe_last(values: Iterable[float]) -> float:
     items = list(values)
     return items[-1] if items else 0.0
@@ -130,6 +162,7 @@ def _motor_dict_from_ric_data(ric: "RicData") -> dict:
             {
                 "type": grain.get("type", "BATES"),
                 "properties": {
+                    **(grain.get("properties") or {}),
                     "diameter": _float_or((grain.get("properties") or {}).get("diameter")),
                     "coreDiameter": _float_or((grain.get("properties") or {}).get("coreDiameter")),
                     "length": _float_or((grain.get("properties") or {}).get("length")),
@@ -152,7 +185,10 @@ def _motor_dict_from_ric_data(ric: "RicData") -> dict:
     }
 
 
-def simulate_motorlib_with_result(spec: MotorSpec) -> Tuple[list["TimeStep"], "SimulationResult"]:
+def _simulate_motor_dict(
+    motor_dict: dict,
+    limits: SimulationLimits | None = None,
+) -> Tuple[list["TimeStep"], "SimulationResult"]:
     _ensure_motorlib()
     from motorlib.motor import Motor
     from motorlib.simResult import SimAlertLevel
@@ -160,8 +196,16 @@ def simulate_motorlib_with_result(spec: MotorSpec) -> Tuple[list["TimeStep"], "S
 
     from app.engine.openmotor_ai.ballistics import TimeStep
 
-    motor = Motor(_motor_dict(spec))
-    sim: SimulationResult = motor.runSimulation()
+    motor = Motor(motor_dict)
+    sim: SimulationResult = motor.runSimulation(limits=limits.to_motorlib() if limits else None)
+    violation = sim.limitViolation
+    if violation is not None:
+        raise ConstraintViolation(
+            constraint=_LIMIT_CONSTRAINTS.get(violation.channel, violation.channel),
+            limit=float(violation.limit),
+            value=float(violation.value),
+            time_s=float(violation.time),
+        )
     if sim.getAlertsByLevel(SimAlertLevel.ERROR):
         messages = [alert.description for alert in sim.getAlertsByLevel(SimAlertLevel.ERROR)]
         raise RuntimeError(f"OpenMotor simulation errors: {messages}")
@@ -188,44 +232,34 @@ def simulate_motorlib_with_result(spec: MotorSpec) -> Tuple[list["TimeStep"], "S
     return steps, sim
 
 
-def simulate_motorlib_with_result_from_ric(
-    ric_path: str,
-) -> Tuple[list["TimeStep"], "SimulationResult"]:
+def peak_burn_area_m2(spec: MotorSpec, samples: int = 32) -> float:
     _ensure_motorlib()
     from motorlib.motor import Motor
-    from motorlib.simResult import SimAlertLevel
-    from motorlib.simResult import SimulationResult
 
-    from app.engine.openmotor_ai.ballistics import TimeStep
-    from app.engine.openmotor_ai.ric_parser import load_ric
+    motor = Motor(_motor_dict(spec))
+    for grain in motor.grains:
+        grain.simulationSetup(motor.config)
+    web = max((grain.getWebLeft(0.0) for grain in motor.grains), default=0.0)
+    peak = 0.0
+    for idx in range(samples):
+        depth = web * idx / max(samples - 1, 1)
+        peak = max(peak, float(motor.calcBurningSurfaceArea([depth for _ in motor.grains])))
+    return peak
 
-    ric = load_ric(ric_path)
-    motor = Motor(_motor_dict_from_ric_data(ric))
-    sim: SimulationResult = motor.runSimulation()
-    if sim.getAlertsByLevel(SimAlertLevel.ERROR):
-        messages = [alert.description for alert in sim.getAlertsByLevel(SimAlertLevel.ERROR)]
-        raise RuntimeError(f"OpenMotor simulation errors: {messages}")
 
-    steps: list[TimeStep] = []
-    times = sim.channels["time"].getData()
-    for idx, time_s in enumerate(times):
-        pressure = sim.channels["pressure"].getPoint(idx)
-        thrust = sim.channels["force"].getPoint(idx)
-        kn = sim.channels["kn"].getPoint(idx)
-        mass_flow = _safe_last(sim.channels["massFlow"].getPoint(idx))
-        reg_depth = _safe_last(sim.channels["regression"].getPoint(idx))
-        port_area = motor.grains[-1].getPortArea(reg_depth) or 0.0
-        steps.append(
-            TimeStep(
-                time_s=time_s,
-                chamber_pressure_pa=pressure,
-                thrust_n=thrust,
-                mass_flow_kg_s=mass_flow,
-                kn=kn,
-                port_area_m2=port_area,
-            )
-        )
-    return steps, sim
+def simulate_motorlib_with_result(
+    spec: MotorSpec,
+    limits: SimulationLimits | None = None,
+) -> Tuple[list["TimeStep"], "SimulationResult"]:
+    return _simulate_motor_dict(_motor_dict(spec), limits=limits)
+
+
+def simulate_motorlib_with_result_from_ric(
+    ric_path: str,
+) -> Tuple[list["TimeStep"], "SimulationResult"]:
+    from app.engine.openmotor_ai.ric_parser import load_ric
+
+    return _simulate_motor_dict(_motor_dict_from_ric_data(load_ric(ric_path)))
 
 
 def simulate_motorlib_from_ric(ric_path: str) -> list["TimeStep"]:
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, asdict, replace
+from functools import lru_cache, partial
+import math
+import multiprocessing
 import re
 from pathlib import Path
 from typing import Callable, Iterable
@@ -8,6 +12,8 @@ from typing import Callable, Iterable
 from app.engine.openmotor_ai.eng_builder import build_eng
 from app.engine.openmotor_ai.eng_export import export_eng
 from app.engine.openmotor_ai.motorlib_adapter import (
+    ConstraintViolation,
+    SimulationLimits,
     metrics_from_simresult,
     simulate_motorlib_with_result,
 )
@@ -17,14 +23,23 @@ from app.engine.openmotor_ai.ric_parser import RicData, load_ric
 from app.engine.openmotor_ai.ric_writer import build_ric
 from app.engine.openmotor_ai.spec import (
     BATESGrain,
+    FMM_LENGTH_PROPERTIES,
+    FMMGrain,
     MotorConfig,
     MotorSpec,
     NozzleSpec,
     PropellantSpec,
+    propellant_key,
     spec_from_ric,
+    spec_uses_fmm,
 )
-from app.engine.openmotor_ai.scoring import Candidate, ScoreWeights, score_candidates
-from app.engine.openmotor_ai.smart_nozzle_architect import SmartNozzleArchitect
+from app.engine.openmotor_ai.scoring import Candidate, ScoreWeights, pareto_report, score_candidates
+from app.engine.openmotor_ai.search_deadline import SearchDeadline
+from app.engine.openmotor_ai.search_session import TargetSearchSession
+from app.engine.openmotor_ai.smart_nozzle_architect import SmartNozzleArchitect, SmartNozzleResult
+from app.engine.openmotor_ai.stage_planner import JobStagePlanner, file_digest
+from app.engine.openmotor_ai.successive_halving import HalvingPolicy, successive_halving
+from app.engine.openmotor_ai.surrogate_search import SurrogateObservation, surrogate_minimize
 from app.engine.openmotor_ai.trajectory import (
     simulate_single_stage_apogee_params,
     simulate_two_stage_apogee,
@@ -41,6 +56,16 @@ class StageSearchConfig:
     throat_scales: list[float]
     exit_scales: list[float]
     grain_count: int | None = None
+    # "grid" enumerates every scale combination; "bayesian" proposes batches from a surrogate model;
+    # "bisect" searches the length axis of each remaining scale combination for the target impulse.
+    strategy: str = "grid"
+    max_simulations: int | None = None
+    batch_size: int = 4
+    workers: int = 1
+    # FMM grains are screened on this map size (motorlib's minimum) and the closest results re-simulated at the
+    # motor's own mapDim; None searches at full resolution throughout.
+    coarse_map_dim: int | None = 250
+    fine_shortlist: int = 3
 
 
 @dataclass(frozen=True)
@@ -90,6 +115,9 @@ _FAST_TARGET_ONLY_PROPELLANTS = [
 
 _VEHICLE_DIM_TOLERANCE_PCT = 0.06
 _RELAXED_STAGE_LENGTH_RATIO = 2.5
+_SURROGATE_DEFAULT_BUDGET = 64
+_DEFAULT_PRESETS_PATH = Path(__file__).resolve().parents[3] / "resources" / "propellants" / "presets.json"
+_OPENMOTOR_ROOT = Path(__file__).resolve().parents[3] / "third_party" / "openmotor_src"
 _PREFERRED_PROPELLANT_ORDER = [
     "RCS - Blue Thunder",
     "White Lightning",
@@ -132,14 +160,14 @@ def _apply_scales(
     for grain in grains:
         diameter = grain.diameter_m * diameter_scale
         core = min(diameter * 0.98, grain.core_diameter_m * diameter_scale * core_scale)
-        scaled_grains.append(
-            grain.__class__(
-                diameter_m=diameter,
-                core_diameter_m=core,
-                length_m=grain.length_m * length_scale,
-                inhibited_ends=grain.inhibited_ends,
+        scaled = replace(grain, diameter_m=diameter, core_diameter_m=core, length_m=grain.length_m * length_scale)
+        if isinstance(grain, FMMGrain):
+            properties = tuple(
+                (key, value * diameter_scale if key in FMM_LENGTH_PROPERTIES and isinstance(value, float) else value)
+                for key, value in grain.properties
             )
-        )
+            scaled = replace(scaled, properties=properties)
+        scaled_grains.append(scaled)
     throat = base.nozzle.throat_diameter_m * throat_scale
     exit_diameter = max(throat, base.nozzle.exit_diameter_m * exit_scale * throat_scale)
     nozzle = base.nozzle.__class__(
@@ -182,6 +210,24 @@ def _satisfies_constraints(metrics: dict[str, float], constraints: TwoStageConst
     return peak_pressure_psi <= max_pressure and metrics["peak_kn"] <= constraints.max_kn
 
 
+def _constraint_limits(constraints: TwoStageConstraints) -> SimulationLimits:
+    # Same bounds as _satisfies_constraints, so aborting early never rejects a motor it would accept.
+    return SimulationLimits(
+        max_pressure_pa=constraints.max_pressure_psi * 1.01 * 6894.757,
+        max_kn=constraints.max_kn,
+    )
+
+
+def _constraint_reject(exc: ConstraintViolation) -> dict[str, object]:
+    return {
+        "reason": "constraint_violation",
+        "constraint": exc.constraint,
+        "limit": exc.limit,
+        "value": exc.value,
+        "time_s": exc.time_s,
+    }
+
+
 def _search_stage(
     base: MotorSpec,
     target_impulse_ns: float,
@@ -191,62 +237,615 @@ def _search_stage(
     exclude_scales: StageScales | None = None,
     reject_log: list[dict[str, str]] | None = None,
     reject_context: dict[str, str] | None = None,
+    stats: dict[str, object] | None = None,
+    cache: dict[tuple[object, ...], StageResult | None] | None = None,
+    deadline: SearchDeadline | None = None,
+    found: list[StageResult] | None = None,
 ) -> StageResult | None:
+    if (
+        search.coarse_map_dim is not None
+        and spec_uses_fmm(base)
+        and base.config.map_dim > search.coarse_map_dim
+    ):
+        return _search_stage_coarse_to_fine(
+            base,
+            target_impulse_ns,
+            search,
+            constraints,
+            fixed_diameter_scale=fixed_diameter_scale,
+            exclude_scales=exclude_scales,
+            reject_log=reject_log,
+            reject_context=reject_context,
+            stats=stats,
+            cache=cache,
+            deadline=deadline,
+            found=found,
+        )
+    if search.strategy == "bayesian":
+        return _search_stage_surrogate(
+            base,
+            target_impulse_ns,
+            search,
+            constraints,
+            fixed_diameter_scale=fixed_diameter_scale,
+            exclude_scales=exclude_scales,
+            reject_log=reject_log,
+            reject_context=reject_context,
+            stats=stats,
+            deadline=deadline,
+            found=found,
+        )
+    if search.strategy == "bisect":
+        return _search_stage_bisect(
+            base,
+            target_impulse_ns,
+            search,
+            constraints,
+            fixed_diameter_scale=fixed_diameter_scale,
+            exclude_scales=exclude_scales,
+            reject_log=reject_log,
+            reject_context=reject_context,
+            stats=stats,
+            cache=cache,
+            deadline=deadline,
+            found=found,
+        )
+    if search.strategy != "grid":
+        raise ValueError(f"Unknown search strategy: {search.strategy}")
     best: StageResult | None = None
+    limits = _constraint_limits(constraints)
+    base_key = _base_spec_cache_key(base)
+    lattice = _stage_lattice(search, fixed_diameter_scale, exclude_scales)
+    _record_search_stats(stats, search.strategy, grid_points=len(lattice))
+    for scales in lattice:
+        if deadline is not None and deadline.should_stop():
+            break
+        stage = _evaluate_stage_scales(
+            base,
+            scales,
+            search,
+            constraints,
+            limits=limits,
+            base_key=base_key,
+            cache=cache,
+            reject_log=reject_log,
+            reject_context=reject_context,
+            stats=stats,
+        )
+        if stage is None:
+            continue
+        if found is not None:
+            found.append(stage)
+        score = abs(stage.metrics["total_impulse"] - target_impulse_ns)
+        if best is None or score < abs(best.metrics["total_impulse"] - target_impulse_ns):
+            best = stage
+    return best
+
+
+def _search_stage_coarse_to_fine(
+    base: MotorSpec,
+    target_impulse_ns: float,
+    search: StageSearchConfig,
+    constraints: TwoStageConstraints,
+    fixed_diameter_scale: float | None = None,
+    exclude_scales: StageScales | None = None,
+    reject_log: list[dict[str, str]] | None = None,
+    reject_context: dict[str, str] | None = None,
+    stats: dict[str, object] | None = None,
+    cache: dict[tuple[object, ...], StageResult | None] | None = None,
+    deadline: SearchDeadline | None = None,
+    found: list[StageResult] | None = None,
+) -> StageResult | None:
+    """Run the stage search on a coarse FMM map, then re-simulate the closest results at the motor's mapDim.
+
+    The ``fine_shortlist`` best coarse results calibrate how far the coarse impulse and peak pressure drift from
+    the full-resolution ones. Any other coarse result that could still beat the best confirmed motor within that
+    drift is confirmed as well, and only confirmed motors are returned.
+    """
+    stats = stats if stats is not None else {}
+    coarse_base = replace(base, config=replace(base.config, map_dim=search.coarse_map_dim))
+    screened: list[StageResult] = []
+    simulations_before = int(stats.get("simulations", 0))
+    _search_stage(
+        coarse_base,
+        target_impulse_ns,
+        replace(search, coarse_map_dim=None),
+        constraints,
+        fixed_diameter_scale=fixed_diameter_scale,
+        exclude_scales=exclude_scales,
+        reject_log=reject_log,
+        reject_context=reject_context,
+        stats=stats,
+        cache=cache,
+        deadline=deadline,
+        found=screened,
+    )
+    coarse_simulations = int(stats.get("simulations", 0)) - simulations_before
+
+    def _score(stage: StageResult) -> float:
+        return abs(stage.metrics["total_impulse"] - target_impulse_ns)
+
+    ranked: dict[StageScales, StageResult] = {}
+    for stage in sorted(screened, key=_score):
+        ranked.setdefault(stage.scales, stage)
+    limits = _constraint_limits(constraints)
+    base_key = _base_spec_cache_key(base)
+    confirmed: list[tuple[StageResult, StageResult]] = []
+
+    def _confirm(coarse: StageResult) -> None:
+        fine = _evaluate_stage_scales(
+            base,
+            coarse.scales,
+            search,
+            constraints,
+            limits=limits,
+            base_key=base_key,
+            cache=cache,
+            reject_log=reject_log,
+            reject_context=reject_context,
+            stats=stats,
+        )
+        if fine is not None:
+            confirmed.append((coarse, fine))
+
+    candidates = list(ranked.values())
+    for coarse in candidates[: search.fine_shortlist]:
+        if deadline is not None and deadline.should_stop():
+            break
+        _confirm(coarse)
+    impulse_error = max(
+        (
+            abs(fine.metrics["total_impulse"] - coarse.metrics["total_impulse"])
+            / max(fine.metrics["total_impulse"], 1e-9)
+            for coarse, fine in confirmed
+        ),
+        default=0.0,
+    )
+    pressure_error = max(
+        (
+            abs(fine.metrics["peak_chamber_pressure"] - coarse.metrics["peak_chamber_pressure"])
+            / max(fine.metrics["peak_chamber_pressure"], 1e-9)
+            for coarse, fine in confirmed
+        ),
+        default=0.0,
+    )
+    for coarse in candidates[search.fine_shortlist :]:
+        if not confirmed or (deadline is not None and deadline.should_stop()):
+            break
+        best_score = min(_score(fine) for _, fine in confirmed)
+        if _score(coarse) - impulse_error * coarse.metrics["total_impulse"] < best_score:
+            _confirm(coarse)
+
+    fine_results = [fine for _, fine in confirmed]
+    if found is not None:
+        found.extend(fine_results)
+    stats["resolution"] = {
+        "coarse_map_dim": search.coarse_map_dim,
+        "map_dim": base.config.map_dim,
+        "coarse_simulations": coarse_simulations,
+        "fine_simulations": int(stats.get("simulations", 0)) - simulations_before - coarse_simulations,
+        "impulse_error_pct": impulse_error * 100.0,
+        "peak_pressure_error_pct": pressure_error * 100.0,
+    }
+    return min(fine_results, key=_score, default=None)
+
+
+def _stage_cache_key(
+    base_key: tuple[object, ...], scales: StageScales, grain_count: int | None
+) -> tuple[object, ...]:
+    return (
+        base_key,
+        _float_key(scales.diameter_scale),
+        _float_key(scales.length_scale),
+        _float_key(scales.core_scale),
+        _float_key(scales.throat_scale),
+        _float_key(scales.exit_scale),
+        grain_count,
+    )
+
+
+def _evaluate_stage_scales(
+    base: MotorSpec,
+    scales: StageScales,
+    search: StageSearchConfig,
+    constraints: TwoStageConstraints,
+    *,
+    limits: SimulationLimits,
+    base_key: tuple[object, ...],
+    cache: dict[tuple[object, ...], StageResult | None] | None = None,
+    reject_log: list[dict[str, str]] | None = None,
+    reject_context: dict[str, str] | None = None,
+    stats: dict[str, object] | None = None,
+) -> StageResult | None:
+    # None means failed, empty or infeasible; cached so neither a grid nor a line search re-simulates it.
+    cache_key = _stage_cache_key(base_key, scales, search.grain_count)
+    if cache is not None and cache_key in cache:
+        return cache[cache_key]
+    spec = _apply_scales(
+        base=base,
+        diameter_scale=scales.diameter_scale,
+        length_scale=scales.length_scale,
+        core_scale=scales.core_scale,
+        throat_scale=scales.throat_scale,
+        exit_scale=scales.exit_scale,
+        grain_count=search.grain_count,
+    )
+    spec = _normalize_spec_for_motorlib(spec)
+    _record_search_stats(stats, search.strategy, simulations=1)
+    stage: StageResult | None = None
+    try:
+        spec, steps, metrics, engine = _simulate_with_fallback(spec, limits=limits)
+    except ConstraintViolation as exc:
+        if reject_log is not None:
+            reject_log.append({**(reject_context or {}), **_constraint_reject(exc)})
+    except Exception as exc:
+        if reject_log is not None:
+            reject_log.append(
+                {
+                    **(reject_context or {}),
+                    "reason": "simulation_failed",
+                    "detail": str(exc),
+                }
+            )
+    else:
+        if steps and _satisfies_constraints(metrics, constraints):
+            stage = StageResult(
+                spec=spec,
+                metrics=metrics | {"simulation_engine": engine},
+                log=_metrics_with_units(metrics),
+                scales=scales,
+            )
+    if cache is not None:
+        cache[cache_key] = stage
+    return stage
+
+
+def _line_is_monotonic(points: dict[int, StageResult | None]) -> bool:
+    # Along the length axis impulse must not drop, and once a motor turns infeasible a longer one
+    # (more burn area, higher Kn) must not become feasible again.
+    last_impulse = float("-inf")
+    infeasible = False
+    for idx in sorted(points):
+        stage = points[idx]
+        if stage is None:
+            infeasible = True
+            continue
+        impulse = stage.metrics["total_impulse"]
+        if infeasible or impulse < last_impulse:
+            return False
+        last_impulse = impulse
+    return True
+
+
+def _search_stage_bisect(
+    base: MotorSpec,
+    target_impulse_ns: float,
+    search: StageSearchConfig,
+    constraints: TwoStageConstraints,
+    fixed_diameter_scale: float | None = None,
+    exclude_scales: StageScales | None = None,
+    reject_log: list[dict[str, str]] | None = None,
+    reject_context: dict[str, str] | None = None,
+    stats: dict[str, object] | None = None,
+    cache: dict[tuple[object, ...], StageResult | None] | None = None,
+    deadline: SearchDeadline | None = None,
+    found: list[StageResult] | None = None,
+) -> StageResult | None:
+    """Bisect the length axis of every (diameter, core, throat, exit) line for the target impulse.
+
+    Impulse grows with grain length, so the closest feasible motor on a line sits next to the first length whose
+    impulse reaches the target (or that turns infeasible). A line whose probes break that ordering, or that holds
+    the excluded scales, is enumerated instead.
+    """
+    limits = _constraint_limits(constraints)
+    base_key = _base_spec_cache_key(base)
+    cache = cache if cache is not None else {}
+    lengths = sorted(set(search.length_scales))
     diameter_scales = (
         [fixed_diameter_scale] if fixed_diameter_scale is not None else search.diameter_scales
     )
+    best: StageResult | None = None
+    lines = 0
+    fallbacks = 0
+
     for diameter_scale in diameter_scales:
-        for length_scale in search.length_scales:
-            for core_scale in search.core_scales:
-                for throat_scale in search.throat_scales:
-                    for exit_scale in search.exit_scales:
-                        candidate_scales = StageScales(
-                            diameter_scale=diameter_scale,
-                            length_scale=length_scale,
-                            core_scale=core_scale,
-                            throat_scale=throat_scale,
-                            exit_scale=exit_scale,
-                        )
-                        if exclude_scales is not None and candidate_scales == exclude_scales:
-                            continue
-                        spec = _apply_scales(
-                            base=base,
+        for core_scale in search.core_scales:
+            for throat_scale in search.throat_scales:
+                for exit_scale in search.exit_scales:
+                    if deadline is not None and deadline.should_stop():
+                        break
+                    line = [
+                        StageScales(
                             diameter_scale=diameter_scale,
                             length_scale=length_scale,
                             core_scale=core_scale,
                             throat_scale=throat_scale,
                             exit_scale=exit_scale,
-                            grain_count=search.grain_count,
                         )
-                        spec = _normalize_spec_for_motorlib(spec)
-                        try:
-                            spec, steps, metrics, engine = _simulate_with_fallback(spec)
-                        except Exception as exc:
-                            if reject_log is not None:
-                                reject_log.append(
-                                    {
-                                        **(reject_context or {}),
-                                        "reason": "simulation_failed",
-                                        "detail": str(exc),
-                                    }
-                                )
-                            continue
-                        if not steps:
-                            continue
-                        if not _satisfies_constraints(metrics, constraints):
+                        for length_scale in lengths
+                    ]
+                    points: dict[int, StageResult | None] = {}
+
+                    def _probe(idx: int) -> StageResult | None:
+                        if idx not in points:
+                            points[idx] = _evaluate_stage_scales(
+                                base,
+                                line[idx],
+                                search,
+                                constraints,
+                                limits=limits,
+                                base_key=base_key,
+                                cache=cache,
+                                reject_log=reject_log,
+                                reject_context=reject_context,
+                                stats=stats,
+                            )
+                        return points[idx]
+
+                    lines += 1
+                    if exclude_scales in line:
+                        for idx in range(len(line)):
+                            _probe(idx)
+                    else:
+                        low, high = 0, len(line) - 1
+                        while low < high:
+                            mid = (low + high) // 2
+                            stage = _probe(mid)
+                            if stage is None or stage.metrics["total_impulse"] >= target_impulse_ns:
+                                high = mid
+                            else:
+                                low = mid + 1
+                        _probe(low)
+                        if low > 0:
+                            _probe(low - 1)
+                        if not _line_is_monotonic(points):
+                            fallbacks += 1
+                            for idx in range(len(line)):
+                                _probe(idx)
+                    for idx, stage in points.items():
+                        if stage is None or line[idx] == exclude_scales:
                             continue
-                        score = abs(metrics["total_impulse"] - target_impulse_ns)
+                        if found is not None:
+                            found.append(stage)
+                        score = abs(stage.metrics["total_impulse"] - target_impulse_ns)
                         if best is None or score < abs(best.metrics["total_impulse"] - target_impulse_ns):
-                            best = StageResult(
-                                spec=spec,
-                                metrics=metrics | {"simulation_engine": engine},
-                                log=_metrics_with_units(metrics),
-                                scales=candidate_scales,
-                            )
+                            best = stage
+
+    _record_search_stats(
+        stats,
+        search.strategy,
+        grid_points=lines * len(lengths),
+        lines=lines,
+        monotonic_fallbacks=fallbacks,
+    )
     return best
 
 
+def _record_search_stats(stats: dict[str, object] | None, strategy: str, **counts: int) -> None:
+    if stats is None:
+        return
+    stats["strategy"] = strategy
+    for key, value in counts.items():
+        stats[key] = int(stats.get(key, 0)) + value
+
+
+def _stage_lattice(
+    search: StageSearchConfig,
+    fixed_diameter_scale: float | None,
+    exclude_scales: StageScales | None,
+) -> list[StageScales]:
+    diameter_scales = (
+        [fixed_diameter_scale] if fixed_diameter_scale is not None else search.diameter_scales
+    )
+    lattice = [
+        StageScales(
+            diameter_scale=diameter_scale,
+            length_scale=length_scale,
+            core_scale=core_scale,
+            throat_scale=throat_scale,
+            exit_scale=exit_scale,
+        )
+        for diameter_scale in diameter_scales
+        for length_scale in search.length_scales
+        for core_scale in search.core_scales
+        for throat_scale in search.throat_scales
+        for exit_scale in search.exit_scales
+    ]
+    return [scales for scales in lattice if scales != exclude_scales]
+
+
+def _thin_scales(values: list[float], share: float) -> list[float]:
+    count = max(1, round(len(values) * share))
+    if count >= len(values):
+        return list(values)
+    if count == 1:
+        return [values[len(values) // 2]]
+    step = (len(values) - 1) / (count - 1)
+    return [values[round(idx * step)] for idx in range(count)]
+
+
+def _search_at_fidelity(search: StageSearchConfig, fidelity: float) -> StageSearchConfig:
+    # A partial budget keeps a subset of each axis, so its points share cache keys with the full search.
+    if fidelity >= 1.0:
+        return search
+    if search.strategy == "bayesian":
+        budget = search.max_simulations or _SURROGATE_DEFAULT_BUDGET
+        return replace(search, max_simulations=max(1, math.ceil(budget * fidelity)))
+    axes = [
+        search.diameter_scales,
+        search.length_scales,
+        search.core_scales,
+        search.throat_scales,
+        search.exit_scales,
+    ]
+    share = fidelity ** (1.0 / max(1, sum(1 for values in axes if len(values) > 1)))
+    return replace(
+        search,
+        diameter_scales=_thin_scales(search.diameter_scales, share),
+        length_scales=_thin_scales(search.length_scales, share),
+        core_scales=_thin_scales(search.core_scales, share),
+        throat_scales=_thin_scales(search.throat_scales, share),
+        exit_scales=_thin_scales(search.exit_scales, share),
+    )
+
+
+def _architect_screen_loss(results: list[SmartNozzleResult], target_impulse_ns: float | None) -> float | None:
+    if not results:
+        return None
+    best = results[0]
+    error = abs(best.metrics.get("total_impulse", 0.0) - (target_impulse_ns or 0.0)) / max(
+        target_impulse_ns or 0.0, 1e-9
+    )
+    # Closest-fail results always rank behind any propellant that produced a winner.
+    return error if best.status == "success" else 1.0 + error
+
+
+def _simulate_outcome(
+    spec: MotorSpec, limits: SimulationLimits
+) -> tuple[str, object]:
+    # Picklable wrapper for pool workers: ConstraintViolation does not survive a round trip as an exception.
+    try:
+        return "ok", _simulate_with_fallback(spec, limits=limits)
+    except ConstraintViolation as exc:
+        return "violation", _constraint_reject(exc)
+    except Exception as exc:
+        return "error", str(exc)
+
+
+def _simulate_batch(
+    specs: list[MotorSpec], limits: SimulationLimits, workers: int
+) -> list[tuple[str, object]]:
+    # Daemonic processes (e.g. Celery prefork children) cannot start a pool of their own.
+    if workers <= 1 or len(specs) <= 1 or multiprocessing.current_process().daemon:
+        return [_simulate_outcome(spec, limits) for spec in specs]
+    with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+        return list(pool.map(_simulate_outcome, specs, [limits] * len(specs)))
+
+
+def _call_outcome(call: Callable[[], object]) -> tuple[str, object]:
+    try:
+        return "ok", call()
+    except Exception as exc:
+        return "error", str(exc)
+
+
+def _run_bounded(calls: list[Callable[[], object]], workers: int) -> list[tuple[str, object]]:
+    # At most two tasks per worker are in flight, so a long task list never pickles every spec up front.
+    if workers <= 1 or len(calls) <= 1 or multiprocessing.current_process().daemon:
+        return [_call_outcome(call) for call in calls]
+    outcomes: list[tuple[str, object]] = [("error", "not run")] * len(calls)
+    pending: dict[Future, int] = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(calls))) as pool:
+        for idx, call in enumerate(calls):
+            if len(pending) >= 2 * workers:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    outcomes[pending.pop(future)] = future.result()
+            pending[pool.submit(_call_outcome, call)] = idx
+        for future, idx in pending.items():
+            outcomes[idx] = future.result()
+    return outcomes
+
+
+def _search_stage_surrogate(
+    base: MotorSpec,
+    target_impulse_ns: float,
+    search: StageSearchConfig,
+    constraints: TwoStageConstraints,
+    fixed_diameter_scale: float | None = None,
+    exclude_scales: StageScales | None = None,
+    reject_log: list[dict[str, str]] | None = None,
+    reject_context: dict[str, str] | None = None,
+    stats: dict[str, object] | None = None,
+    deadline: SearchDeadline | None = None,
+    found: list[StageResult] | None = None,
+) -> StageResult | None:
+    if deadline is not None and deadline.should_stop():
+        return None
+    lattice = _stage_lattice(search, fixed_diameter_scale, exclude_scales)
+    limits = _constraint_limits(constraints)
+    max_pressure_pa = constraints.max_pressure_psi * 1.01 * 6894.757
+    results: dict[int, StageResult] = {}
+
+    def _evaluate(indices: list[int]) -> list[SurrogateObservation]:
+        specs = [
+            _normalize_spec_for_motorlib(
+                _apply_scales(
+                    base=base,
+                    diameter_scale=lattice[idx].diameter_scale,
+                    length_scale=lattice[idx].length_scale,
+                    core_scale=lattice[idx].core_scale,
+                    throat_scale=lattice[idx].throat_scale,
+                    exit_scale=lattice[idx].exit_scale,
+                    grain_count=search.grain_count,
+                )
+            )
+            for idx in indices
+        ]
+        observations = []
+        for idx, (status, payload) in zip(indices, _simulate_batch(specs, limits, search.workers)):
+            if status == "violation":
+                if reject_log is not None:
+                    reject_log.append({**(reject_context or {}), **payload})
+                observations.append(
+                    SurrogateObservation(objective=None, constraint=payload["value"] / payload["limit"] - 1.0)
+                )
+                continue
+            if status == "error":
+                if reject_log is not None:
+                    reject_log.append(
+                        {**(reject_context or {}), "reason": "simulation_failed", "detail": payload}
+                    )
+                observations.append(SurrogateObservation(objective=None, constraint=None))
+                continue
+            spec, steps, metrics, engine = payload
+            if not steps:
+                observations.append(SurrogateObservation(objective=None, constraint=None))
+                continue
+            margin = max(
+                metrics["peak_chamber_pressure"] / max_pressure_pa,
+                metrics["peak_kn"] / constraints.max_kn,
+            ) - 1.0
+            if _satisfies_constraints(metrics, constraints):
+                results[idx] = StageResult(
+                    spec=spec,
+                    metrics=metrics | {"simulation_engine": engine},
+                    log=_metrics_with_units(metrics),
+                    scales=lattice[idx],
+                )
+            observations.append(
+                SurrogateObservation(
+                    objective=abs(metrics["total_impulse"] - target_impulse_ns) / max(target_impulse_ns, 1e-9),
+                    constraint=margin,
+                )
+            )
+        return observations
+
+    budget = search.max_simulations or min(len(lattice), _SURROGATE_DEFAULT_BUDGET)
+    outcome = surrogate_minimize(
+        [
+            (s.diameter_scale, s.length_scale, s.core_scale, s.throat_scale, s.exit_scale)
+            for s in lattice
+        ],
+        _evaluate,
+        budget=budget,
+        batch_size=search.batch_size,
+        should_stop=deadline.should_stop if deadline is not None else None,
+    )
+    _record_search_stats(
+        stats,
+        search.strategy,
+        simulations=outcome.simulations,
+        grid_points=outcome.candidate_count,
+        batches=outcome.batches,
+    )
+    if found is not None:
+        found.extend(results.values())
+    if not results:
+        return None
+    return min(results.values(), key=lambda stage: abs(stage.metrics["total_impulse"] - target_impulse_ns))
+
+
 def _float_key(value: float, places: int = 6) -> float:
     return round(float(value), places)
 
@@ -258,6 +857,7 @@ def _base_spec_cache_key(base: MotorSpec) -> tuple[object, ...]:
             _float_key(grain.core_diameter_m),
             _float_key(grain.length_m),
             grain.inhibited_ends,
+            (grain.grain_type, grain.properties) if isinstance(grain, FMMGrain) else "BATES",
         )
         for grain in base.grains
     )
@@ -269,93 +869,7 @@ def _base_spec_cache_key(base: MotorSpec) -> tuple[object, ...]:
         _float_key(nozzle.conv_angle_deg),
         _float_key(nozzle.div_angle_deg),
     )
-    return (base.propellant.name, grains_key, nozzle_key)
-
-
-def _build_stage_grid(
-    base: MotorSpec,
-    search: StageSearchConfig,
-    constraints: TwoStageConstraints,
-    reject_log: list[dict[str, str]] | None = None,
-    reject_context: dict[str, str] | None = None,
-    cache: dict[tuple[object, ...], StageResult | None] | None = None,
-) -> list[StageResult]:
-    results: list[StageResult] = []
-    cache = cache if cache is not None else {}
-    base_key = _base_spec_cache_key(base)
-    for diameter_scale in search.diameter_scales:
-        for length_scale in search.length_scales:
-            for core_scale in search.core_scales:
-                for throat_scale in search.throat_scales:
-                    for exit_scale in search.exit_scales:
-                        cache_key = (
-                            base_key,
-                            _float_key(diameter_scale),
-                            _float_key(length_scale),
-                            _float_key(core_scale),
-                            _float_key(throat_scale),
-                            _float_key(exit_scale),
-                            search.grain_count,
-                        )
-                        cached = cache.get(cache_key)
-                        if cached is not None or cache_key in cache:
-                            if cached is not None:
-                                results.append(cached)
-                            continue
-                        spec = _apply_scales(
-                            base=base,
-                            diameter_scale=diameter_scale,
-                            length_scale=length_scale,
-                            core_scale=core_scale,
-                            throat_scale=throat_scale,
-                            exit_scale=exit_scale,
-                            grain_count=search.grain_count,
-                        )
-                        spec = _normalize_spec_for_motorlib(spec)
-                        try:
-                            spec, steps, metrics, engine = _simulate_with_fallback(spec)
-                        except Exception as exc:
-                            cache[cache_key] = None
-                            if reject_log is not None:
-                                reject_log.append(
-                                    {
-                                        **(reject_context or {}),
-                                        "reason": "simulation_failed",
-                                        "detail": str(exc),
-                                    }
-                                )
-                            continue
-                        if not steps:
-                            cache[cache_key] = None
-                            continue
-                        if not _satisfies_constraints(metrics, constraints):
-                            cache[cache_key] = None
-                            continue
-                        stage = StageResult(
-                            spec=spec,
-                            metrics=metrics | {"simulation_engine": engine},
-                            log=_metrics_with_units(metrics),
-                            scales=StageScales(
-                                diameter_scale=diameter_scale,
-                                length_scale=length_scale,
-                                core_scale=core_scale,
-                                throat_scale=throat_scale,
-                                exit_scale=exit_scale,
-                            ),
-                        )
-                        cache[cache_key] = stage
-                        results.append(stage)
-    return results
-
-
-def _group_grid_by_diameter(grid: list[StageResult]) -> dict[float, list[StageResult]]:
-    grouped: dict[float, list[StageResult]] = {}
-    for stage in grid:
-        if not stage.scales:
-            continue
-        key = _float_key(stage.scales.diameter_scale)
-        grouped.setdefault(key, []).append(stage)
-    return grouped
+    return (propellant_key(base.propellant), grains_key, nozzle_key, base.config.map_dim)
 
 
 def _same_stage_scales(stage_a: StageResult, stage_b: StageResult) -> bool:
@@ -557,80 +1071,6 @@ def _find_log_by_name_closest(
     return best_log
 
 
-def _select_best_stage_for_target(
-    grid: list[StageResult],
-    target_impulse_ns: float,
-    exclude: StageResult | None = None,
-) -> StageResult | None:
-    if not grid:
-        return None
-    best = None
-    best_score = None
-    for stage in grid:
-        if exclude is not None and (
-            stage is exclude
-            or _same_stage_scales(stage, exclude)
-            or _stages_too_similar(stage, exclude)
-        ):
-            continue
-        score = abs(stage.metrics["total_impulse"] - target_impulse_ns)
-        if best_score is None or score < best_score:
-            best_score = score
-            best = stage
-    return best
-
-
-def _refine_values(center: float, min_value: float, max_value: float, spread: float) -> list[float]:
-    deltas = [-spread, -spread / 2.0, 0.0, spread / 2.0, spread]
-    values = []
-    for delta in deltas:
-        value = center * (1.0 + delta)
-        value = max(min_value, min(max_value, value))
-        values.append(_float_key(value, places=4))
-    return sorted(set(values))
-
-
-def _refine_search_config(
-    search: StageSearchConfig,
-    scales: StageScales,
-    *,
-    fixed_diameter: float | None = None,
-    spread: float = 0.06,
-) -> StageSearchConfig:
-    diameter_min = min(search.diameter_scales)
-    diameter_max = max(search.diameter_scales)
-    length_min = min(search.length_scales)
-    length_max = max(search.length_scales)
-    core_min = min(search.core_scales)
-    core_max = max(search.core_scales)
-    throat_min = min(search.throat_scales)
-    throat_max = max(search.throat_scales)
-    exit_min = min(search.exit_scales)
-    exit_max = max(search.exit_scales)
-    if fixed_diameter is None:
-        diameter_scales = _refine_values(scales.diameter_scale, diameter_min, diameter_max, spread)
-    else:
-        diameter_scales = [_float_key(fixed_diameter)]
-    return StageSearchConfig(
-        diameter_scales=diameter_scales,
-        length_scales=_refine_values(scales.length_scale, length_min, length_max, spread),
-        core_scales=_refine_values(scales.core_scale, core_min, core_max, spread),
-        throat_scales=_refine_values(scales.throat_scale, throat_min, throat_max, spread),
-        exit_scales=_refine_values(scales.exit_scale, exit_min, exit_max, spread),
-        grain_count=search.grain_count,
-    )
-
-
-def _refine_split_ratios(split: float) -> list[float]:
-    steps = [-0.1, -0.05, 0.0, 0.05, 0.1]
-    refined = []
-    for step in steps:
-        value = split + step
-        value = max(0.2, min(0.8, value))
-        refined.append(_float_key(value, places=3))
-    return sorted(set(refined))
-
-
 def generate_two_stage_designs(
     base_ric_path: str,
     output_dir: str,
@@ -658,6 +1098,8 @@ def generate_two_stage_designs(
     best_pair: tuple[StageResult, StageResult] | None = None
     best_score = None
     best_propellant: PropellantSpec | None = None
+    search_stats: dict[str, object] = {"strategy": search.strategy}
+    stage_cache: dict[tuple[object, ...], StageResult | None] = {}
     for propellant in propellants:
         prop_base = MotorSpec(
             config=base.config,
@@ -672,6 +1114,8 @@ def generate_two_stage_designs(
                 search,
                 constraints,
                 fixed_diameter_scale=diameter_scale,
+                stats=search_stats,
+                cache=stage_cache,
             )
             stage1 = _search_stage(
                 prop_base,
@@ -679,6 +1123,8 @@ def generate_two_stage_designs(
                 search,
                 constraints,
                 fixed_diameter_scale=diameter_scale,
+                stats=search_stats,
+                cache=stage_cache,
             )
             if stage0 is None or stage1 is None:
                 continue
@@ -755,6 +1201,7 @@ def generate_two_stage_designs(
         },
         "constraints": asdict(constraints),
         "search": asdict(search),
+        "search_stats": search_stats,
     }
     if best_propellant:
         log["propellant"] = {
@@ -803,6 +1250,7 @@ def generate_single_stage_designs(
     best: StageResult | None = None
     best_score = None
     best_propellant: PropellantSpec | None = None
+    search_stats: dict[str, object] = {"strategy": search.strategy}
     for propellant in propellants:
         prop_base = MotorSpec(
             config=base.config,
@@ -817,6 +1265,7 @@ def generate_single_stage_designs(
                 search,
                 constraints,
                 fixed_diameter_scale=diameter_scale,
+                stats=search_stats,
             )
             if stage is None:
                 continue
@@ -869,6 +1318,7 @@ def generate_single_stage_designs(
         "targets": {"total_target_impulse_ns": total_target_impulse_ns},
         "constraints": asdict(constraints),
         "search": asdict(search),
+        "search_stats": search_stats,
     }
     if best_propellant:
         log["propellant"] = {
@@ -1072,27 +1522,11 @@ def _filter_propellants(
     return selected
 
 
-def _propellant_spec_key(spec: PropellantSpec) -> tuple[object, ...]:
-    tab_key = tuple(
-        (
-            round(tab.a, 12),
-            round(tab.n, 6),
-            round(tab.k, 6),
-            round(tab.m, 6),
-            round(tab.t, 3),
-            round(tab.min_pressure_pa, 2),
-            round(tab.max_pressure_pa, 2),
-        )
-        for tab in spec.tabs
-    )
-    return (spec.name, round(spec.density_kg_m3, 6), tab_key)
-
-
 def _dedupe_propellant_specs(specs: list[PropellantSpec]) -> list[PropellantSpec]:
     seen: set[tuple[object, ...]] = set()
     unique: list[PropellantSpec] = []
     for spec in specs:
-        key = _propellant_spec_key(spec)
+        key = propellant_key(spec)
         if key in seen:
             continue
         seen.add(key)
@@ -1100,44 +1534,78 @@ def _dedupe_propellant_specs(specs: list[PropellantSpec]) -> list[PropellantSpec
     return unique
 
 
-def _load_propellant_specs(
-    *,
+@lru_cache(maxsize=8)
+def _preset_propellants(path: str, digest: str | None) -> tuple[PropellantSchema, ...]:
+    # ``digest`` only keys the cache, so an edited preset file is parsed again.
+    return tuple(load_preset_propellants(path))
+
+
+@lru_cache(maxsize=1)
+def _openmotor_propellant_specs() -> tuple[PropellantSpec, ...]:
+    try:
+        entries = load_openmotor_propellants(str(_OPENMOTOR_ROOT))
+    except Exception:
+        return ()
+    return tuple(
+        PropellantSpec(name=entry.name, density_kg_m3=entry.density_kg_m3, tabs=entry.tabs) for entry in entries
+    )
+
+
+@lru_cache(maxsize=64)
+def _cached_propellant_specs(
     preset_path: str | None,
-    allowed_propellant_families: list[str] | None,
-    allowed_propellant_names: list[str] | None,
-) -> list[PropellantSpec]:
-    default_path = str(Path(__file__).resolve().parents[3] / "resources" / "propellants" / "presets.json")
-    presets = load_preset_propellants(default_path)
+    preset_digest: str | None,
+    default_digest: str | None,
+    allowed_propellant_families: tuple[str, ...] | None,
+    allowed_propellant_names: tuple[str, ...] | None,
+) -> tuple[PropellantSpec, ...]:
+    presets = list(_preset_propellants(str(_DEFAULT_PRESETS_PATH), default_digest))
     if preset_path:
-        presets += load_preset_propellants(preset_path)
+        presets += _preset_propellants(preset_path, preset_digest)
     if allowed_propellant_families or allowed_propellant_names:
-        selected = _filter_propellants(presets, allowed_propellant_families, allowed_propellant_names)
+        selected = _filter_propellants(
+            presets,
+            list(allowed_propellant_families or ()),
+            list(allowed_propellant_names or ()),
+        )
     else:
         selected = presets
     if not selected:
         raise RuntimeError("No propellants matched allowed families or names.")
     specs = [propellant_to_spec(prop) for prop in selected]
 
-    try:
-        openmotor_root = Path(__file__).resolve().parents[3] / "third_party" / "openmotor_src"
-        for entry in load_openmotor_propellants(str(openmotor_root)):
-            if allowed_propellant_names and entry.name not in allowed_propellant_names:
-                continue
-            specs.append(
-                PropellantSpec(
-                    name=entry.name,
-                    density_kg_m3=entry.density_kg_m3,
-                    tabs=entry.tabs,
-                )
-            )
-    except Exception:
-        pass
+    for spec in _openmotor_propellant_specs():
+        if allowed_propellant_names and spec.name not in allowed_propellant_names:
+            continue
+        specs.append(spec)
     deduped = _dedupe_propellant_specs(specs)
     if allowed_propellant_names:
         order = {name: idx for idx, name in enumerate(allowed_propellant_names)}
         deduped.sort(key=lambda spec: order.get(spec.name, len(order)))
         deduped = [spec for spec in deduped if spec.name in order]
-    return deduped
+    return tuple(deduped)
+
+
+def _load_propellant_specs(
+    *,
+    preset_path: str | None,
+    allowed_propellant_families: list[str] | None,
+    allowed_propellant_names: list[str] | None,
+) -> list[PropellantSpec]:
+    """Preset plus OpenMotor propellants, filtered and deduped.
+
+    Parsed libraries are cached per process and keyed by the preset files' digests, so repeated calls only hash
+    ``presets.json``. The specs are frozen and shared between callers; each call gets its own list.
+    """
+    return list(
+        _cached_propellant_specs(
+            preset_path,
+            file_digest(preset_path),
+            file_digest(_DEFAULT_PRESETS_PATH),
+            tuple(allowed_propellant_families) if allowed_propellant_families else None,
+            tuple(allowed_propellant_names) if allowed_propellant_names else None,
+        )
+    )
 
 
 def _objective_reports(
@@ -1188,55 +1656,6 @@ def _objective_error_pct(
     return float(sum(errors) / len(errors))
 
 
-def _objective_error_pct_max(
-    apogee_ft: float | None,
-    max_velocity_m_s: float | None,
-    target_apogee_ft: float | None,
-    target_max_velocity_m_s: float | None,
-) -> float | None:
-    errors: list[float] = []
-    if target_apogee_ft is not None and apogee_ft is not None:
-        if apogee_ft <= target_apogee_ft:
-            errors.append((target_apogee_ft - apogee_ft) / max(target_apogee_ft, 1e-6))
-        else:
-            errors.append(
-                1.0
-                + (apogee_ft - target_apogee_ft) / max(target_apogee_ft, 1e-6)
-            )
-    if target_max_velocity_m_s is not None and max_velocity_m_s is not None:
-        if max_velocity_m_s <= target_max_velocity_m_s:
-            errors.append(
-                (target_max_velocity_m_s - max_velocity_m_s)
-                / max(target_max_velocity_m_s, 1e-6)
-            )
-        else:
-            errors.append(
-                1.0
-                + (max_velocity_m_s - target_max_velocity_m_s)
-                / max(target_max_velocity_m_s, 1e-6)
-            )
-    if not errors:
-        return None
-    return float(sum(errors) / len(errors))
-
-
-def _within_max_targets(
-    apogee_ft: float | None,
-    max_velocity_m_s: float | None,
-    target_apogee_ft: float | None,
-    target_max_velocity_m_s: float | None,
-) -> bool:
-    if target_apogee_ft is not None and apogee_ft is not None and apogee_ft > target_apogee_ft:
-        return False
-    if (
-        target_max_velocity_m_s is not None
-        and max_velocity_m_s is not None
-        and max_velocity_m_s > target_max_velocity_m_s
-    ):
-        return False
-    return True
-
-
 def _split_stage_dry_masses(
     total_mass_kg: float,
     prop0_kg: float,
@@ -1374,14 +1793,7 @@ def _normalize_spec_for_motorlib(spec: MotorSpec) -> MotorSpec:
     for grain in spec.grains:
         diameter = max(grain.diameter_m, 0.0)
         core = max(min(grain.core_diameter_m, diameter * 0.98), 0.0)
-        grains.append(
-            grain.__class__(
-                diameter_m=diameter,
-                core_diameter_m=core,
-                length_m=grain.length_m,
-                inhibited_ends=grain.inhibited_ends,
-            )
-        )
+        grains.append(replace(grain, diameter_m=diameter, core_diameter_m=core))
 
     throat = max(spec.nozzle.throat_diameter_m, 1e-9)
     max_core = max((g.core_diameter_m for g in grains), default=0.0)
@@ -1417,73 +1829,161 @@ def _normalize_spec_for_motorlib(spec: MotorSpec) -> MotorSpec:
     return MotorSpec(config=config, propellant=propellant, grains=grains, nozzle=nozzle)
 
 
-def _try_simulate_with_throat_reduction(
+_THROAT_SOLVE_PRESSURE_FRAC = 0.5
+_THROAT_SOLVE_DEFAULT_PRESSURE_PA = 3.447e6
+
+
+def _with_throat(spec: MotorSpec, throat_diameter_m: float) -> MotorSpec:
+    max_core = max((g.core_diameter_m for g in spec.grains), default=0.0)
+    port_throat = (max_core / throat_diameter_m) ** 2 if throat_diameter_m > 0 else 0.0
+    adjusted_min_port_throat = min(spec.config.min_port_throat_ratio, port_throat) if port_throat > 0 else 0.0
+    return spec.__class__(
+        config=spec.config.__class__(
+            amb_pressure_pa=spec.config.amb_pressure_pa,
+            burnout_thrust_threshold_n=min(spec.config.burnout_thrust_threshold_n, 1e-6),
+            burnout_web_threshold_m=spec.config.burnout_web_threshold_m,
+            map_dim=spec.config.map_dim,
+            max_mass_flux_kg_m2_s=spec.config.max_mass_flux_kg_m2_s,
+            max_pressure_pa=spec.config.max_pressure_pa,
+            min_port_throat_ratio=adjusted_min_port_throat,
+            timestep_s=spec.config.timestep_s,
+        ),
+        propellant=spec.propellant,
+        grains=spec.grains,
+        nozzle=spec.nozzle.__class__(
+            throat_diameter_m=throat_diameter_m,
+            exit_diameter_m=max(spec.nozzle.exit_diameter_m, throat_diameter_m),
+            throat_length_m=spec.nozzle.throat_length_m,
+            conv_angle_deg=spec.nozzle.conv_angle_deg,
+            div_angle_deg=spec.nozzle.div_angle_deg,
+            efficiency=spec.nozzle.efficiency,
+            erosion_coeff=spec.nozzle.erosion_coeff,
+            slag_coeff=spec.nozzle.slag_coeff,
+        ),
+    )
+
+
+def _kn_for_pressure(propellant: PropellantSpec, pressure_pa: float) -> float | None:
+    # Inverse of motorlib Propellant.getPressureFromKn for the tab covering pressure_pa.
+    tab = next(
+        (t for t in propellant.tabs if t.min_pressure_pa <= pressure_pa <= t.max_pressure_pa),
+        propellant.tabs[-1] if propellant.tabs else None,
+    )
+    if tab is None or tab.a <= 0 or tab.k <= 1.0 or tab.m <= 0 or tab.t <= 0 or tab.n >= 1.0:
+        return None
+    gas = 8314.462618 / tab.m
+    denom = ((tab.k / (gas * tab.t)) * ((2 / (tab.k + 1)) ** ((tab.k + 1) / (tab.k - 1)))) ** 0.5
+    return (pressure_pa ** (1.0 - tab.n)) * denom / (propellant.density_kg_m3 * tab.a)
+
+
+def _predict_throat_diameter_m(spec: MotorSpec, target_pressure_pa: float) -> float | None:
+    from app.engine.openmotor_ai.motorlib_adapter import peak_burn_area_m2
+
+    kn = _kn_for_pressure(spec.propellant, target_pressure_pa)
+    if kn is None or kn <= 0:
+        return None
+    try:
+        burn_area = peak_burn_area_m2(spec)
+    except Exception:
+        return None
+    if burn_area <= 0:
+        return None
+    return (4.0 * (burn_area / kn) / math.pi) ** 0.5
+
+
+def _simulate_with_throat_solve(
     spec: MotorSpec,
     *,
-    max_steps: int = 14,
-    factor: float = 0.8,
+    max_bisection_steps: int = 5,
     min_throat_ratio: float = 0.05,
+    limits: SimulationLimits | None = None,
 ) -> tuple[MotorSpec, list["TimeStep"], "SimulationResult"]:
     from app.engine.openmotor_ai.motorlib_adapter import simulate_motorlib_with_result
 
-    last_exc: Exception | None = None
-    current = spec
-    original_throat = max(spec.nozzle.throat_diameter_m, 1e-9)
-    base_min_thrust = spec.config.burnout_thrust_threshold_n
-    for _ in range(max_steps):
+    def _attempt(candidate: MotorSpec):
         try:
-            steps, sim = simulate_motorlib_with_result(current)
-            return current, steps, sim
+            steps, sim = simulate_motorlib_with_result(candidate, limits=limits)
+            return (candidate, steps, sim), None
+        except ConstraintViolation:
+            raise
         except Exception as exc:
+            if "did not generate thrust" not in str(exc):
+                raise
+            return None, exc
+
+    result, last_exc = _attempt(spec)
+    if result is not None:
+        return result
+
+    # The throat is too large to build pressure: size it for a target chamber pressure instead of shrinking blindly.
+    original_throat = max(spec.nozzle.throat_diameter_m, 1e-9)
+    floor_throat = original_throat * min_throat_ratio
+    target_pressure = (
+        spec.config.max_pressure_pa * _THROAT_SOLVE_PRESSURE_FRAC
+        if spec.config.max_pressure_pa > 0
+        else _THROAT_SOLVE_DEFAULT_PRESSURE_PA
+    )
+    predicted = _predict_throat_diameter_m(spec, target_pressure)
+    low = floor_throat
+    high = original_throat
+    violation: ConstraintViolation | None = None
+    if predicted is not None and floor_throat <= predicted < original_throat:
+        try:
+            result, last_exc = _attempt(_with_throat(spec, predicted))
+        except ConstraintViolation as exc:
+            violation = exc
+            low = predicted
+        else:
+            if result is not None:
+                return result
+            high = predicted
+
+    # Prediction unavailable, still thrustless or over the limits: bisect (geometrically) between the bracket ends.
+    # A throat that overshoots the limits is too small, so it moves the bracket up like a success does.
+    best = None
+    for _ in range(max_bisection_steps):
+        mid = (low * high) ** 0.5
+        try:
+            result, exc = _attempt(_with_throat(spec, mid))
+        except ConstraintViolation as exc:
+            violation = exc
+            low = mid
+            continue
+        if result is not None:
+            best = result
+            low = mid
+        else:
             last_exc = exc
-            msg = str(exc)
-            if "did not generate thrust" not in msg:
-                break
-        new_throat = current.nozzle.throat_diameter_m * factor
-        if new_throat / original_throat < min_throat_ratio:
-            break
-        max_core = max((g.core_diameter_m for g in current.grains), default=0.0)
-        port_throat = (max_core / new_throat) ** 2 if new_throat > 0 else 0.0
-        adjusted_min_port_throat = min(current.config.min_port_throat_ratio, port_throat) if port_throat > 0 else 0.0
-        lowered_thrust_threshold = min(base_min_thrust, 1e-6)
-        current = current.__class__(
-            config=current.config.__class__(
-                amb_pressure_pa=current.config.amb_pressure_pa,
-                burnout_thrust_threshold_n=lowered_thrust_threshold,
-                burnout_web_threshold_m=current.config.burnout_web_threshold_m,
-                map_dim=current.config.map_dim,
-                max_mass_flux_kg_m2_s=current.config.max_mass_flux_kg_m2_s,
-                max_pressure_pa=current.config.max_pressure_pa,
-                min_port_throat_ratio=adjusted_min_port_throat,
-                timestep_s=current.config.timestep_s,
-            ),
-            propellant=current.propellant,
-            grains=current.grains,
-            nozzle=current.nozzle.__class__(
-                throat_diameter_m=new_throat,
-                exit_diameter_m=max(current.nozzle.exit_diameter_m, new_throat),
-                throat_length_m=current.nozzle.throat_length_m,
-                conv_angle_deg=current.nozzle.conv_angle_deg,
-                div_angle_deg=current.nozzle.div_angle_deg,
-                efficiency=current.nozzle.efficiency,
-                erosion_coeff=current.nozzle.erosion_coeff,
-                slag_coeff=current.nozzle.slag_coeff,
-            ),
-        )
-    raise last_exc or RuntimeError("Motor simulation failed after throat reduction attempts")
+            high = mid
+    # Keep the last throat that worked; a violation only matters when nothing in the bracket did.
+    if best is not None:
+        return best
+    if violation is not None:
+        raise violation
+    best, exc = _attempt(_with_throat(spec, floor_throat))
+    last_exc = exc or last_exc
+    if best is not None:
+        return best
+    raise last_exc or RuntimeError("Motor simulation failed after throat sizing attempts")
 
 
 def _simulate_with_fallback(
     spec: MotorSpec,
+    limits: SimulationLimits | None = None,
 ) -> tuple[MotorSpec, list["TimeStep"], dict[str, float], str]:
     from app.engine.openmotor_ai.ballistics import _simulate_ballistics_internal, aggregate_metrics
     from app.engine.openmotor_ai.motorlib_adapter import metrics_from_simresult
 
     try:
-        spec, steps, sim = _try_simulate_with_throat_reduction(spec)
+        spec, steps, sim = _simulate_with_throat_solve(spec, limits=limits)
         metrics = metrics_from_simresult(sim)
         return spec, steps, metrics, "motorlib"
+    except ConstraintViolation:
+        raise
     except Exception:
+        if spec_uses_fmm(spec):
+            # The internal ballistics only model BATES grains.
+            raise
         relaxed = spec.__class__(
             config=spec.config.__class__(
                 amb_pressure_pa=spec.config.amb_pressure_pa,
@@ -1744,10 +2244,50 @@ def estimate_total_impulse_ns_single_stage(
     return base_total_impulse * scale
 
 
-def mission_targeted_design(
+def _load_mission_propellants(
+    preset_path: str | None,
+    allowed_propellant_families: list[str] | None,
+    allowed_propellant_names: list[str] | None,
+) -> list[PropellantSpec]:
+    return _load_propellant_specs(
+        preset_path=preset_path,
+        allowed_propellant_families=allowed_propellant_families,
+        allowed_propellant_names=(
+            allowed_propellant_names or _PREFERRED_PROPELLANT_ORDER
+        ),
+    )
+
+
+def _load_mission_bases(base_ric_path: str, stage1_ric_path: str | None) -> tuple[MotorSpec, MotorSpec]:
+    ric0: RicData = load_ric(base_ric_path)
+    base0 = spec_from_ric(ric0)
+    ric1: RicData | None = load_ric(stage1_ric_path) if stage1_ric_path else None
+    base1 = spec_from_ric(ric1) if ric1 else base0
+    return base0, base1
+
+
+def _mission_propellant_bases(
+    base0: MotorSpec, base1: MotorSpec, prop_spec: PropellantSpec
+) -> tuple[MotorSpec, MotorSpec]:
+    prop_base0 = MotorSpec(
+        config=base0.config,
+        propellant=prop_spec,
+        grains=base0.grains,
+        nozzle=base0.nozzle,
+    )
+    prop_base1 = MotorSpec(
+        config=base1.config,
+        propellant=prop_spec,
+        grains=base1.grains,
+        nozzle=base1.nozzle,
+    )
+    return _normalize_spec_for_motorlib(prop_base0), _normalize_spec_for_motorlib(prop_base1)
+
+
+def _plan_mission(
+    *,
     base_ric_path: str,
     stage1_ric_path: str | None,
-    output_dir: str,
     rkt_path: str | None,
     total_target_impulse_ns: float | None,
     targets: TrajectoryTargets,
@@ -1760,31 +2300,14 @@ def mission_targeted_design(
     total_mass_kg: float | None,
     separation_delay_s: float,
     ignition_delay_s: float,
-    allowed_propellant_families: list[str] | None = None,
-    allowed_propellant_names: list[str] | None = None,
-    preset_path: str | None = None,
-    weights: ScoreWeights | None = None,
-) -> dict[str, object]:
-    output_root = _resolve_output_dir(output_dir)
-    propellant_specs = _load_propellant_specs(
-        preset_path=preset_path,
-        allowed_propellant_families=allowed_propellant_families,
-        allowed_propellant_names=(
-            allowed_propellant_names or _PREFERRED_PROPELLANT_ORDER
-        ),
-    )
-
-    ric0: RicData = load_ric(base_ric_path)
-    base0 = spec_from_ric(ric0)
-    ric1: RicData | None = load_ric(stage1_ric_path) if stage1_ric_path else None
-    base1 = spec_from_ric(ric1) if ric1 else base0
-    viable_candidates: list[Candidate] = []
-    all_candidates: list[Candidate] = []
-    logs: list[dict[str, object]] = []
+    propellant_specs: list[PropellantSpec],
+    propellant_halving: HalvingPolicy | None,
+    stage_cache: dict[tuple[object, ...], StageResult | None],
+    search_stats: dict[str, object],
+    deadline: SearchDeadline | None = None,
+) -> tuple[dict[str, object], list[PropellantSpec]]:
+    base0, base1 = _load_mission_bases(base_ric_path, stage1_ric_path)
     rejected: list[dict[str, str]] = []
-    stage_cache: dict[tuple[object, ...], StageResult | None] = {}
-    stage_cache: dict[tuple[object, ...], StageResult | None] = {}
-    same_base_template = stage1_ric_path is None
 
     if total_target_impulse_ns is None or total_target_impulse_ns <= 0:
         baseline_prop = propellant_specs[0]
@@ -1803,22 +2326,122 @@ def mission_targeted_design(
             propellant=baseline_prop,
         )
 
-    for prop_spec in propellant_specs:
-        prop_base0 = MotorSpec(
-            config=base0.config,
-            propellant=prop_spec,
-            grains=base0.grains,
-            nozzle=base0.nozzle,
-        )
-        prop_base1 = MotorSpec(
-            config=base1.config,
-            propellant=prop_spec,
-            grains=base1.grains,
-            nozzle=base1.nozzle,
-        )
-        prop_base0 = _normalize_spec_for_motorlib(prop_base0)
-        prop_base1 = _normalize_spec_for_motorlib(prop_base1)
+    def _screen_propellant(prop_spec: PropellantSpec, fidelity: float) -> float | None:
+        # Impulse error of the best stage pair over all splits, searched on a thinned lattice.
+        screen_search = _search_at_fidelity(search, fidelity)
+        prop_base0, prop_base1 = _mission_propellant_bases(base0, base1, prop_spec)
+        best_error: float | None = None
+        for split in split_ratios:
+            if deadline is not None and deadline.should_stop():
+                break
+            stage0_target = total_target_impulse_ns * split
+            stage1_target = total_target_impulse_ns * (1.0 - split)
+            try:
+                stage0 = _search_stage(
+                    prop_base0,
+                    stage0_target,
+                    screen_search,
+                    constraints,
+                    stats=search_stats,
+                    cache=stage_cache,
+                    deadline=deadline,
+                )
+                stage1 = _search_stage(
+                    prop_base1,
+                    stage1_target,
+                    screen_search,
+                    constraints,
+                    stats=search_stats,
+                    cache=stage_cache,
+                    deadline=deadline,
+                )
+            except Exception:
+                continue
+            if stage0 is None or stage1 is None:
+                continue
+            error = (
+                abs(stage0.metrics["total_impulse"] - stage0_target)
+                + abs(stage1.metrics["total_impulse"] - stage1_target)
+            ) / max(total_target_impulse_ns, 1e-9)
+            if best_error is None or error < best_error:
+                best_error = error
+        return best_error
+
+    screening = successive_halving(
+        propellant_specs,
+        _screen_propellant,
+        label=lambda prop_spec: prop_spec.name,
+        policy=propellant_halving,
+    )
+    for round_info in screening.rounds:
+        for idx in round_info["eliminated"]:
+            rejected.append(
+                {
+                    "propellant": propellant_specs[idx].name,
+                    "reason": "eliminated_by_screening",
+                    "round": str(round_info["round"]),
+                }
+            )
+    # Survivors are listed by position in the loaded propellant list, since names alone are not unique across the
+    # preset and OpenMotor libraries.
+    positions = {id(prop_spec): idx for idx, prop_spec in enumerate(propellant_specs)}
+    plan = {
+        "total_target_impulse_ns": total_target_impulse_ns,
+        "propellant_indices": [positions[id(prop_spec)] for prop_spec in screening.survivors],
+        "rejected": rejected,
+        "propellant_screening": {
+            "rounds": screening.rounds,
+            "survivors": [prop_spec.name for prop_spec in screening.survivors],
+        },
+        "stopped": deadline.reason if deadline is not None else None,
+    }
+    return plan, screening.survivors
+
+
+def _pair_mission_stages(
+    *,
+    base_ric_path: str,
+    stage1_ric_path: str | None,
+    output_root: Path,
+    rkt_path: str | None,
+    total_target_impulse_ns: float,
+    targets: TrajectoryTargets,
+    constraints: TwoStageConstraints,
+    search: StageSearchConfig,
+    split_ratios: list[float],
+    cd_max: float,
+    mach_max: float,
+    cd_ramp: bool,
+    total_mass_kg: float | None,
+    separation_delay_s: float,
+    ignition_delay_s: float,
+    survivors: list[PropellantSpec],
+    stage_cache: dict[tuple[object, ...], StageResult | None],
+    search_stats: dict[str, object],
+    progress_cb: Callable[[dict[str, object]], None] | None,
+    deadline: SearchDeadline | None = None,
+) -> tuple[list[Candidate], list[Candidate], list[dict[str, object]], list[dict[str, str]]]:
+    base0, base1 = _load_mission_bases(base_ric_path, stage1_ric_path)
+    same_base_template = stage1_ric_path is None
+    viable_candidates: list[Candidate] = []
+    all_candidates: list[Candidate] = []
+    logs: list[dict[str, object]] = []
+    rejected: list[dict[str, str]] = []
+
+    # Stage searches share the stage cache and run serially. Every pair that passes the packaging checks becomes a
+    # task, and the trajectory and artifact work for all of them goes through a bounded worker pool afterwards. A
+    # deadline or a cancellation only cuts the searches short; the pairs found by then are still flown and exported.
+    pair_plans: list[dict[str, object]] = []
+    pair_memo: dict[tuple[object, ...], dict[str, object]] = {}
+    reject_slots: list[list[dict[str, str]]] = []
+    trajectory_inputs = (rkt_path, cd_max, mach_max, cd_ramp, separation_delay_s, ignition_delay_s)
+    for prop_spec in survivors:
+        prop_base0, prop_base1 = _mission_propellant_bases(base0, base1, prop_spec)
         for split in split_ratios:
+            if deadline is not None and deadline.should_stop():
+                break
+            slot: list[dict[str, str]] = []
+            reject_slots.append(slot)
             stage0_target = total_target_impulse_ns * split
             stage1_target = total_target_impulse_ns * (1.0 - split)
             try:
@@ -1827,7 +2450,10 @@ def mission_targeted_design(
                     stage0_target,
                     search,
                     constraints,
-                    reject_log=rejected,
+                    reject_log=slot,
+                    stats=search_stats,
+                    cache=stage_cache,
+                    deadline=deadline,
                     reject_context={
                         "propellant": prop_spec.name,
                         "stage": "stage0",
@@ -1839,7 +2465,10 @@ def mission_targeted_design(
                     stage1_target,
                     search,
                     constraints,
-                    reject_log=rejected,
+                    reject_log=slot,
+                    stats=search_stats,
+                    cache=stage_cache,
+                    deadline=deadline,
                     reject_context={
                         "propellant": prop_spec.name,
                         "stage": "stage1",
@@ -1857,7 +2486,10 @@ def mission_targeted_design(
                             search,
                             constraints,
                             exclude_scales=stage0.scales,
-                            reject_log=rejected,
+                            reject_log=slot,
+                            stats=search_stats,
+                            cache=stage_cache,
+                            deadline=deadline,
                             reject_context={
                                 "propellant": prop_spec.name,
                                 "stage": "stage1",
@@ -1866,22 +2498,13 @@ def mission_targeted_design(
                             },
                         )
             except Exception as exc:
-                rejected.append({"propellant": prop_spec.name, "reason": str(exc)})
+                slot.append({"propellant": prop_spec.name, "reason": str(exc)})
                 continue
             if stage0 is None or stage1 is None:
-                rejected.append({"propellant": prop_spec.name, "reason": "no_feasible_stage_pair"})
-                continue
-            if _stages_too_similar(stage0, stage1):
-                rejected.append(
-                    {
-                        "propellant": prop_spec.name,
-                        "reason": "stage_metrics_too_similar",
-                        "split_ratio": f"{split:.2f}",
-                    }
-                )
+                slot.append({"propellant": prop_spec.name, "reason": "no_feasible_stage_pair"})
                 continue
             if _stages_too_similar(stage0, stage1):
-                rejected.append(
+                slot.append(
                     {
                         "propellant": prop_spec.name,
                         "reason": "stage_metrics_too_similar",
@@ -1893,67 +2516,108 @@ def mission_targeted_design(
             stage0_len = _stage_length_in(stage0.spec)
             stage1_len = _stage_length_in(stage1.spec)
             if stage0_len + stage1_len > constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT):
-                rejected.append({"propellant": prop_spec.name, "reason": "motor stack exceeds vehicle length"})
+                slot.append({"propellant": prop_spec.name, "reason": "motor stack exceeds vehicle length"})
                 continue
             length_ratio = max(stage0_len, stage1_len) / max(min(stage0_len, stage1_len), 1e-6)
             if length_ratio > max(constraints.max_stage_length_ratio, _RELAXED_STAGE_LENGTH_RATIO):
-                rejected.append({"propellant": prop_spec.name, "reason": "stage lengths differ too much"})
+                slot.append({"propellant": prop_spec.name, "reason": "stage lengths differ too much"})
                 continue
-
-            try:
-                if not rkt_path:
-                    raise RuntimeError("rkt_path required for trajectory")
-                total_mass_for_sim = (
-                    _total_mass_from_dry(total_mass_kg, stage0.metrics, stage1.metrics)
-                    if total_mass_kg is not None
-                    else None
-                )
-                apogee = simulate_two_stage_apogee(
-                    stage0=stage0.spec,
-                    stage1=stage1.spec,
+            total_mass_for_sim = (
+                _total_mass_from_dry(total_mass_kg, stage0.metrics, stage1.metrics)
+                if total_mass_kg is not None
+                else None
+            )
+            # Neighbouring split ratios often land on the same pair on a discrete grid; those reuse the first
+            # split's flight and artifacts and are listed on its log entry.
+            pair_key = (
+                _base_spec_cache_key(stage0.spec),
+                _base_spec_cache_key(stage1.spec),
+                total_mass_for_sim,
+                trajectory_inputs,
+            )
+            search_stats["pair_tasks"] = int(search_stats.get("pair_tasks", 0)) + 1
+            if pair_key in pair_memo:
+                pair_memo[pair_key]["split_ratios"].append(split)
+                continue
+            pair_memo[pair_key] = {
+                "propellant": prop_spec,
+                "split": split,
+                "split_ratios": [split],
+                "stage0": stage0,
+                "stage1": stage1,
+                "stage_length_in": stage0_len + stage1_len,
+                "total_mass_kg": total_mass_for_sim,
+                "rejected": slot,
+            }
+            pair_plans.append(pair_memo[pair_key])
+
+    flights = (
+        _run_bounded(
+            [
+                partial(
+                    simulate_two_stage_apogee,
+                    stage0=plan["stage0"].spec,
+                    stage1=plan["stage1"].spec,
                     rkt_path=rkt_path,
                     cd_max=cd_max,
                     mach_max=mach_max,
                     cd_ramp=cd_ramp,
-                    total_mass_kg=total_mass_for_sim,
+                    total_mass_kg=plan["total_mass_kg"],
                     separation_delay_s=separation_delay_s,
                     ignition_delay_s=ignition_delay_s,
                 )
-            except Exception as exc:
-                rejected.append(
-                    {"propellant": prop_spec.name, "reason": "simulation_failed", "detail": str(exc)}
-                )
-                continue
-            if not (apogee.apogee_m == apogee.apogee_m and apogee.max_velocity_m_s == apogee.max_velocity_m_s):
-                rejected.append(
-                    {
-                        "propellant": prop_spec.name,
-                        "reason": "simulation_failed",
-                        "detail": "NaN in trajectory output",
-                    }
-                )
-                continue
-            error = _objective_error_pct(
-                apogee.apogee_m * 3.28084,
-                apogee.max_velocity_m_s,
-                targets.apogee_ft,
-                targets.max_velocity_m_s,
+                for plan in pair_plans
+            ],
+            search.workers,
+        )
+        if rkt_path
+        else [("error", "rkt_path required for trajectory")] * len(pair_plans)
+    )
+    search_stats["pair_flights"] = len(pair_plans)
+
+    flown_plans: list[dict[str, object]] = []
+    artifact_calls: list[Callable[[], object]] = []
+    for plan, (status, apogee) in zip(pair_plans, flights):
+        prop_spec = plan["propellant"]
+        if status != "ok":
+            plan["rejected"].append(
+                {"propellant": prop_spec.name, "reason": "simulation_failed", "detail": apogee}
             )
-            if error is None:
-                rejected.append({"propellant": prop_spec.name, "reason": "no_objectives_provided"})
-                continue
-            within_tolerance = bool(error <= targets.tolerance_pct)
-            if not within_tolerance:
-                rejected.append(
-                    {
-                        "propellant": prop_spec.name,
-                        "reason": "objective_outside_tolerance",
-                        "detail": f"error_pct={error * 100.0:.2f}",
-                    }
-                )
-
-            prefix = f"mission_{_slugify_name(prop_spec.name)}_{int(split * 100)}"
-            generate_two_stage_designs(
+            continue
+        if not (apogee.apogee_m == apogee.apogee_m and apogee.max_velocity_m_s == apogee.max_velocity_m_s):
+            plan["rejected"].append(
+                {
+                    "propellant": prop_spec.name,
+                    "reason": "simulation_failed",
+                    "detail": "NaN in trajectory output",
+                }
+            )
+            continue
+        error = _objective_error_pct(
+            apogee.apogee_m * 3.28084,
+            apogee.max_velocity_m_s,
+            targets.apogee_ft,
+            targets.max_velocity_m_s,
+        )
+        if error is None:
+            plan["rejected"].append({"propellant": prop_spec.name, "reason": "no_objectives_provided"})
+            continue
+        within_tolerance = bool(error <= targets.tolerance_pct)
+        if not within_tolerance:
+            plan["rejected"].append(
+                {
+                    "propellant": prop_spec.name,
+                    "reason": "objective_outside_tolerance",
+                    "detail": f"error_pct={error * 100.0:.2f}",
+                }
+            )
+        split = plan["split"]
+        prefix = f"mission_{_slugify_name(prop_spec.name)}_{int(split * 100)}"
+        plan.update(apogee=apogee, error=error, within_tolerance=within_tolerance, prefix=prefix)
+        flown_plans.append(plan)
+        artifact_calls.append(
+            partial(
+                generate_two_stage_designs,
                 base_ric_path=base_ric_path,
                 output_dir=str(output_root),
                 total_target_impulse_ns=total_target_impulse_ns,
@@ -1970,77 +2634,125 @@ def mission_targeted_design(
                 propellant_options=[prop_spec],
                 artifact_prefix=prefix,
             )
+        )
 
-            stage0_ric = output_root / f"{prefix}_stage0.ric"
-            stage1_ric = output_root / f"{prefix}_stage1.ric"
-            stage0_metrics = _stage_metrics_from_ric_or_spec(stage0, stage0_ric)
-            stage1_metrics = _stage_metrics_from_ric_or_spec(stage1, stage1_ric)
-            metrics = _combine_metric_dicts(stage0_metrics, stage1_metrics, constraints)
-            metrics["max_velocity_m_s"] = apogee.max_velocity_m_s
-            curve = _build_thrust_curve_from_ric_paths(
-                stage0_ric, stage1_ric, separation_delay_s, ignition_delay_s
-            )
-            if not curve:
-                curve = _build_thrust_curve(stage0, stage1, separation_delay_s, ignition_delay_s)
-            vehicle_len = constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT)
-            stage_len = stage0_len + stage1_len
-            stage_diameter = _stage_diameter_in(stage0.spec)
-            name = f"{prop_spec.name} split {split:.2f}"
-            peak_pressure_pa = metrics.get("peak_chamber_pressure")
-            peak_pressure_psi = (
-                peak_pressure_pa / 6894.757 if peak_pressure_pa is not None else None
-            )
-            peak_kn = metrics.get("peak_kn")
-            average_thrust = metrics.get("average_thrust")
-            candidate = Candidate(
-                name=name,
-                metrics=metrics,
-                thrust_curve=curve,
-                apogee_ft=apogee.apogee_m * 3.28084,
-                vehicle_length_in=vehicle_len,
-                stage_length_in=stage_len,
-                stage_diameter_in=stage_diameter,
-            )
-            all_candidates.append(candidate)
-            if within_tolerance:
-                viable_candidates.append(candidate)
-            logs.append(
+    # Outcomes are merged in task order, so logs and rejections match a serial run whatever the pool size.
+    for plan, (status, detail) in zip(flown_plans, _run_bounded(artifact_calls, search.workers)):
+        if status != "ok":
+            raise RuntimeError(detail)
+        prop_spec = plan["propellant"]
+        split = plan["split"]
+        stage0 = plan["stage0"]
+        stage1 = plan["stage1"]
+        apogee = plan["apogee"]
+        error = plan["error"]
+        within_tolerance = plan["within_tolerance"]
+        prefix = plan["prefix"]
+        stage0_ric = output_root / f"{prefix}_stage0.ric"
+        stage1_ric = output_root / f"{prefix}_stage1.ric"
+        stage0_metrics = _stage_metrics_from_ric_or_spec(stage0, stage0_ric)
+        stage1_metrics = _stage_metrics_from_ric_or_spec(stage1, stage1_ric)
+        metrics = _combine_metric_dicts(stage0_metrics, stage1_metrics, constraints)
+        metrics["max_velocity_m_s"] = apogee.max_velocity_m_s
+        curve = _build_thrust_curve_from_ric_paths(
+            stage0_ric, stage1_ric, separation_delay_s, ignition_delay_s
+        )
+        if not curve:
+            curve = _build_thrust_curve(stage0, stage1, separation_delay_s, ignition_delay_s)
+        vehicle_len = constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT)
+        stage_len = plan["stage_length_in"]
+        stage_diameter = _stage_diameter_in(stage0.spec)
+        name = f"{prop_spec.name} split {split:.2f}"
+        peak_pressure_pa = metrics.get("peak_chamber_pressure")
+        peak_pressure_psi = (
+            peak_pressure_pa / 6894.757 if peak_pressure_pa is not None else None
+        )
+        peak_kn = metrics.get("peak_kn")
+        average_thrust = metrics.get("average_thrust")
+        candidate = Candidate(
+            name=name,
+            metrics=metrics,
+            thrust_curve=curve,
+            apogee_ft=apogee.apogee_m * 3.28084,
+            vehicle_length_in=vehicle_len,
+            stage_length_in=stage_len,
+            stage_diameter_in=stage_diameter,
+        )
+        all_candidates.append(candidate)
+        if within_tolerance:
+            viable_candidates.append(candidate)
+        logs.append(
+            {
+                "name": name,
+                "propellant": prop_spec.name,
+                "split_ratio": split,
+                "split_ratios": plan["split_ratios"],
+                "apogee_ft": apogee.apogee_m * 3.28084,
+                "max_velocity_m_s": apogee.max_velocity_m_s,
+                "max_accel_m_s2": apogee.max_accel_m_s2,
+                "peak_pressure_psi": peak_pressure_psi,
+                "peak_kn": peak_kn,
+                "average_thrust": average_thrust,
+                "objective_reports": _objective_reports(
+                    apogee.apogee_m * 3.28084,
+                    apogee.max_velocity_m_s,
+                    targets.apogee_ft,
+                    targets.max_velocity_m_s,
+                ),
+                "objective_error_pct": float(error * 100.0),
+                "within_tolerance": within_tolerance,
+                "metrics": metrics,
+                "candidate_key": _candidate_key(name, metrics, apogee.apogee_m * 3.28084),
+                "stage_metrics": {"stage0": stage0_metrics, "stage1": stage1_metrics},
+                "artifacts": {
+                    "stage0_ric": str(stage0_ric),
+                    "stage1_ric": str(stage1_ric),
+                    "stage0_eng": str(output_root / f"{prefix}_stage0.eng"),
+                    "stage1_eng": str(output_root / f"{prefix}_stage1.eng"),
+                },
+                "artifact_urls": {
+                    "stage0_ric": _download_url(output_root, f"{prefix}_stage0.ric"),
+                    "stage1_ric": _download_url(output_root, f"{prefix}_stage1.ric"),
+                    "stage0_eng": _download_url(output_root, f"{prefix}_stage0.eng"),
+                    "stage1_eng": _download_url(output_root, f"{prefix}_stage1.eng"),
+                },
+            }
+        )
+        if progress_cb:
+            progress_cb(
                 {
+                    "last_status": "candidate",
+                    "candidates": len(all_candidates),
+                    "viable": len(viable_candidates),
                     "name": name,
                     "propellant": prop_spec.name,
                     "split_ratio": split,
                     "apogee_ft": apogee.apogee_m * 3.28084,
                     "max_velocity_m_s": apogee.max_velocity_m_s,
-                    "max_accel_m_s2": apogee.max_accel_m_s2,
-                    "peak_pressure_psi": peak_pressure_psi,
-                    "peak_kn": peak_kn,
-                    "average_thrust": average_thrust,
-                    "objective_reports": _objective_reports(
-                        apogee.apogee_m * 3.28084,
-                        apogee.max_velocity_m_s,
-                        targets.apogee_ft,
-                        targets.max_velocity_m_s,
-                    ),
                     "objective_error_pct": float(error * 100.0),
                     "within_tolerance": within_tolerance,
-                    "metrics": metrics,
-                    "candidate_key": _candidate_key(name, metrics, apogee.apogee_m * 3.28084),
-                    "stage_metrics": {"stage0": stage0_metrics, "stage1": stage1_metrics},
-                    "artifacts": {
-                        "stage0_ric": str(stage0_ric),
-                        "stage1_ric": str(stage1_ric),
-                        "stage0_eng": str(output_root / f"{prefix}_stage0.eng"),
-                        "stage1_eng": str(output_root / f"{prefix}_stage1.eng"),
-                    },
-                    "artifact_urls": {
-                        "stage0_ric": _download_url(output_root, f"{prefix}_stage0.ric"),
-                        "stage1_ric": _download_url(output_root, f"{prefix}_stage1.ric"),
-                        "stage0_eng": _download_url(output_root, f"{prefix}_stage0.eng"),
-                        "stage1_eng": _download_url(output_root, f"{prefix}_stage1.eng"),
-                    },
                 }
             )
+    for slot in reject_slots:
+        rejected.extend(slot)
+    return all_candidates, viable_candidates, logs, rejected
 
+
+def _mission_summary(
+    *,
+    targets: TrajectoryTargets,
+    constraints: TwoStageConstraints,
+    search: StageSearchConfig,
+    total_target_impulse_ns: float,
+    all_candidates: list[Candidate],
+    viable_candidates: list[Candidate],
+    logs: list[dict[str, object]],
+    rejected: list[dict[str, str]],
+    search_stats: dict[str, object],
+    propellant_screening: dict[str, object],
+    weights: ScoreWeights | None,
+    stopped: str | None = None,
+) -> dict[str, object]:
     if not all_candidates:
         return _json_safe({
             "targets": {
@@ -2054,10 +2766,13 @@ def mission_targeted_design(
             "summary": {
                 "status": "no_viable_candidates",
                 "message": "No candidates met objectives and constraints.",
+                "stopped": stopped,
             },
             "candidates": [],
             "ranked": [],
             "rejected": rejected,
+            "search_stats": search_stats,
+            "propellant_screening": propellant_screening,
         })
 
     ranked_pool = viable_candidates if viable_candidates else all_candidates
@@ -2099,10 +2814,6 @@ def mission_targeted_design(
         stage_metrics = entry.get("stage_metrics")
         if not isinstance(stage_metrics, dict):
             return False
-        if stage_count == 1:
-            return _pressure_within_tolerance(
-                stage_metrics.get("stage0") or {}, constraints, tolerance_pct=0.01
-            )
         return _pressure_within_tolerance(
             stage_metrics.get("stage0") or {}, constraints, tolerance_pct=0.01
         ) and _pressure_within_tolerance(
@@ -2111,79 +2822,6 @@ def mission_targeted_design(
 
     ranked = [entry for entry in ranked if _pressure_ok_entry(entry)]
 
-    if _iteration < _max_iterations:
-        best_entry = ranked[0] if ranked else None
-        if targets.apogee_ft and best_entry:
-            best_apogee = float(best_entry.get("apogee_ft") or 0.0)
-            target_apogee = float(targets.apogee_ft)
-            if best_apogee > 0 and best_apogee < target_apogee * (1.0 - targets.tolerance_pct):
-                scale = (target_apogee / best_apogee) ** 0.5
-                scale = max(1.1, min(scale, 2.2))
-                if total_target_impulse_ns:
-                    return mission_targeted_design_target_only(
-                        output_dir=output_dir,
-                        targets=targets,
-                        constraints=constraints,
-                        search=search,
-                        split_ratios=split_ratios,
-                        cd_max=cd_max,
-                        mach_max=mach_max,
-                        cd_ramp=cd_ramp,
-                        total_mass_kg=total_mass_kg,
-                        total_target_impulse_ns=total_target_impulse_ns * scale,
-                        separation_delay_s=separation_delay_s,
-                        ignition_delay_s=ignition_delay_s,
-                        stage_count=stage_count,
-                        velocity_calibration=velocity_calibration,
-                        fast_mode=fast_mode,
-                        vehicle_params=vehicle_params,
-                        launch_altitude_m=launch_altitude_m,
-                        wind_speed_m_s=wind_speed_m_s,
-                        temperature_k=temperature_k,
-                        rod_length_m=rod_length_m,
-                        launch_angle_deg=launch_angle_deg,
-                        ork_path=ork_path,
-                        allowed_propellant_families=allowed_propellant_families,
-                        allowed_propellant_names=allowed_propellant_names,
-                        preset_path=preset_path,
-                        weights=weights,
-                        _iteration=_iteration + 1,
-                        _max_iterations=_max_iterations,
-                    )
-        if not ranked:
-            expanded = _expand_search_for_pressure(search)
-            if expanded != search:
-                return mission_targeted_design_target_only(
-                    output_dir=output_dir,
-                    targets=targets,
-                    constraints=constraints,
-                    search=expanded,
-                    split_ratios=split_ratios,
-                    cd_max=cd_max,
-                    mach_max=mach_max,
-                    cd_ramp=cd_ramp,
-                    total_mass_kg=total_mass_kg,
-                    total_target_impulse_ns=total_target_impulse_ns,
-                    separation_delay_s=separation_delay_s,
-                    ignition_delay_s=ignition_delay_s,
-                    stage_count=stage_count,
-                    velocity_calibration=velocity_calibration,
-                    fast_mode=fast_mode,
-                    vehicle_params=vehicle_params,
-                    launch_altitude_m=launch_altitude_m,
-                    wind_speed_m_s=wind_speed_m_s,
-                    temperature_k=temperature_k,
-                    rod_length_m=rod_length_m,
-                    launch_angle_deg=launch_angle_deg,
-                    ork_path=ork_path,
-                    allowed_propellant_families=allowed_propellant_families,
-                    allowed_propellant_names=allowed_propellant_names,
-                    preset_path=preset_path,
-                    weights=weights,
-                    _iteration=_iteration + 1,
-                    _max_iterations=_max_iterations,
-                )
-
     return _json_safe({
         "targets": {
             "apogee_ft": targets.apogee_ft,
@@ -2194,17 +2832,312 @@ def mission_targeted_design(
         "search": asdict(search),
         "estimated_total_impulse_ns": total_target_impulse_ns,
         "summary": {
-            "status": "ok" if viable_candidates else "best_effort",
+            "status": "ok" if viable_candidates and not stopped else "best_effort",
             "candidate_count": len(all_candidates),
             "viable_count": len(viable_candidates),
             "rejected_count": len(rejected),
+            "stopped": stopped,
         },
         "candidates": logs,
         "ranked": ranked,
         "rejected": rejected,
+        "search_stats": search_stats,
+        "propellant_screening": propellant_screening,
+        "pareto": pareto_report(
+            ranked_pool, p_max=constraints.max_pressure_psi * 6894.757, kn_max=constraints.max_kn
+        ),
     })
 
 
+def mission_targeted_design(
+    base_ric_path: str,
+    stage1_ric_path: str | None,
+    output_dir: str,
+    rkt_path: str | None,
+    total_target_impulse_ns: float | None,
+    targets: TrajectoryTargets,
+    constraints: TwoStageConstraints,
+    search: StageSearchConfig,
+    split_ratios: list[float],
+    cd_max: float,
+    mach_max: float,
+    cd_ramp: bool,
+    total_mass_kg: float | None,
+    separation_delay_s: float,
+    ignition_delay_s: float,
+    allowed_propellant_families: list[str] | None = None,
+    allowed_propellant_names: list[str] | None = None,
+    preset_path: str | None = None,
+    weights: ScoreWeights | None = None,
+    propellant_halving: HalvingPolicy | None = None,
+    progress_cb: Callable[[dict[str, object]], None] | None = None,
+    deadline: SearchDeadline | None = None,
+) -> dict[str, object]:
+    output_root = _resolve_output_dir(output_dir)
+    propellant_specs = _load_mission_propellants(
+        preset_path, allowed_propellant_families, allowed_propellant_names
+    )
+    # Screening and the full search share one stage cache, so screened lattice points are not searched twice.
+    stage_cache: dict[tuple[object, ...], StageResult | None] = {}
+    search_stats: dict[str, object] = {"strategy": search.strategy}
+    common = dict(
+        base_ric_path=base_ric_path,
+        stage1_ric_path=stage1_ric_path,
+        rkt_path=rkt_path,
+        targets=targets,
+        constraints=constraints,
+        search=search,
+        split_ratios=split_ratios,
+        cd_max=cd_max,
+        mach_max=mach_max,
+        cd_ramp=cd_ramp,
+        total_mass_kg=total_mass_kg,
+        separation_delay_s=separation_delay_s,
+        ignition_delay_s=ignition_delay_s,
+        stage_cache=stage_cache,
+        search_stats=search_stats,
+        deadline=deadline,
+    )
+    plan, survivors = _plan_mission(
+        total_target_impulse_ns=total_target_impulse_ns,
+        propellant_specs=propellant_specs,
+        propellant_halving=propellant_halving,
+        **common,
+    )
+    all_candidates, viable_candidates, logs, rejected = _pair_mission_stages(
+        output_root=output_root,
+        total_target_impulse_ns=plan["total_target_impulse_ns"],
+        survivors=survivors,
+        progress_cb=progress_cb,
+        **common,
+    )
+    return _mission_summary(
+        targets=targets,
+        constraints=constraints,
+        search=search,
+        total_target_impulse_ns=plan["total_target_impulse_ns"],
+        all_candidates=all_candidates,
+        viable_candidates=viable_candidates,
+        logs=logs,
+        rejected=plan["rejected"] + rejected,
+        search_stats=search_stats,
+        propellant_screening=plan["propellant_screening"],
+        weights=weights,
+        stopped=deadline.reason if deadline is not None else None,
+    )
+
+
+def plan_mission_shards(
+    *,
+    base_ric_path: str,
+    stage1_ric_path: str | None,
+    rkt_path: str | None,
+    total_target_impulse_ns: float | None,
+    targets: TrajectoryTargets,
+    constraints: TwoStageConstraints,
+    search: StageSearchConfig,
+    split_ratios: list[float],
+    cd_max: float,
+    mach_max: float,
+    cd_ramp: bool,
+    total_mass_kg: float | None,
+    separation_delay_s: float,
+    ignition_delay_s: float,
+    allowed_propellant_families: list[str] | None = None,
+    allowed_propellant_names: list[str] | None = None,
+    preset_path: str | None = None,
+    propellant_halving: HalvingPolicy | None = None,
+    stage_cache: dict[tuple[object, ...], StageResult | None] | None = None,
+    stage_cache_dir: str | None = None,
+    deadline: SearchDeadline | None = None,
+) -> dict[str, object]:
+    """Resolve the impulse target and screen propellants ahead of a sharded mission run.
+
+    The returned plan is JSON-safe. Each of its ``propellant_indices`` is one shard for
+    :func:`mission_targeted_design_shard`, and the plan is passed back to :func:`reduce_mission_shards` with the
+    shard outputs. The stage searches run during screening are stored under the plan's ``stage_cache_key`` in
+    ``stage_cache_dir``, so shards on other workers start from them; a caller running the shards in-process can
+    pass its own ``stage_cache`` instead.
+    """
+    propellant_specs = _load_mission_propellants(
+        preset_path, allowed_propellant_families, allowed_propellant_names
+    )
+    stage_cache = stage_cache if stage_cache is not None else {}
+    search_stats: dict[str, object] = {"strategy": search.strategy}
+    plan, _ = _plan_mission(
+        base_ric_path=base_ric_path,
+        stage1_ric_path=stage1_ric_path,
+        rkt_path=rkt_path,
+        total_target_impulse_ns=total_target_impulse_ns,
+        targets=targets,
+        constraints=constraints,
+        search=search,
+        split_ratios=split_ratios,
+        cd_max=cd_max,
+        mach_max=mach_max,
+        cd_ramp=cd_ramp,
+        total_mass_kg=total_mass_kg,
+        separation_delay_s=separation_delay_s,
+        ignition_delay_s=ignition_delay_s,
+        propellant_specs=propellant_specs,
+        propellant_halving=propellant_halving,
+        stage_cache=stage_cache,
+        search_stats=search_stats,
+        deadline=deadline,
+    )
+    planner = JobStagePlanner(_resolve_output_dir(stage_cache_dir) if stage_cache_dir else None)
+    cache_key = _mission_stage_cache_key(
+        planner, base_ric_path, stage1_ric_path, constraints, propellant_specs
+    )
+    planner.save_mapping("mission_stages", "screening", cache_key, stage_cache, reused=0)
+    return _json_safe({**plan, "search_stats": search_stats, "stage_cache_key": cache_key})
+
+
+def _mission_stage_cache_key(
+    planner: JobStagePlanner,
+    base_ric_path: str,
+    stage1_ric_path: str | None,
+    constraints: TwoStageConstraints,
+    propellant_specs: list[PropellantSpec],
+) -> str:
+    # Stage cache entries are keyed by base spec and scales already; feasibility also depends on the constraints.
+    return planner.key(
+        "mission_stages",
+        {
+            "base_digest": file_digest(base_ric_path),
+            "stage1_digest": file_digest(stage1_ric_path),
+            "constraints": constraints,
+            "propellants": propellant_specs,
+        },
+    )
+
+
+def mission_targeted_design_shard(
+    *,
+    base_ric_path: str,
+    stage1_ric_path: str | None,
+    output_dir: str,
+    rkt_path: str | None,
+    total_target_impulse_ns: float,
+    targets: TrajectoryTargets,
+    constraints: TwoStageConstraints,
+    search: StageSearchConfig,
+    split_ratios: list[float],
+    cd_max: float,
+    mach_max: float,
+    cd_ramp: bool,
+    total_mass_kg: float | None,
+    separation_delay_s: float,
+    ignition_delay_s: float,
+    propellant_index: int,
+    allowed_propellant_families: list[str] | None = None,
+    allowed_propellant_names: list[str] | None = None,
+    preset_path: str | None = None,
+    progress_cb: Callable[[dict[str, object]], None] | None = None,
+    stage_cache: dict[tuple[object, ...], StageResult | None] | None = None,
+    stage_cache_dir: str | None = None,
+    stage_cache_key: str | None = None,
+    deadline: SearchDeadline | None = None,
+) -> dict[str, object]:
+    """Search, pair, fly and export the stage pairs of one screened propellant.
+
+    The propellant list is reloaded from the same inputs as :func:`plan_mission_shards`, so ``propellant_index``
+    picks the same propellant in any worker. The stage search starts from ``stage_cache`` when given, otherwise from
+    the screening searches the plan stored under ``stage_cache_key``. The output is JSON-safe, to be merged by
+    :func:`reduce_mission_shards`.
+    """
+    propellant_specs = _load_mission_propellants(
+        preset_path, allowed_propellant_families, allowed_propellant_names
+    )
+    if stage_cache is None:
+        planner = JobStagePlanner(_resolve_output_dir(stage_cache_dir) if stage_cache_dir else None)
+        stage_cache = planner.open_mapping("mission_stages", stage_cache_key) if stage_cache_key else {}
+    search_stats: dict[str, object] = {"strategy": search.strategy}
+    all_candidates, viable_candidates, logs, rejected = _pair_mission_stages(
+        base_ric_path=base_ric_path,
+        stage1_ric_path=stage1_ric_path,
+        output_root=_resolve_output_dir(output_dir),
+        rkt_path=rkt_path,
+        total_target_impulse_ns=total_target_impulse_ns,
+        targets=targets,
+        constraints=constraints,
+        search=search,
+        split_ratios=split_ratios,
+        cd_max=cd_max,
+        mach_max=mach_max,
+        cd_ramp=cd_ramp,
+        total_mass_kg=total_mass_kg,
+        separation_delay_s=separation_delay_s,
+        ignition_delay_s=ignition_delay_s,
+        survivors=[propellant_specs[propellant_index]],
+        stage_cache=stage_cache,
+        search_stats=search_stats,
+        progress_cb=progress_cb,
+        deadline=deadline,
+    )
+    viable_ids = {id(candidate) for candidate in viable_candidates}
+    return _json_safe(
+        {
+            "candidates": [
+                {**asdict(candidate), "viable": id(candidate) in viable_ids} for candidate in all_candidates
+            ],
+            "logs": logs,
+            "rejected": rejected,
+            "search_stats": search_stats,
+            "stopped": deadline.reason if deadline is not None else None,
+        }
+    )
+
+
+def reduce_mission_shards(
+    plan: dict[str, object],
+    shards: list[dict[str, object]],
+    *,
+    targets: TrajectoryTargets,
+    constraints: TwoStageConstraints,
+    search: StageSearchConfig,
+    weights: ScoreWeights | None = None,
+) -> dict[str, object]:
+    # Shards are merged in plan order, so the result matches mission_targeted_design on the same inputs.
+    all_candidates: list[Candidate] = []
+    viable_candidates: list[Candidate] = []
+    logs: list[dict[str, object]] = []
+    rejected: list[dict[str, str]] = list(plan["rejected"])
+    search_stats: dict[str, object] = dict(plan.get("search_stats") or {"strategy": search.strategy})
+    stopped = plan.get("stopped")
+    for shard in shards:
+        stopped = stopped or shard.get("stopped")
+        for entry in shard["candidates"]:
+            fields = {key: value for key, value in entry.items() if key != "viable"}
+            if fields.get("thrust_curve") is not None:
+                fields["thrust_curve"] = [tuple(point) for point in fields["thrust_curve"]]
+            candidate = Candidate(**fields)
+            all_candidates.append(candidate)
+            if entry.get("viable"):
+                viable_candidates.append(candidate)
+        logs.extend(shard["logs"])
+        rejected.extend(shard["rejected"])
+        for key, value in shard["search_stats"].items():
+            if isinstance(value, int) and not isinstance(value, bool):
+                search_stats[key] = int(search_stats.get(key, 0)) + value
+            else:
+                search_stats.setdefault(key, value)
+    return _mission_summary(
+        targets=targets,
+        constraints=constraints,
+        search=search,
+        total_target_impulse_ns=plan["total_target_impulse_ns"],
+        all_candidates=all_candidates,
+        viable_candidates=viable_candidates,
+        logs=logs,
+        rejected=rejected,
+        search_stats=search_stats,
+        propellant_screening=plan["propellant_screening"],
+        weights=weights,
+        stopped=stopped,
+    )
+
+
 def _default_base_spec(vehicle_params: VehicleParams, propellant: PropellantSpec) -> MotorSpec:
     diameter = max(vehicle_params.ref_diameter_m * 0.9, 0.05)
     core = diameter * 0.2
@@ -2272,16 +3205,28 @@ def mission_targeted_design_target_only(
     weights: ScoreWeights | None = None,
     stage0_length_in: float | None = None,
     stage1_length_in: float | None = None,
-    _iteration: int = 0,
+    propellant_halving: HalvingPolicy | None = None,
+    stage_cache_dir: str | None = None,
     _max_iterations: int = 7,
     progress_cb: Callable[[dict[str, object]], None] | None = None,
+    deadline: SearchDeadline | None = None,
 ) -> dict[str, object]:
-    propellant_specs = _load_propellant_specs(
-        preset_path=preset_path,
-        allowed_propellant_families=allowed_propellant_families,
-        allowed_propellant_names=allowed_propellant_names,
+    planner = JobStagePlanner(_resolve_output_dir(stage_cache_dir) if stage_cache_dir else None)
+    propellant_specs = planner.run(
+        "propellants",
+        {
+            "preset_path": preset_path,
+            "preset_digest": file_digest(preset_path),
+            "default_digest": file_digest(_DEFAULT_PRESETS_PATH),
+            "families": allowed_propellant_families,
+            "names": allowed_propellant_names,
+        },
+        lambda: _load_propellant_specs(
+            preset_path=preset_path,
+            allowed_propellant_families=allowed_propellant_families,
+            allowed_propellant_names=allowed_propellant_names,
+        ),
     )
-    effective_stage_ratio = max(constraints.max_stage_length_ratio, _RELAXED_STAGE_LENGTH_RATIO)
 
     if total_mass_kg is None or total_mass_kg <= 0:
         raise RuntimeError("total_mass_kg (dry mass) is required for target-only runs.")
@@ -2348,8 +3293,7 @@ def mission_targeted_design_target_only(
 
     # Replace grid search with SmartNozzleArchitect volume-first search.
     architect = SmartNozzleArchitect()
-    winners: list[dict[str, object]] = []
-    rejected: list[dict[str, str]] = []
+    session = TargetSearchSession(max_iterations=_max_iterations)
     max_length_in = constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT)
     stage_length_tolerance_in = 6.0
     stage0_target_in = stage0_length_in if stage0_length_in and stage0_length_in > 0 else None
@@ -2394,82 +3338,77 @@ def mission_targeted_design_target_only(
     pressure_limit = constraints.max_pressure_psi * 1.06
     kn_limit = constraints.max_kn * 1.06
 
-    for prop_spec in propellant_specs:
-        try:
-            if stage_count == 1:
-                def _simulate_apogee(spec: MotorSpec, metrics: dict[str, float]):
-                    total_mass_for_sim = _total_mass_from_dry(dry_mass_kg, metrics)
-                    return simulate_single_stage_apogee_params(
-                        stage=spec,
-                        ref_diameter_m=vehicle_params.ref_diameter_m,
-                        total_mass_kg=total_mass_for_sim,
-                        cd_max=cd_max,
-                        mach_max=mach_max,
-                        cd_ramp=cd_ramp,
-                        launch_altitude_m=launch_altitude_m,
-                        wind_speed_m_s=wind_speed_m_s,
-                        temperature_k=temperature_k,
-                        rod_length_m=rod_length_m,
-                        launch_angle_deg=launch_angle_deg,
-                    )
-                results = architect.find_optimal_motor(
-                    target_apogee_ft=targets.apogee_ft,
-                    dry_mass_lbs=dry_mass_lbs,
-                    max_pressure_psi=constraints.max_pressure_psi,
-                    rocket_dims=rocket_dims,
-                    propellant=prop_spec,
-                    base_spec=base_spec,
-                    simulate_apogee=_simulate_apogee,
-                    required_impulse_ns=total_target_impulse_ns,
-                    progress_cb=progress_cb,
-                    stage_length_target_in=stage0_target_in,
-                    stage_length_tolerance_in=stage_length_tolerance_in,
-                    max_checks=1500,
-                )
-            else:
-                def _simulate_apogee(spec: MotorSpec, metrics: dict[str, float]):
-                    prop_mass = metrics.get("propellant_mass", 0.0)
-                    total_mass_for_sim = max(dry_mass_kg + (prop_mass * 2.0), 1e-6)
-                    stage0_dry, stage1_dry = _split_stage_dry_masses(
-                        total_mass_for_sim, prop_mass, prop_mass
-                    )
-                    return simulate_two_stage_apogee_params(
-                        stage0=spec,
-                        stage1=spec,
-                        ref_diameter_m=vehicle_params.ref_diameter_m,
-                        stage0_dry_kg=stage0_dry,
-                        stage1_dry_kg=stage1_dry,
-                        cd_max=cd_max,
-                        mach_max=mach_max,
-                        cd_ramp=cd_ramp,
-                        separation_delay_s=separation_delay_s,
-                        ignition_delay_s=ignition_delay_s,
-                        total_mass_kg=None,
-                        launch_altitude_m=launch_altitude_m,
-                        wind_speed_m_s=wind_speed_m_s,
-                        temperature_k=temperature_k,
-                        rod_length_m=rod_length_m,
-                        launch_angle_deg=launch_angle_deg,
-                    )
+    if stage_count == 1:
+        def _simulate_apogee(spec: MotorSpec, metrics: dict[str, float]):
+            total_mass_for_sim = _total_mass_from_dry(dry_mass_kg, metrics)
+            return simulate_single_stage_apogee_params(
+                stage=spec,
+                ref_diameter_m=vehicle_params.ref_diameter_m,
+                total_mass_kg=total_mass_for_sim,
+                cd_max=cd_max,
+                mach_max=mach_max,
+                cd_ramp=cd_ramp,
+                launch_altitude_m=launch_altitude_m,
+                wind_speed_m_s=wind_speed_m_s,
+                temperature_k=temperature_k,
+                rod_length_m=rod_length_m,
+                launch_angle_deg=launch_angle_deg,
+            )
+    else:
+        def _simulate_apogee(spec: MotorSpec, metrics: dict[str, float]):
+            prop_mass = metrics.get("propellant_mass", 0.0)
+            total_mass_for_sim = max(dry_mass_kg + (prop_mass * 2.0), 1e-6)
+            stage0_dry, stage1_dry = _split_stage_dry_masses(
+                total_mass_for_sim, prop_mass, prop_mass
+            )
+            return simulate_two_stage_apogee_params(
+                stage0=spec,
+                stage1=spec,
+                ref_diameter_m=vehicle_params.ref_diameter_m,
+                stage0_dry_kg=stage0_dry,
+                stage1_dry_kg=stage1_dry,
+                cd_max=cd_max,
+                mach_max=mach_max,
+                cd_ramp=cd_ramp,
+                separation_delay_s=separation_delay_s,
+                ignition_delay_s=ignition_delay_s,
+                total_mass_kg=None,
+                launch_altitude_m=launch_altitude_m,
+                wind_speed_m_s=wind_speed_m_s,
+                temperature_k=temperature_k,
+                rod_length_m=rod_length_m,
+                launch_angle_deg=launch_angle_deg,
+            )
+
+    def _progress_stage(stage_label: str):
+        def _cb(payload: dict[str, object]) -> None:
+            if progress_cb:
+                progress_cb({**payload, "stage": stage_label})
+        return _cb
+
+    def _sweep(
+        target_impulse_ns: float | None,
+        survivors: list[PropellantSpec],
+        screening_rejected: list[dict[str, str]],
+    ) -> tuple[list[dict[str, object]], list[dict[str, str]]]:
+        winners: list[dict[str, object]] = []
+        rejected = list(screening_rejected)
+        for prop_spec in survivors:
+            if deadline is not None and deadline.should_stop():
+                break
+            try:
                 if stage_specific_lengths:
                     split_ratio = split_ratios[0] if split_ratios else 0.5
                     stage0_impulse = (
-                        total_target_impulse_ns * split_ratio
-                        if total_target_impulse_ns
+                        target_impulse_ns * split_ratio
+                        if target_impulse_ns
                         else None
                     )
                     stage1_impulse = (
-                        total_target_impulse_ns * (1.0 - split_ratio)
-                        if total_target_impulse_ns
+                        target_impulse_ns * (1.0 - split_ratio)
+                        if target_impulse_ns
                         else None
                     )
-
-                    def _progress_stage(stage_label: str):
-                        def _cb(payload: dict[str, object]) -> None:
-                            if progress_cb:
-                                progress_cb({**payload, "stage": stage_label})
-                        return _cb
-
                     stage0_results = architect.find_optimal_motor(
                         target_apogee_ft=targets.apogee_ft,
                         dry_mass_lbs=dry_mass_lbs,
@@ -2483,6 +3422,8 @@ def mission_targeted_design_target_only(
                         stage_length_target_in=stage0_target_in,
                         stage_length_tolerance_in=stage_length_tolerance_in,
                         max_checks=1500,
+                        sim_cache=session.sim_cache,
+                        deadline=deadline,
                     )
                     if not stage0_results:
                         rejected.append(
@@ -2509,6 +3450,8 @@ def mission_targeted_design_target_only(
                         stage_length_target_in=stage1_target_in,
                         stage_length_tolerance_in=stage_length_tolerance_in,
                         max_checks=1500,
+                        sim_cache=session.sim_cache,
+                        deadline=deadline,
                     )
                     if stage0_results and stage1_results:
                         winners.append(
@@ -2535,35 +3478,218 @@ def mission_targeted_design_target_only(
                     propellant=prop_spec,
                     base_spec=base_spec,
                     simulate_apogee=_simulate_apogee,
-                    required_impulse_ns=total_target_impulse_ns,
+                    required_impulse_ns=target_impulse_ns,
                     progress_cb=progress_cb,
                     stage_length_target_in=stage0_target_in,
                     stage_length_tolerance_in=stage_length_tolerance_in,
                     max_checks=1500,
+                    sim_cache=session.sim_cache,
+                    deadline=deadline,
                 )
-        except Exception as exc:
-            rejected.append({"propellant": prop_spec.name, "reason": str(exc)})
-            continue
-        for result in results:
-            winners.append({"propellant": prop_spec.name, "result": result})
+            except Exception as exc:
+                rejected.append({"propellant": prop_spec.name, "reason": str(exc)})
+                continue
+            for result in results:
+                winners.append({"propellant": prop_spec.name, "result": result})
+        return winners, rejected
 
-    if not winners:
-        # Fallback: return a baseline candidate to avoid empty UI.
+    def _best_winner_apogee(winners: list[dict[str, object]], target_impulse_ns: float | None) -> float | None:
+        # Fly only the winner closest to the impulse target and keep its apogee on the result.
+        if not targets.apogee_ft or stage_specific_lengths:
+            return None
+        scored = [
+            (idx, item["result"])
+            for idx, item in enumerate(winners)
+            if item["result"].status == "success"
+        ]
+        if not scored:
+            return None
+        idx, result = min(
+            scored,
+            key=lambda entry: abs(entry[1].metrics.get("total_impulse", 0.0) - (target_impulse_ns or 0.0)),
+        )
+        if result.apogee_ft is None:
+            cache_key = _base_spec_cache_key(result.spec)
+            if cache_key not in session.apogee_cache:
+                try:
+                    apogee = _simulate_apogee(result.spec, result.metrics)
+                except Exception:
+                    return None
+                session.apogee_cache[cache_key] = (apogee.apogee_m * 3.28084, apogee.max_velocity_m_s)
+            apogee_ft, max_velocity_m_s = session.apogee_cache[cache_key]
+            result = replace(result, apogee_ft=apogee_ft, max_velocity_m_s=max_velocity_m_s)
+            winners[idx] = {**winners[idx], "result": result}
+        return result.apogee_ft
+
+    def _screen_propellant(prop_spec: PropellantSpec, fidelity: float) -> float | None:
+        # A partial run of the architect: it walks the same geometries in the same order with fewer checks, and
+        # the session cache means the full run later only pays for the geometries beyond the screened prefix.
+        screen_impulse = total_target_impulse_ns
+        if stage_specific_lengths and total_target_impulse_ns:
+            screen_impulse = total_target_impulse_ns * (split_ratios[0] if split_ratios else 0.5)
         try:
-            _, base_metrics = simulate_motorlib_with_result(base_spec)
-            fallback_candidate = Candidate(
-                name=f"{seed_prop.name} baseline",
-                metrics=_single_stage_metric_dict(base_metrics, constraints),
-                thrust_curve=None,
-                apogee_ft=None,
-                vehicle_length_in=vehicle_params.rocket_length_in,
-                stage_length_in=_stage_length_in(base_spec),
-                stage_diameter_in=_stage_diameter_in(base_spec),
+            results = architect.find_optimal_motor(
+                target_apogee_ft=targets.apogee_ft,
+                dry_mass_lbs=dry_mass_lbs,
+                max_pressure_psi=constraints.max_pressure_psi,
+                rocket_dims=rocket_dims,
+                propellant=prop_spec,
+                base_spec=base_spec,
+                simulate_apogee=_simulate_apogee,
+                required_impulse_ns=screen_impulse,
+                progress_cb=_progress_stage("screening"),
+                stage_length_target_in=stage0_target_in,
+                stage_length_tolerance_in=stage_length_tolerance_in,
+                max_checks=max(1, int(1500 * fidelity)),
+                sim_cache=session.sim_cache,
+                deadline=deadline,
             )
-            logs = [
-                {
-                    "name": fallback_candidate.name,
-                    "propellant": seed_prop.name,
+        except Exception:
+            return None
+        return _architect_screen_loss(results, screen_impulse)
+
+    # Motor metrics only depend on the propellant, the base motor and the pressure limit, so each propellant's
+    # simulations are cached on their own and survive changes to the propellant list or the launch conditions.
+    # Names repeat across propellant libraries, so a repeated name gets a numbered stage of its own and the cached
+    # simulations are split by the full propellant key.
+    grid_stages: list[tuple[str, tuple[object, ...], str, int]] = []
+    name_counts: dict[str, int] = {}
+    for prop_spec in propellant_specs:
+        count = name_counts[prop_spec.name] = name_counts.get(prop_spec.name, 0) + 1
+        part = prop_spec.name if count == 1 else f"{prop_spec.name} #{count}"
+        grid_key = planner.key(
+            f"stage_grid.{part}",
+            {"base": replace(base_spec, propellant=prop_spec), "max_pressure_psi": constraints.max_pressure_psi},
+        )
+        cached_sims = planner.open_mapping("stage_grid", grid_key)
+        session.sim_cache.update(cached_sims)
+        grid_stages.append((part, propellant_key(prop_spec), grid_key, len(cached_sims)))
+    trajectory_key = planner.key(
+        "trajectory",
+        {
+            "stage_count": stage_count,
+            "dry_mass_kg": dry_mass_kg,
+            "ref_diameter_m": vehicle_params.ref_diameter_m,
+            "cd_max": cd_max,
+            "mach_max": mach_max,
+            "cd_ramp": cd_ramp,
+            "separation_delay_s": separation_delay_s,
+            "ignition_delay_s": ignition_delay_s,
+            "launch_altitude_m": launch_altitude_m,
+            "wind_speed_m_s": wind_speed_m_s,
+            "temperature_k": temperature_k,
+            "rod_length_m": rod_length_m,
+            "launch_angle_deg": launch_angle_deg,
+        },
+        depends_on=("propellants",),
+    )
+    cached_apogees = planner.open_mapping("trajectory", trajectory_key)
+    session.apogee_cache.update(cached_apogees)
+
+    def _search() -> dict[str, object]:
+        impulse_ns = total_target_impulse_ns
+        screening = successive_halving(
+            propellant_specs,
+            _screen_propellant,
+            label=lambda prop_spec: prop_spec.name,
+            policy=propellant_halving,
+        )
+        screening_rejected = [
+            {
+                "propellant": propellant_specs[idx].name,
+                "reason": "eliminated_by_screening",
+                "round": str(round_info["round"]),
+            }
+            for round_info in screening.rounds
+            for idx in round_info["eliminated"]
+        ]
+        # Re-iterate with a rescaled impulse target while the best motor falls short of the apogee target. The
+        # session keeps every simulated motor, so later passes only pay for geometries they have not seen yet.
+        while True:
+            winners, rejected = _sweep(impulse_ns, screening.survivors, screening_rejected)
+            best_apogee_ft = _best_winner_apogee(winners, impulse_ns)
+            session.record_iteration(
+                target_impulse_ns=impulse_ns,
+                winner_count=len(winners),
+                best_apogee_ft=best_apogee_ft,
+            )
+            if deadline is not None and deadline.should_stop():
+                break
+            next_impulse = session.next_target_impulse(
+                impulse_ns, best_apogee_ft, targets.apogee_ft, targets.tolerance_pct
+            )
+            if next_impulse is None:
+                break
+            impulse_ns = next_impulse
+        return {
+            "stopped": deadline.reason if deadline is not None else None,
+            "winners": winners,
+            "rejected": rejected,
+            "iterations": session.iterations,
+            "total_target_impulse_ns": impulse_ns,
+            "propellant_screening": {
+                "rounds": screening.rounds,
+                "survivors": [prop_spec.name for prop_spec in screening.survivors],
+            },
+        }
+
+    search_outcome = planner.run(
+        "pairing",
+        {
+            "targets": targets,
+            "constraints": constraints,
+            "split_ratios": split_ratios,
+            "total_target_impulse_ns": total_target_impulse_ns,
+            "velocity_calibration": velocity_calibration,
+            "stage0_length_in": stage0_target_in,
+            "stage1_length_in": stage1_target_in,
+            "rocket_dims": [rocket_dims, rocket_dims_stage1],
+            "architect": architect.config,
+            "propellant_halving": propellant_halving,
+            "max_iterations": _max_iterations,
+        },
+        _search,
+        depends_on=(*(f"stage_grid.{part}" for part, _, _, _ in grid_stages), "trajectory"),
+        # A search cut short by a deadline or a cancellation must not be replayed for a later identical job.
+        cache_if=lambda outcome: not outcome.get("stopped"),
+    )
+    winners = search_outcome["winners"]
+    rejected = search_outcome["rejected"]
+    total_target_impulse_ns = search_outcome["total_target_impulse_ns"]
+    propellant_screening = search_outcome["propellant_screening"]
+    stopped = search_outcome.get("stopped")
+    if planner.report["pairing"]["status"] == "hit":
+        session.iterations = list(search_outcome["iterations"])
+    for part, prop_key, grid_key, reused in grid_stages:
+        planner.save_mapping(
+            "stage_grid",
+            part,
+            grid_key,
+            {key: metrics for key, metrics in session.sim_cache.items() if key[0] == prop_key},
+            reused,
+        )
+    planner.save_mapping("trajectory", "apogee", trajectory_key, session.apogee_cache, len(cached_apogees))
+    # Scoring writes this job's artifacts, so it always runs; its key still records what it was scored against.
+    planner.key("scoring", {"tolerance_pct": targets.tolerance_pct}, depends_on=("pairing",))
+    planner.mark("scoring", "miss")
+
+    if not winners:
+        # Fallback: return a baseline candidate to avoid empty UI.
+        try:
+            _, base_metrics = simulate_motorlib_with_result(base_spec)
+            fallback_candidate = Candidate(
+                name=f"{seed_prop.name} baseline",
+                metrics=_single_stage_metric_dict(base_metrics, constraints),
+                thrust_curve=None,
+                apogee_ft=None,
+                vehicle_length_in=vehicle_params.rocket_length_in,
+                stage_length_in=_stage_length_in(base_spec),
+                stage_diameter_in=_stage_diameter_in(base_spec),
+            )
+            logs = [
+                {
+                    "name": fallback_candidate.name,
+                    "propellant": seed_prop.name,
                     "apogee_ft": None,
                     "max_velocity_m_s": None,
                     "objective_reports": [],
@@ -2603,11 +3729,15 @@ def mission_targeted_design_target_only(
                         "candidate_count": 1,
                         "viable_count": 0,
                         "rejected_count": len(rejected),
+                        "stopped": stopped,
                     },
                     "openrocket": None,
                     "candidates": logs,
                     "ranked": ranked,
                     "rejected": rejected,
+                    "search_session": session.summary(),
+                    "propellant_screening": propellant_screening,
+                    "stage_plan": planner.report,
                 }
             )
         except Exception:
@@ -2626,11 +3756,15 @@ def mission_targeted_design_target_only(
                         "candidate_count": 0,
                         "viable_count": 0,
                         "rejected_count": len(rejected),
+                        "stopped": stopped,
                     },
                     "openrocket": None,
                     "candidates": [],
                     "ranked": [],
                     "rejected": rejected,
+                    "search_session": session.summary(),
+                    "propellant_screening": propellant_screening,
+                    "stage_plan": planner.report,
                 }
             )
 
@@ -2643,7 +3777,8 @@ def mission_targeted_design_target_only(
     else:
         winners.sort(
             key=lambda item: (
-                abs(item["result"].apogee_ft - targets.apogee_ft),
+                item["result"].apogee_ft is None,
+                abs((item["result"].apogee_ft or 0.0) - (targets.apogee_ft or 0.0)),
                 item["result"].stage_length_in,
             )
         )
@@ -2983,848 +4118,27 @@ def mission_targeted_design_target_only(
             "search": asdict(search),
             "estimated_total_impulse_ns": total_target_impulse_ns,
             "summary": {
-                "status": "ok" if viable_candidates else "best_effort",
+                "status": "ok" if viable_candidates and not stopped else "best_effort",
                 "candidate_count": len(all_candidates),
                 "viable_count": len(viable_candidates),
                 "rejected_count": len(rejected),
+                "stopped": stopped,
             },
             "openrocket": None,
             "candidates": logs,
             "ranked": ranked,
             "rejected": rejected,
+            "search_session": session.summary(),
+            "propellant_screening": propellant_screening,
+            "stage_plan": planner.report,
+            "pareto": pareto_report(
+                viable_candidates or all_candidates,
+                p_max=constraints.max_pressure_psi * 6894.757,
+                kn_max=constraints.max_kn,
+            ),
         }
     )
 
-    viable_candidates: list[Candidate] = []
-    all_candidates: list[Candidate] = []
-    logs: list[dict[str, object]] = []
-    rejected: list[dict[str, str]] = []
-    stage_cache: dict[tuple[object, ...], StageResult | None] = {}
-
-    for prop_spec in propellant_specs:
-        if stage_count == 1:
-            prop_base = MotorSpec(
-                config=base_spec.config,
-                propellant=prop_spec,
-                grains=base_spec.grains,
-                nozzle=base_spec.nozzle,
-            )
-            prop_base = _normalize_spec_for_motorlib(prop_base)
-            try:
-                grid = _build_stage_grid(
-                    prop_base,
-                    search,
-                    constraints,
-                    reject_log=rejected,
-                    reject_context={"propellant": prop_spec.name},
-                    cache=stage_cache,
-                )
-            except Exception as exc:
-                rejected.append({"propellant": prop_spec.name, "reason": str(exc)})
-                continue
-            if not grid:
-                rejected.append({"propellant": prop_spec.name, "reason": "no_feasible_stage"})
-                continue
-            top_k = 3 if fast_mode else 5
-            ranked = sorted(
-                grid,
-                key=lambda stage: abs(stage.metrics["total_impulse"] - total_target_impulse_ns),
-            )[:top_k]
-            best_stage = None
-            best_stage_metrics = None
-            best_apogee = None
-            best_error = None
-            for idx, stage in enumerate(ranked):
-                stage_len = _stage_length_in(stage.spec)
-                if stage_len > constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT):
-                    continue
-                try:
-                    temp_ric = out_dir / f"_candidate_{_slugify_name(prop_spec.name)}_{idx}.ric"
-                    temp_ric.write_text(build_ric(stage.spec), encoding="utf-8")
-                    stage_metrics = _stage_metrics_from_ric_or_spec(stage, temp_ric)
-                    if not _pressure_within_tolerance(stage_metrics, constraints, tolerance_pct=0.01):
-                        rejected.append(
-                            {
-                                "propellant": prop_spec.name,
-                                "reason": "pressure_outside_tolerance",
-                                "detail": "single_stage_peak_pressure",
-                            }
-                        )
-                        continue
-                    total_mass_for_sim = _total_mass_from_dry(dry_mass_kg, stage_metrics)
-                    apogee = simulate_single_stage_apogee_params(
-                        stage=stage.spec,
-                        ref_diameter_m=vehicle_params.ref_diameter_m,
-                        total_mass_kg=total_mass_for_sim,
-                        cd_max=cd_max,
-                        mach_max=mach_max,
-                        cd_ramp=cd_ramp,
-                        launch_altitude_m=launch_altitude_m,
-                        wind_speed_m_s=wind_speed_m_s,
-                        temperature_k=temperature_k,
-                        rod_length_m=rod_length_m,
-                        launch_angle_deg=launch_angle_deg,
-                    )
-                except Exception as exc:
-                    rejected.append(
-                        {"propellant": prop_spec.name, "reason": "simulation_failed", "detail": str(exc)}
-                    )
-                    continue
-                if not (
-                    apogee.apogee_m == apogee.apogee_m
-                    and apogee.max_velocity_m_s == apogee.max_velocity_m_s
-                ):
-                    rejected.append(
-                        {
-                            "propellant": prop_spec.name,
-                            "reason": "simulation_failed",
-                            "detail": "NaN in trajectory output",
-                        }
-                    )
-                    continue
-                calibrated_velocity = apogee.max_velocity_m_s * velocity_calibration
-                error = _objective_error_pct_max(
-                    apogee.apogee_m * 3.28084,
-                    calibrated_velocity,
-                    targets.apogee_ft,
-                    targets.max_velocity_m_s,
-                )
-                if error is None:
-                    rejected.append({"propellant": prop_spec.name, "reason": "no_objectives_provided"})
-                    continue
-                if best_error is None or error < best_error:
-                    best_error = error
-                    best_stage = stage
-                    best_stage_metrics = stage_metrics
-                    best_apogee = apogee
-            if best_stage is None or best_apogee is None or best_error is None:
-                rejected.append({"propellant": prop_spec.name, "reason": "no_viable_simulation"})
-                continue
-
-            stage_len = _stage_length_in(best_stage.spec)
-            calibrated_velocity = best_apogee.max_velocity_m_s * velocity_calibration
-            within_tolerance = bool(
-                best_error <= targets.tolerance_pct
-                and _within_max_targets(
-                    best_apogee.apogee_m * 3.28084,
-                    calibrated_velocity,
-                    targets.apogee_ft,
-                    targets.max_velocity_m_s,
-                )
-            )
-            if not within_tolerance:
-                rejected.append(
-                    {
-                        "propellant": prop_spec.name,
-                        "reason": "objective_outside_tolerance",
-                        "detail": f"error_pct={best_error * 100.0:.2f}",
-                    }
-                )
-
-            prefix = f"mission_{_slugify_name(prop_spec.name)}"
-            steps, _ = simulate_motorlib_with_result(best_stage.spec)
-            eng = build_eng(best_stage.spec, steps, designation=prefix, manufacturer="openmotor-ai")
-            ric_out = out_dir / f"{prefix}.ric"
-            eng_out = out_dir / f"{prefix}.eng"
-            ric_out.write_text(build_ric(best_stage.spec), encoding="utf-8")
-            eng_out.write_text(export_eng(eng), encoding="utf-8")
-
-            stage_metrics = best_stage_metrics or _stage_metrics_from_ric_or_spec(best_stage, ric_out)
-            metrics = _single_stage_metric_dict(stage_metrics, constraints)
-            metrics["max_velocity_m_s"] = calibrated_velocity
-            curve = _build_single_stage_thrust_curve_from_ric(ric_out)
-            if not curve:
-                curve = _build_single_stage_thrust_curve(best_stage)
-            vehicle_len = vehicle_params.rocket_length_in
-            stage_diameter = _stage_diameter_in(best_stage.spec)
-            name = f"{prop_spec.name} single stage"
-            candidate = Candidate(
-                name=name,
-                metrics=metrics,
-                thrust_curve=curve,
-                apogee_ft=best_apogee.apogee_m * 3.28084,
-                vehicle_length_in=vehicle_len,
-                stage_length_in=stage_len,
-                stage_diameter_in=stage_diameter,
-            )
-            all_candidates.append(candidate)
-            if within_tolerance:
-                viable_candidates.append(candidate)
-            logs.append(
-                {
-                    "name": name,
-                    "propellant": prop_spec.name,
-                    "apogee_ft": best_apogee.apogee_m * 3.28084,
-                    "max_velocity_m_s": calibrated_velocity,
-                    "max_velocity_m_s_raw": best_apogee.max_velocity_m_s,
-                    "max_accel_m_s2": best_apogee.max_accel_m_s2,
-                    "objective_reports": _objective_reports(
-                        best_apogee.apogee_m * 3.28084,
-                        calibrated_velocity,
-                        targets.apogee_ft,
-                        targets.max_velocity_m_s,
-                    ),
-                    "objective_error_pct": float(best_error * 100.0),
-                    "within_tolerance": within_tolerance,
-                    "metrics": metrics,
-                    "candidate_key": _candidate_key(name, metrics, best_apogee.apogee_m * 3.28084),
-                    "stage_metrics": {"stage0": stage_metrics},
-                    "artifacts": {
-                        "ric": str(ric_out),
-                        "eng": str(eng_out),
-                    },
-                }
-            )
-        else:
-            prop_base0 = MotorSpec(
-                config=base_spec.config,
-                propellant=prop_spec,
-                grains=base_spec.grains,
-                nozzle=base_spec.nozzle,
-            )
-            prop_base1 = MotorSpec(
-                config=base_spec.config,
-                propellant=prop_spec,
-                grains=base_spec.grains,
-                nozzle=base_spec.nozzle,
-            )
-            prop_base0 = _normalize_spec_for_motorlib(prop_base0)
-            prop_base1 = _normalize_spec_for_motorlib(prop_base1)
-            best_refine: dict[str, object] | None = None
-            try:
-                grid0 = _build_stage_grid(
-                    prop_base0,
-                    search,
-                    constraints,
-                    reject_log=rejected,
-                    reject_context={"propellant": prop_spec.name},
-                    cache=stage_cache,
-                )
-            except Exception as exc:
-                rejected.append({"propellant": prop_spec.name, "reason": str(exc)})
-                continue
-            if not grid0:
-                rejected.append({"propellant": prop_spec.name, "reason": "no_feasible_stage_pair"})
-                continue
-            grid_by_diameter = _group_grid_by_diameter(grid0)
-            for split in split_ratios:
-                stage0_target = total_target_impulse_ns * split
-                stage1_target = total_target_impulse_ns * (1.0 - split)
-                for diameter_key, grid_items in grid_by_diameter.items():
-                    stage0 = _select_best_stage_for_target(grid_items, stage0_target)
-                    stage1 = _select_best_stage_for_target(grid_items, stage1_target, exclude=stage0)
-                    if stage0 is None or stage1 is None:
-                        continue
-                    if _stages_too_similar(stage0, stage1):
-                        continue
-
-                    stage0_len = _stage_length_in(stage0.spec)
-                    stage1_len = _stage_length_in(stage1.spec)
-                    if stage0_len + stage1_len > constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT):
-                        rejected.append(
-                            {
-                                "propellant": prop_spec.name,
-                                "split_ratio": split,
-                                "reason": "motor exceeds vehicle length",
-                            }
-                        )
-                        continue
-
-                    length_ratio = max(stage0_len, stage1_len) / max(min(stage0_len, stage1_len), 1e-6)
-                    if length_ratio > effective_stage_ratio:
-                        rejected.append(
-                            {
-                                "propellant": prop_spec.name,
-                                "split_ratio": split,
-                                "reason": "stage length ratio too large",
-                            }
-                        )
-                        continue
-
-
-                    try:
-                        temp_stage0 = (
-                            out_dir
-                            / f"_candidate_{_slugify_name(prop_spec.name)}_{int(split * 100)}_{diameter_key}_s0.ric"
-                        )
-                        temp_stage1 = (
-                            out_dir
-                            / f"_candidate_{_slugify_name(prop_spec.name)}_{int(split * 100)}_{diameter_key}_s1.ric"
-                        )
-                        temp_stage0.write_text(build_ric(stage0.spec), encoding="utf-8")
-                        temp_stage1.write_text(build_ric(stage1.spec), encoding="utf-8")
-                        stage0_metrics = _stage_metrics_from_ric_or_spec(stage0, temp_stage0)
-                        stage1_metrics = _stage_metrics_from_ric_or_spec(stage1, temp_stage1)
-                        if not (
-                            _pressure_within_tolerance(stage0_metrics, constraints, tolerance_pct=0.01)
-                            and _pressure_within_tolerance(stage1_metrics, constraints, tolerance_pct=0.01)
-                        ):
-                            rejected.append(
-                                {
-                                    "propellant": prop_spec.name,
-                                    "split_ratio": split,
-                                    "reason": "pressure_outside_tolerance",
-                                }
-                            )
-                            continue
-                        total_mass_for_sim = _total_mass_from_dry(
-                            dry_mass_kg, stage0_metrics, stage1_metrics
-                        )
-                        prop0 = stage0_metrics.get("propellant_mass", 0.0)
-                        prop1 = stage1_metrics.get("propellant_mass", 0.0)
-                        stage0_dry, stage1_dry = _split_stage_dry_masses(
-                            total_mass_for_sim, prop0, prop1
-                        )
-                        apogee = simulate_two_stage_apogee_params(
-                            stage0=stage0.spec,
-                            stage1=stage1.spec,
-                            ref_diameter_m=vehicle_params.ref_diameter_m,
-                            stage0_dry_kg=stage0_dry,
-                            stage1_dry_kg=stage1_dry,
-                            cd_max=cd_max,
-                            mach_max=mach_max,
-                            cd_ramp=cd_ramp,
-                            separation_delay_s=separation_delay_s,
-                            ignition_delay_s=ignition_delay_s,
-                            total_mass_kg=None,
-                            launch_altitude_m=launch_altitude_m,
-                            wind_speed_m_s=wind_speed_m_s,
-                            temperature_k=temperature_k,
-                            rod_length_m=rod_length_m,
-                            launch_angle_deg=launch_angle_deg,
-                        )
-                    except Exception as exc:
-                        rejected.append(
-                            {
-                                "propellant": prop_spec.name,
-                                "split_ratio": split,
-                                "reason": "simulation_failed",
-                                "detail": str(exc),
-                            }
-                        )
-                        continue
-                    if not (
-                        apogee.apogee_m == apogee.apogee_m
-                        and apogee.max_velocity_m_s == apogee.max_velocity_m_s
-                    ):
-                        rejected.append(
-                            {
-                                "propellant": prop_spec.name,
-                                "split_ratio": split,
-                                "reason": "simulation_failed",
-                                "detail": "NaN in trajectory output",
-                            }
-                        )
-                        continue
-
-                    calibrated_velocity = apogee.max_velocity_m_s * velocity_calibration
-                    error = _objective_error_pct_max(
-                        apogee.apogee_m * 3.28084,
-                        calibrated_velocity,
-                        targets.apogee_ft,
-                        targets.max_velocity_m_s,
-                    )
-                    if error is None:
-                        rejected.append({"propellant": prop_spec.name, "reason": "no_objectives_provided"})
-                        continue
-
-                    within_tolerance = bool(
-                        error <= targets.tolerance_pct
-                        and _within_max_targets(
-                            apogee.apogee_m * 3.28084,
-                            calibrated_velocity,
-                            targets.apogee_ft,
-                            targets.max_velocity_m_s,
-                        )
-                    )
-                    if not within_tolerance:
-                        rejected.append(
-                            {
-                                "propellant": prop_spec.name,
-                                "split_ratio": split,
-                                "reason": "objective_outside_tolerance",
-                                "detail": f"error_pct={error * 100.0:.2f}",
-                            }
-                        )
-
-                    prefix = f"mission_{_slugify_name(prop_spec.name)}_{int(split * 100)}"
-                    steps0, _ = simulate_motorlib_with_result(stage0.spec)
-                    steps1, _ = simulate_motorlib_with_result(stage1.spec)
-                    eng0 = build_eng(
-                        stage0.spec, steps0, designation=f"{prefix}-S0", manufacturer="openmotor-ai"
-                    )
-                    eng1 = build_eng(
-                        stage1.spec, steps1, designation=f"{prefix}-S1", manufacturer="openmotor-ai"
-                    )
-                    stage0_ric_out = out_dir / f"{prefix}_stage0.ric"
-                    stage1_ric_out = out_dir / f"{prefix}_stage1.ric"
-                    stage0_eng_out = out_dir / f"{prefix}_stage0.eng"
-                    stage1_eng_out = out_dir / f"{prefix}_stage1.eng"
-                    stage0_ric_out.write_text(build_ric(stage0.spec), encoding="utf-8")
-                    stage1_ric_out.write_text(build_ric(stage1.spec), encoding="utf-8")
-                    stage0_eng_out.write_text(export_eng(eng0), encoding="utf-8")
-                    stage1_eng_out.write_text(export_eng(eng1), encoding="utf-8")
-
-                    stage0_metrics = _stage_metrics_from_ric_or_spec(stage0, stage0_ric_out)
-                    stage1_metrics = _stage_metrics_from_ric_or_spec(stage1, stage1_ric_out)
-                    metrics = _combine_metric_dicts(stage0_metrics, stage1_metrics, constraints)
-                    metrics["max_velocity_m_s"] = calibrated_velocity
-                    curve = _build_thrust_curve_from_ric_paths(
-                        stage0_ric_out, stage1_ric_out, separation_delay_s, ignition_delay_s
-                    )
-                    if not curve:
-                        curve = _build_thrust_curve(stage0, stage1, separation_delay_s, ignition_delay_s)
-                    vehicle_len = vehicle_params.rocket_length_in
-                    stage_diameter = _stage_diameter_in(stage0.spec)
-                    name = f"{prop_spec.name} two stage"
-                    candidate = Candidate(
-                        name=name,
-                        metrics=metrics,
-                        thrust_curve=curve,
-                        apogee_ft=apogee.apogee_m * 3.28084,
-                        vehicle_length_in=vehicle_len,
-                        stage_length_in=stage0_len + stage1_len,
-                        stage_diameter_in=stage_diameter,
-                    )
-                    all_candidates.append(candidate)
-                    if within_tolerance:
-                        viable_candidates.append(candidate)
-                    if best_refine is None or error < best_refine["error_pct"]:
-                        best_refine = {
-                            "propellant": prop_spec.name,
-                            "split_ratio": split,
-                            "diameter_scale": diameter_key,
-                            "stage0": stage0,
-                            "stage1": stage1,
-                            "error_pct": error,
-                        }
-                    logs.append(
-                        {
-                            "name": name,
-                            "propellant": prop_spec.name,
-                            "split_ratio": split,
-                            "apogee_ft": apogee.apogee_m * 3.28084,
-                            "max_velocity_m_s": calibrated_velocity,
-                            "max_velocity_m_s_raw": apogee.max_velocity_m_s,
-                            "max_accel_m_s2": apogee.max_accel_m_s2,
-                            "objective_reports": _objective_reports(
-                                apogee.apogee_m * 3.28084,
-                                calibrated_velocity,
-                                targets.apogee_ft,
-                                targets.max_velocity_m_s,
-                            ),
-                            "objective_error_pct": float(error * 100.0),
-                            "within_tolerance": within_tolerance,
-                            "metrics": metrics,
-                            "candidate_key": _candidate_key(name, metrics, apogee.apogee_m * 3.28084),
-                            "stage_metrics": {"stage0": stage0_metrics, "stage1": stage1_metrics},
-                            "artifacts": {
-                                "stage0_ric": str(stage0_ric_out),
-                                "stage1_ric": str(stage1_ric_out),
-                                "stage0_eng": str(stage0_eng_out),
-                                "stage1_eng": str(stage1_eng_out),
-                            },
-                        }
-                    )
-            if best_refine and best_refine["stage0"].scales and best_refine["stage1"].scales:
-                refined_splits = _refine_split_ratios(float(best_refine["split_ratio"]))
-                refined_search0 = _refine_search_config(
-                    search,
-                    best_refine["stage0"].scales,
-                    fixed_diameter=float(best_refine["diameter_scale"]),
-                    spread=0.05 if fast_mode else 0.04,
-                )
-                refined_search1 = _refine_search_config(
-                    search,
-                    best_refine["stage1"].scales,
-                    fixed_diameter=float(best_refine["diameter_scale"]),
-                    spread=0.05 if fast_mode else 0.04,
-                )
-                grid0_refined = _build_stage_grid(
-                    prop_base0,
-                    refined_search0,
-                    constraints,
-                    reject_log=rejected,
-                    reject_context={"propellant": prop_spec.name, "refined": "stage0"},
-                    cache=stage_cache,
-                )
-                grid1_refined = _build_stage_grid(
-                    prop_base1,
-                    refined_search1,
-                    constraints,
-                    reject_log=rejected,
-                    reject_context={"propellant": prop_spec.name, "refined": "stage1"},
-                    cache=stage_cache,
-                )
-                if grid0_refined and grid1_refined:
-                    for split in refined_splits:
-                        stage0_target = total_target_impulse_ns * split
-                        stage1_target = total_target_impulse_ns * (1.0 - split)
-                        stage0 = _select_best_stage_for_target(grid0_refined, stage0_target)
-                        stage1 = _select_best_stage_for_target(grid1_refined, stage1_target, exclude=stage0)
-                        if stage0 is None or stage1 is None:
-                            continue
-                        if _stages_too_similar(stage0, stage1):
-                            continue
-                        stage0_len = _stage_length_in(stage0.spec)
-                        stage1_len = _stage_length_in(stage1.spec)
-                        if stage0_len + stage1_len > constraints.max_vehicle_length_in * (1.0 + _VEHICLE_DIM_TOLERANCE_PCT):
-                            continue
-                        length_ratio = max(stage0_len, stage1_len) / max(
-                            min(stage0_len, stage1_len), 1e-6
-                        )
-                        if length_ratio > effective_stage_ratio:
-                            continue
-                        try:
-                            temp_stage0 = (
-                                out_dir
-                                / f"_candidate_{_slugify_name(prop_spec.name)}_{int(split * 100)}_refined_s0.ric"
-                            )
-                            temp_stage1 = (
-                                out_dir
-                                / f"_candidate_{_slugify_name(prop_spec.name)}_{int(split * 100)}_refined_s1.ric"
-                            )
-                            temp_stage0.write_text(build_ric(stage0.spec), encoding="utf-8")
-                            temp_stage1.write_text(build_ric(stage1.spec), encoding="utf-8")
-                            stage0_metrics = _stage_metrics_from_ric_or_spec(stage0, temp_stage0)
-                            stage1_metrics = _stage_metrics_from_ric_or_spec(stage1, temp_stage1)
-                            if not (
-                                _pressure_within_tolerance(stage0_metrics, constraints, tolerance_pct=0.01)
-                                and _pressure_within_tolerance(stage1_metrics, constraints, tolerance_pct=0.01)
-                            ):
-                                continue
-                            total_mass_for_sim = _total_mass_from_dry(
-                                dry_mass_kg, stage0_metrics, stage1_metrics
-                            )
-                            prop0 = stage0_metrics.get("propellant_mass", 0.0)
-                            prop1 = stage1_metrics.get("propellant_mass", 0.0)
-                            stage0_dry, stage1_dry = _split_stage_dry_masses(
-                                total_mass_for_sim, prop0, prop1
-                            )
-                            apogee = simulate_two_stage_apogee_params(
-                                stage0=stage0.spec,
-                                stage1=stage1.spec,
-                                ref_diameter_m=vehicle_params.ref_diameter_m,
-                                stage0_dry_kg=stage0_dry,
-                                stage1_dry_kg=stage1_dry,
-                                cd_max=cd_max,
-                                mach_max=mach_max,
-                                cd_ramp=cd_ramp,
-                                separation_delay_s=separation_delay_s,
-                                ignition_delay_s=ignition_delay_s,
-                                total_mass_kg=None,
-                                launch_altitude_m=launch_altitude_m,
-                                wind_speed_m_s=wind_speed_m_s,
-                                temperature_k=temperature_k,
-                                rod_length_m=rod_length_m,
-                                launch_angle_deg=launch_angle_deg,
-                            )
-                        except Exception:
-                            continue
-                        if not (
-                            apogee.apogee_m == apogee.apogee_m
-                            and apogee.max_velocity_m_s == apogee.max_velocity_m_s
-                        ):
-                            continue
-                        calibrated_velocity = apogee.max_velocity_m_s * velocity_calibration
-                        error = _objective_error_pct_max(
-                            apogee.apogee_m * 3.28084,
-                            calibrated_velocity,
-                            targets.apogee_ft,
-                            targets.max_velocity_m_s,
-                        )
-                        if error is None:
-                            continue
-                        within_tolerance = bool(
-                            error <= targets.tolerance_pct
-                            and _within_max_targets(
-                                apogee.apogee_m * 3.28084,
-                                calibrated_velocity,
-                                targets.apogee_ft,
-                                targets.max_velocity_m_s,
-                            )
-                        )
-                        prefix = f"mission_{_slugify_name(prop_spec.name)}_{int(split * 100)}"
-                        steps0, _ = simulate_motorlib_with_result(stage0.spec)
-                        steps1, _ = simulate_motorlib_with_result(stage1.spec)
-                        eng0 = build_eng(
-                            stage0.spec, steps0, designation=f"{prefix}-S0", manufacturer="openmotor-ai"
-                        )
-                        eng1 = build_eng(
-                            stage1.spec, steps1, designation=f"{prefix}-S1", manufacturer="openmotor-ai"
-                        )
-                        stage0_ric_out = out_dir / f"{prefix}_stage0.ric"
-                        stage1_ric_out = out_dir / f"{prefix}_stage1.ric"
-                        stage0_eng_out = out_dir / f"{prefix}_stage0.eng"
-                        stage1_eng_out = out_dir / f"{prefix}_stage1.eng"
-                        stage0_ric_out.write_text(build_ric(stage0.spec), encoding="utf-8")
-                        stage1_ric_out.write_text(build_ric(stage1.spec), encoding="utf-8")
-                        stage0_eng_out.write_text(export_eng(eng0), encoding="utf-8")
-                        stage1_eng_out.write_text(export_eng(eng1), encoding="utf-8")
-                        stage0_metrics = _stage_metrics_from_ric_or_spec(stage0, stage0_ric_out)
-                        stage1_metrics = _stage_metrics_from_ric_or_spec(stage1, stage1_ric_out)
-                        metrics = _combine_metric_dicts(stage0_metrics, stage1_metrics, constraints)
-                        metrics["max_velocity_m_s"] = calibrated_velocity
-                        curve = _build_thrust_curve_from_ric_paths(
-                            stage0_ric_out, stage1_ric_out, separation_delay_s, ignition_delay_s
-                        )
-                        if not curve:
-                            curve = _build_thrust_curve(stage0, stage1, separation_delay_s, ignition_delay_s)
-                        vehicle_len = vehicle_params.rocket_length_in
-                        stage_diameter = _stage_diameter_in(stage0.spec)
-                        name = f"{prop_spec.name} two stage"
-                        candidate = Candidate(
-                            name=name,
-                            metrics=metrics,
-                            thrust_curve=curve,
-                            apogee_ft=apogee.apogee_m * 3.28084,
-                            vehicle_length_in=vehicle_len,
-                            stage_length_in=stage0_len + stage1_len,
-                            stage_diameter_in=stage_diameter,
-                        )
-                        all_candidates.append(candidate)
-                        if within_tolerance:
-                            viable_candidates.append(candidate)
-                        logs.append(
-                            {
-                                "name": name,
-                                "propellant": prop_spec.name,
-                                "split_ratio": split,
-                                "apogee_ft": apogee.apogee_m * 3.28084,
-                                "max_velocity_m_s": calibrated_velocity,
-                                "max_velocity_m_s_raw": apogee.max_velocity_m_s,
-                                "max_accel_m_s2": apogee.max_accel_m_s2,
-                                "objective_reports": _objective_reports(
-                                    apogee.apogee_m * 3.28084,
-                                    calibrated_velocity,
-                                    targets.apogee_ft,
-                                    targets.max_velocity_m_s,
-                                ),
-                                "objective_error_pct": float(error * 100.0),
-                                "within_tolerance": within_tolerance,
-                                "metrics": metrics,
-                                "candidate_key": _candidate_key(name, metrics, apogee.apogee_m * 3.28084),
-                                "stage_metrics": {"stage0": stage0_metrics, "stage1": stage1_metrics},
-                                "artifacts": {
-                                    "stage0_ric": str(stage0_ric_out),
-                                    "stage1_ric": str(stage1_ric_out),
-                                    "stage0_eng": str(stage0_eng_out),
-                                    "stage1_eng": str(stage1_eng_out),
-                                },
-                            }
-                        )
-
-    if not all_candidates:
-        return _json_safe({
-            "targets": {
-                "apogee_ft": targets.apogee_ft,
-                "max_velocity_m_s": targets.max_velocity_m_s,
-                "tolerance_pct": targets.tolerance_pct,
-            },
-            "constraints": asdict(constraints),
-            "search": asdict(search),
-            "estimated_total_impulse_ns": total_target_impulse_ns,
-            "summary": {
-                "status": "no_viable_candidates",
-                "message": "No candidates met objectives and constraints.",
-            },
-            "candidates": [],
-            "ranked": [],
-            "rejected": rejected,
-        })
-
-    openrocket_ranked = None
-    if ork_path:
-        from app.engine.openrocket.runner import run_openrocket_simulation
-
-        scored_logs = []
-        for log in logs:
-            artifacts = log.get("artifacts") if isinstance(log, dict) else None
-            if not isinstance(artifacts, dict):
-                continue
-            motor_paths: list[str] = []
-            if artifacts.get("eng"):
-                motor_paths.append(artifacts["eng"])
-            else:
-                if artifacts.get("stage0_eng"):
-                    motor_paths.append(artifacts["stage0_eng"])
-                if artifacts.get("stage1_eng"):
-                    motor_paths.append(artifacts["stage1_eng"])
-            if not motor_paths:
-                continue
-            try:
-                or_result = run_openrocket_simulation(
-                    {
-                        "rocket_path": ork_path,
-                        "motor_paths": motor_paths,
-                        "stage_count": stage_count,
-                        "separation_delay_s": separation_delay_s,
-                        "ignition_delay_s": ignition_delay_s,
-                        "launch_altitude_m": launch_altitude_m,
-                        "wind_speed_m_s": wind_speed_m_s,
-                        "temperature_k": temperature_k,
-                        "rod_length_m": rod_length_m,
-                        "launch_angle_deg": launch_angle_deg,
-                    }
-                )
-            except Exception as exc:
-                log["openrocket"] = {"status": "error", "detail": str(exc)}
-                continue
-            apogee_ft = float(or_result.get("apogee_m", 0.0)) * 3.28084
-            max_v = or_result.get("max_velocity_m_s")
-            error = _objective_error_pct_max(
-                apogee_ft,
-                max_v,
-                targets.apogee_ft,
-                targets.max_velocity_m_s,
-            )
-            log["openrocket"] = or_result | {
-                "apogee_ft": apogee_ft,
-                "objective_reports": _objective_reports(
-                    apogee_ft,
-                    max_v,
-                    targets.apogee_ft,
-                    targets.max_velocity_m_s,
-                ),
-                "objective_error_pct": float(error * 100.0) if error is not None else None,
-            }
-            if error is not None:
-                scored_logs.append((error, log))
-        if scored_logs:
-            openrocket_ranked = [item for _, item in sorted(scored_logs, key=lambda item: item[0])]
-            logs = openrocket_ranked
-
-    ranked_pool = viable_candidates if viable_candidates else all_candidates
-    ranked = []
-    for item in sorted(
-        ranked_pool,
-        key=lambda cand: _objective_error_pct_max(
-            cand.apogee_ft,
-            cand.metrics.get("max_velocity_m_s"),
-            targets.apogee_ft,
-            targets.max_velocity_m_s,
-        )
-        or 1e9,
-    ):
-        log = _find_log_for_candidate(logs, item.name, item.metrics, item.apogee_ft)
-        if log is None:
-            log = _find_log_by_name_closest(logs, item.name, item.metrics)
-        ranked.append(
-            {
-                "name": item.name,
-                "apogee_ft": item.apogee_ft,
-                "metrics": item.metrics,
-                "objective_reports": _objective_reports(
-                    item.apogee_ft,
-                    item.metrics.get("max_velocity_m_s"),
-                    targets.apogee_ft,
-                    targets.max_velocity_m_s,
-                ),
-                "stage_metrics": log.get("stage_metrics") if log else None,
-                "artifacts": log.get("artifacts") if log else None,
-                "artifact_urls": log.get("artifact_urls") if log else None,
-            }
-        )
-
-    if openrocket_ranked:
-        ranked = [
-            {
-                "name": item.get("name"),
-                "apogee_ft": item.get("openrocket", {}).get("apogee_ft"),
-                "metrics": item.get("metrics"),
-                "objective_reports": item.get("openrocket", {}).get("objective_reports"),
-                "openrocket": item.get("openrocket"),
-                "stage_metrics": item.get("stage_metrics"),
-                "artifacts": item.get("artifacts"),
-                "artifact_urls": item.get("artifact_urls"),
-            }
-            for item in openrocket_ranked
-            if isinstance(item, dict)
-        ]
-
-    if not ranked and logs:
-        fallback_ranked = []
-        for log in sorted(
-            logs,
-            key=lambda item: (item.get("objective_error_pct") or 1e9),
-        ):
-            if not isinstance(log, dict):
-                continue
-            fallback_ranked.append(
-                {
-                    "name": log.get("name"),
-                    "apogee_ft": log.get("apogee_ft"),
-                    "metrics": log.get("metrics"),
-                    "objective_reports": log.get("objective_reports"),
-                    "stage_metrics": log.get("stage_metrics"),
-                    "artifacts": log.get("artifacts"),
-                    "artifact_urls": log.get("artifact_urls"),
-                }
-            )
-        ranked = fallback_ranked
-
-    openrocket_eval = None
-    if ork_path and ranked:
-        try:
-            best_name = ranked[0]["name"]
-            best_log = next((log for log in logs if log.get("name") == best_name), None)
-            if best_log and best_log.get("artifacts"):
-                artifacts = best_log["artifacts"]
-                motor_paths = []
-                if artifacts.get("eng"):
-                    motor_paths.append(artifacts["eng"])
-                else:
-                    if artifacts.get("stage0_eng"):
-                        motor_paths.append(artifacts["stage0_eng"])
-                    if artifacts.get("stage1_eng"):
-                        motor_paths.append(artifacts["stage1_eng"])
-                if motor_paths:
-                    from app.engine.openrocket.runner import run_openrocket_simulation
-
-                    openrocket_eval = run_openrocket_simulation(
-                        {
-                            "rocket_path": ork_path,
-                            "motor_paths": motor_paths,
-                            "stage_count": stage_count,
-                            "separation_delay_s": separation_delay_s,
-                            "ignition_delay_s": ignition_delay_s,
-                            "launch_altitude_m": launch_altitude_m,
-                            "wind_speed_m_s": wind_speed_m_s,
-                            "temperature_k": temperature_k,
-                            "rod_length_m": rod_length_m,
-                            "launch_angle_deg": launch_angle_deg,
-                        }
-                    )
-                    openrocket_eval["objective_reports"] = _objective_reports(
-                        openrocket_eval.get("apogee_m", 0.0) * 3.28084,
-                        openrocket_eval.get("max_velocity_m_s"),
-                        targets.apogee_ft,
-                        targets.max_velocity_m_s,
-                    )
-        except Exception as exc:
-            openrocket_eval = {"status": "error", "detail": str(exc)}
-
-    return _json_safe({
-        "targets": {
-            "apogee_ft": targets.apogee_ft,
-            "max_velocity_m_s": targets.max_velocity_m_s,
-            "tolerance_pct": targets.tolerance_pct,
-        },
-        "constraints": asdict(constraints),
-        "search": asdict(search),
-        "estimated_total_impulse_ns": total_target_impulse_ns,
-        "summary": {
-            "status": "ok" if viable_candidates else "best_effort",
-            "candidate_count": len(all_candidates),
-            "viable_count": len(viable_candidates),
-            "rejected_count": len(rejected),
-        },
-        "openrocket": openrocket_eval,
-        "candidates": logs,
-        "ranked": ranked,
-        "rejected": rejected,
-    })
-
 
 def optimize_two_stage_for_targets(
     base_ric_path: str,
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from app.engine.openmotor_ai.spec import MotorSpec
+from app.engine.openmotor_ai.spec import BATESGrain, FMMGrain, MotorSpec
 from app.engine.openmotor_ai.ric_parser import _IgnoreTagsLoader
 import re
 import yaml
@@ -91,6 +91,21 @@ def _ric_footer() -> str:
     )
 
 
+def _ric_grain(grain: BATESGrain | FMMGrain) -> dict:
+    properties = {
+        "coreDiameter": _format_half_inches(grain.core_diameter_m),
+        "diameter": _format_half_inches(grain.diameter_m),
+        "inhibitedEnds": grain.inhibited_ends,
+        "length": _format_half_inches(grain.length_m),
+    }
+    if not isinstance(grain, FMMGrain):
+        return {"properties": properties, "type": "BATES"}
+    # Fin, point and slot sizes are far below half an inch, so they keep their own precision.
+    for key, value in grain.properties:
+        properties[key] = float(_format_number(value)) if isinstance(value, float) else value
+    return {"properties": dict(sorted(properties.items())), "type": grain.grain_type}
+
+
 def build_ric(spec: MotorSpec) -> str:
     payload = {
         "data": {
@@ -104,18 +119,7 @@ def build_ric(spec: MotorSpec) -> str:
                 "minPortThroat": float(_format_number(spec.config.min_port_throat_ratio)),
                 "timestep": float(_format_number(spec.config.timestep_s)),
             },
-            "grains": [
-                {
-                    "properties": {
-                        "coreDiameter": _format_half_inches(grain.core_diameter_m),
-                        "diameter": _format_half_inches(grain.diameter_m),
-                        "inhibitedEnds": grain.inhibited_ends,
-                        "length": _format_half_inches(grain.length_m),
-                    },
-                    "type": "BATES",
-                }
-                for grain in spec.grains
-            ],
+            "grains": [_ric_grain(grain) for grain in spec.grains],
             "nozzle": {
                 "convAngle": _format_half_unit(spec.nozzle.conv_angle_deg),
                 "divAngle": _format_half_unit(spec.nozzle.div_angle_deg),
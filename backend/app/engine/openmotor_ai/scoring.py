@@ -106,53 +106,154 @@ def classify_candidate(metrics: dict[str, float]) -> list[str]:
     return labels
 
 
+OBJECTIVE_NAMES = (
+    "apogee",
+    "efficiency",
+    "thrust_quality",
+    "pressure_margin",
+    "kn_margin",
+    "packaging",
+    "manufacturability",
+)
+
+
+def objective_vector(candidate: Candidate, p_max: float, kn_max: float) -> dict[str, float]:
+    # Raw, un-normalised objectives; every one of them is higher-is-better.
+    return {
+        "apogee": candidate.apogee_ft or 0.0,
+        "efficiency": candidate.metrics.get("delivered_specific_impulse", 0.0),
+        "thrust_quality": _thrust_quality_score(candidate.thrust_curve),
+        "pressure_margin": _pressure_margin(candidate.metrics.get("peak_chamber_pressure", 0.0), p_max),
+        "kn_margin": _kn_margin(candidate.metrics.get("peak_kn", 0.0), kn_max),
+        "packaging": _packaging_score(candidate.stage_length_in, candidate.vehicle_length_in),
+        "manufacturability": _manufacturability_score(candidate.metrics),
+    }
+
+
+def weighted_scores(
+    vectors: list[dict[str, float]], weights: ScoreWeights | None = None
+) -> tuple[list[dict[str, float]], list[float]]:
+    if weights is None:
+        weights = ScoreWeights()
+    weight_map = asdict(weights)
+    columns = {name: _normalize([vector[name] for vector in vectors]) for name in OBJECTIVE_NAMES}
+    objective_scores = [
+        {name: columns[name][idx] for name in OBJECTIVE_NAMES} for idx in range(len(vectors))
+    ]
+    totals = [
+        sum(scores[name] * weight_map[name] for name in OBJECTIVE_NAMES) for scores in objective_scores
+    ]
+    return objective_scores, totals
+
+
+def _dominates(a: dict[str, float], b: dict[str, float]) -> bool:
+    return all(a[name] >= b[name] for name in OBJECTIVE_NAMES) and any(
+        a[name] > b[name] for name in OBJECTIVE_NAMES
+    )
+
+
+def pareto_fronts(vectors: list[dict[str, float]]) -> list[list[int]]:
+    """Fast non-dominated sort (NSGA-II): front 0 is the Pareto set, front k is dominated only by fronts < k."""
+    dominated_by: list[list[int]] = [[] for _ in vectors]
+    domination_count = [0 for _ in vectors]
+    for i in range(len(vectors)):
+        for j in range(i + 1, len(vectors)):
+            if _dominates(vectors[i], vectors[j]):
+                dominated_by[i].append(j)
+                domination_count[j] += 1
+            elif _dominates(vectors[j], vectors[i]):
+                dominated_by[j].append(i)
+                domination_count[i] += 1
+    fronts: list[list[int]] = []
+    current = [idx for idx, count in enumerate(domination_count) if count == 0]
+    while current:
+        fronts.append(current)
+        following: list[int] = []
+        for idx in current:
+            for other in dominated_by[idx]:
+                domination_count[other] -= 1
+                if domination_count[other] == 0:
+                    following.append(other)
+        current = sorted(following)
+    return fronts
+
+
+def crowding_distances(vectors: list[dict[str, float]], front: list[int]) -> dict[int, float | None]:
+    # None marks a boundary point (infinite distance), which JSON cannot carry as a float.
+    distances: dict[int, float | None] = {idx: 0.0 for idx in front}
+    if len(front) <= 2:
+        return {idx: None for idx in front}
+    for name in OBJECTIVE_NAMES:
+        ordered = sorted(front, key=lambda idx: vectors[idx][name])
+        span = vectors[ordered[-1]][name] - vectors[ordered[0]][name]
+        distances[ordered[0]] = None
+        distances[ordered[-1]] = None
+        if span <= 1e-12:
+            continue
+        for pos in range(1, len(ordered) - 1):
+            idx = ordered[pos]
+            if distances[idx] is not None:
+                distances[idx] += (vectors[ordered[pos + 1]][name] - vectors[ordered[pos - 1]][name]) / span
+    return distances
+
+
+def pareto_report(candidates: list[Candidate], p_max: float, kn_max: float) -> dict[str, object]:
+    """Raw objective vectors plus Pareto rank and crowding distance for every candidate.
+
+    Stored with a job result so that rerank_pareto can re-score it under new weights without re-simulating.
+    """
+    vectors = [objective_vector(candidate, p_max, kn_max) for candidate in candidates]
+    fronts = pareto_fronts(vectors)
+    entries = []
+    for rank, front in enumerate(fronts):
+        distances = crowding_distances(vectors, front)
+        for idx in front:
+            entries.append(
+                {
+                    "index": idx,
+                    "name": candidates[idx].name,
+                    "objectives": vectors[idx],
+                    "pareto_rank": rank,
+                    "crowding_distance": distances[idx],
+                }
+            )
+    entries.sort(
+        key=lambda entry: (
+            entry["pareto_rank"],
+            entry["crowding_distance"] is not None,
+            -(entry["crowding_distance"] or 0.0),
+            entry["index"],
+        )
+    )
+    return {
+        "objectives": list(OBJECTIVE_NAMES),
+        "front": [candidates[idx].name for idx in (fronts[0] if fronts else [])],
+        "candidates": entries,
+    }
+
+
+def rerank_pareto(report: dict[str, object], weights: ScoreWeights | None = None) -> list[dict[str, object]]:
+    entries = list(report.get("candidates") or [])
+    objective_scores, totals = weighted_scores([entry["objectives"] for entry in entries], weights)
+    ranked = [
+        {**entry, "objective_scores": scores, "total_score": total}
+        for entry, scores, total in zip(entries, objective_scores, totals)
+    ]
+    ranked.sort(key=lambda entry: entry["total_score"], reverse=True)
+    return ranked
+
+
 def score_candidates(
     candidates: list[Candidate],
     p_max: float,
     kn_max: float,
     weights: ScoreWeights | None = None,
 ) -> list[ScoredCandidate]:
-    if weights is None:
-        weights = ScoreWeights()
-
-    apogee_vals = [c.apogee_ft or 0.0 for c in candidates]
-    isp_vals = [c.metrics.get("delivered_specific_impulse", 0.0) for c in candidates]
-    pressure_vals = [c.metrics.get("peak_chamber_pressure", 0.0) for c in candidates]
-    kn_vals = [c.metrics.get("peak_kn", 0.0) for c in candidates]
-    packaging_vals = [
-        _packaging_score(c.stage_length_in, c.vehicle_length_in) for c in candidates
-    ]
-    thrust_quality_vals = [_thrust_quality_score(c.thrust_curve) for c in candidates]
-    manuf_vals = [_manufacturability_score(c.metrics) for c in candidates]
-
-    apogee_norm = _normalize(apogee_vals)
-    isp_norm = _normalize(isp_vals)
-    pressure_norm = _normalize([_pressure_margin(v, p_max) for v in pressure_vals])
-    kn_norm = _normalize([_kn_margin(v, kn_max) for v in kn_vals])
-    packaging_norm = _normalize(packaging_vals)
-    thrust_norm = _normalize(thrust_quality_vals)
-    manuf_norm = _normalize(manuf_vals)
+    vectors = [objective_vector(candidate, p_max, kn_max) for candidate in candidates]
+    objective_score_list, totals = weighted_scores(vectors, weights)
 
     scored: list[ScoredCandidate] = []
-    for idx, candidate in enumerate(candidates):
-        objective_scores = {
-            "apogee": apogee_norm[idx],
-            "efficiency": isp_norm[idx],
-            "thrust_quality": thrust_norm[idx],
-            "pressure_margin": pressure_norm[idx],
-            "kn_margin": kn_norm[idx],
-            "packaging": packaging_norm[idx],
-            "manufacturability": manuf_norm[idx],
-        }
-        total = (
-            objective_scores["apogee"] * weights.apogee
-            + objective_scores["efficiency"] * weights.efficiency
-            + objective_scores["thrust_quality"] * weights.thrust_quality
-            + objective_scores["pressure_margin"] * weights.pressure_margin
-            + objective_scores["kn_margin"] * weights.kn_margin
-            + objective_scores["packaging"] * weights.packaging
-            + objective_scores["manufacturability"] * weights.manufacturability
-        )
+    for candidate, objective_scores, total in zip(candidates, objective_score_list, totals):
         labels = classify_candidate(candidate.metrics)
         explanation = (
             f"apogee={objective_scores['apogee']:.2f}, isp={objective_scores['efficiency']:.2f}, "
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Callable
+
+
+@dataclass
+class SearchDeadline:
+    """Cooperative stop signal checked by long searches between motor simulations.
+
+    ``deadline_s`` is an absolute ``time.monotonic()`` value. ``cancelled`` may hit Redis or the database, so it is
+    polled at most once every ``poll_interval_s``. Once a stop is seen it sticks, and ``reason`` says why.
+    """
+
+    deadline_s: float | None = None
+    cancelled: Callable[[], bool] | None = None
+    poll_interval_s: float = 2.0
+    reason: str | None = None
+    _next_poll_s: float = 0.0
+
+    @classmethod
+    def after(cls, seconds: float | None, cancelled: Callable[[], bool] | None = None) -> SearchDeadline:
+        deadline_s = time.monotonic() + seconds if seconds is not None else None
+        return cls(deadline_s=deadline_s, cancelled=cancelled)
+
+    def should_stop(self) -> bool:
+        if self.reason is not None:
+            return True
+        now = time.monotonic()
+        if self.deadline_s is not None and now >= self.deadline_s:
+            self.reason = "deadline"
+            return True
+        if self.cancelled is not None and now >= self._next_poll_s:
+            self._next_poll_s = now + self.poll_interval_s
+            if self.cancelled():
+                self.reason = "cancelled"
+                return True
+        return False
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+# Same impulse rescaling bounds the recursive re-runs used.
+_MIN_IMPULSE_SCALE = 1.1
+_MAX_IMPULSE_SCALE = 2.2
+
+
+@dataclass
+class TargetSearchSession:
+    """State shared by the re-iterations of a target-only search.
+
+    The simulation cache maps a motor geometry to its metrics (None for a failed or constraint-violating motor), so a
+    later iteration re-scores every motor it has already seen against its new impulse target and only simulates
+    geometries that are new to the session.
+    """
+
+    max_iterations: int = 7
+    sim_cache: dict[tuple[object, ...], dict[str, float] | None] = field(default_factory=dict)
+    apogee_cache: dict[tuple[object, ...], tuple[float, float]] = field(default_factory=dict)
+    iterations: list[dict[str, object]] = field(default_factory=list)
+    _cache_size: int = 0
+
+    @property
+    def evaluated_count(self) -> int:
+        return sum(1 for metrics in self.sim_cache.values() if metrics is not None)
+
+    @property
+    def rejected_count(self) -> int:
+        return sum(1 for metrics in self.sim_cache.values() if metrics is None)
+
+    def record_iteration(
+        self,
+        *,
+        target_impulse_ns: float | None,
+        winner_count: int,
+        best_apogee_ft: float | None,
+    ) -> None:
+        self.iterations.append(
+            {
+                "iteration": len(self.iterations),
+                "target_impulse_ns": target_impulse_ns,
+                "winner_count": winner_count,
+                "best_apogee_ft": best_apogee_ft,
+                "simulations": len(self.sim_cache) - self._cache_size,
+                "cached_motors": len(self.sim_cache),
+            }
+        )
+        self._cache_size = len(self.sim_cache)
+
+    def next_target_impulse(
+        self,
+        target_impulse_ns: float | None,
+        best_apogee_ft: float | None,
+        target_apogee_ft: float | None,
+        tolerance_pct: float,
+    ) -> float | None:
+        if len(self.iterations) > self.max_iterations:
+            return None
+        if not target_impulse_ns or not target_apogee_ft or not best_apogee_ft or best_apogee_ft <= 0:
+            return None
+        if best_apogee_ft >= target_apogee_ft * (1.0 - tolerance_pct):
+            return None
+        scale = (target_apogee_ft / best_apogee_ft) ** 0.5
+        return target_impulse_ns * max(_MIN_IMPULSE_SCALE, min(scale, _MAX_IMPULSE_SCALE))
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "iterations": self.iterations,
+            "evaluated_motors": self.evaluated_count,
+            "rejected_motors": self.rejected_count,
+            "simulations": len(self.sim_cache),
+        }
@@ -5,10 +5,12 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from app.engine.openmotor_ai.motorlib_adapter import (
+    SimulationLimits,
     metrics_from_simresult,
     simulate_motorlib_with_result,
 )
-from app.engine.openmotor_ai.spec import BATESGrain, MotorSpec, NozzleSpec, PropellantSpec
+from app.engine.openmotor_ai.search_deadline import SearchDeadline
+from app.engine.openmotor_ai.spec import BATESGrain, MotorSpec, NozzleSpec, PropellantSpec, propellant_key
 
 if TYPE_CHECKING:
     from app.engine.openmotor_ai.openmotor_pipeline import TwoStageConstraints, VehicleParams
@@ -176,6 +178,8 @@ class SmartNozzleArchitect:
         stage_length_target_in: float | None = None,
         stage_length_tolerance_in: float = 6.0,
         max_checks: int | None = None,
+        sim_cache: dict[tuple[object, ...], dict[str, float] | None] | None = None,
+        deadline: SearchDeadline | None = None,
     ) -> list[SmartNozzleResult]:
         req_impulse = required_impulse_ns or self.sizer.calculate_targets(
             target_apogee_ft, dry_mass_lbs, rocket_dims["diameter"]
@@ -213,6 +217,8 @@ class SmartNozzleArchitect:
                 while core <= core_max + 1e-6:
                     burn_area = self._burn_area_in2(grain_count, length, core, grain_od)
                     pressure_limit = max_pressure_psi * 1.06
+                    # Motors above 1.5x the limit are neither winners nor closest-fail candidates.
+                    sim_limits = SimulationLimits(max_pressure_pa=pressure_limit * 1.5 * 6894.757)
                     throat_base, exit_base = self._solve_nozzle(
                         burn_area, propellant, pressure_limit
                     )
@@ -223,6 +229,16 @@ class SmartNozzleArchitect:
                     for multiplier in self.config.throat_multipliers:
                         throat_d = throat_base * multiplier
                         exit_d = exit_base * multiplier
+                        if deadline is not None and deadline.should_stop():
+                            # Stopped early: rank what was found, same as a search that ran out of geometries.
+                            winners.sort(
+                                key=lambda item: abs(
+                                    item.metrics.get("total_impulse", 0.0) - req_impulse
+                                )
+                            )
+                            if winners:
+                                return winners[: self.config.max_winners]
+                            return [closest_fail] if closest_fail else []
                         checked += 1
                         if max_checks is not None and checked >= max_checks:
                             winners.sort(
@@ -258,10 +274,30 @@ class SmartNozzleArchitect:
                                 throat_in=throat_d,
                                 exit_in=exit_d,
                             )
-                            _, sim = simulate_motorlib_with_result(spec)
-                            metrics = metrics_from_simresult(sim)
+                            cache_key = (
+                                propellant_key(propellant),
+                                grain_count,
+                                round(length, 6),
+                                round(core, 6),
+                                round(throat_d, 9),
+                                round(exit_d, 9),
+                            )
+                            if sim_cache is not None and cache_key in sim_cache:
+                                metrics = sim_cache[cache_key]
+                            else:
+                                metrics = None
+                                try:
+                                    _, sim = simulate_motorlib_with_result(spec, limits=sim_limits)
+                                    metrics = metrics_from_simresult(sim)
+                                finally:
+                                    # Failures are cached too, so a rejected geometry is never re-simulated.
+                                    if sim_cache is not None:
+                                        sim_cache[cache_key] = metrics
                         except Exception:
                             continue
+                        if metrics is None:
+                            continue
+                        metrics = dict(metrics)
 
                         peak_pressure = metrics.get("peak_chamber_pressure", 0.0) / 6894.757
                         total_impulse = metrics.get("total_impulse", 0.0)
@@ -32,6 +32,30 @@ class BATESGrain:
     inhibited_ends: str
 
 
+# motorlib grain types whose regression is solved on a fast-marching map, and the geometry properties among them that
+# are lengths (they scale with the grain diameter).
+FMM_GRAIN_TYPES = ("Finocyl", "Moon Burner", "Star Grain", "X Core", "C Grain", "D Grain")
+FMM_LENGTH_PROPERTIES = frozenset(
+    {"finWidth", "finLength", "pointLength", "pointWidth", "coreOffset", "slotWidth", "slotLength", "slotOffset"}
+)
+
+
+@dataclass(frozen=True)
+class FMMGrain:
+    """A grain from :data:`FMM_GRAIN_TYPES`. Its cost and accuracy depend on ``MotorConfig.map_dim``.
+
+    ``core_diameter_m`` is 0 for types without a round core. ``properties`` holds the rest of the type's geometry as
+    sorted (motorlib property name, value) pairs.
+    """
+
+    grain_type: str
+    diameter_m: float
+    core_diameter_m: float
+    length_m: float
+    inhibited_ends: str
+    properties: tuple[tuple[str, object], ...] = ()
+
+
 @dataclass(frozen=True)
 class NozzleSpec:
     throat_diameter_m: float
@@ -60,23 +84,56 @@ class MotorConfig:
 class MotorSpec:
     config: MotorConfig
     propellant: PropellantSpec
-    grains: list[BATESGrain]
+    grains: list[BATESGrain | FMMGrain]
     nozzle: NozzleSpec
 
 
-def _require_bates(grains: list[dict[str, Any]]) -> list[BATESGrain]:
-    parsed: list[BATESGrain] = []
+def spec_uses_fmm(spec: MotorSpec) -> bool:
+    return any(isinstance(grain, FMMGrain) for grain in spec.grains)
+
+
+def propellant_key(spec: PropellantSpec) -> tuple[object, ...]:
+    tab_key = tuple(
+        (
+            round(tab.a, 12),
+            round(tab.n, 6),
+            round(tab.k, 6),
+            round(tab.m, 6),
+            round(tab.t, 3),
+            round(tab.min_pressure_pa, 2),
+            round(tab.max_pressure_pa, 2),
+        )
+        for tab in spec.tabs
+    )
+    return (spec.name, round(spec.density_kg_m3, 6), tab_key)
+
+
+def _parse_grains(grains: list[dict[str, Any]]) -> list[BATESGrain | FMMGrain]:
+    parsed: list[BATESGrain | FMMGrain] = []
     for grain in grains:
         grain_type = grain.get("type")
-        if grain_type != "BATES":
-            raise ValueError(f"Unsupported grain type: {grain_type}")
         props = grain.get("properties", {})
+        if grain_type == "BATES":
+            parsed.append(
+                BATESGrain(
+                    diameter_m=float(props.get("diameter", 0.0)),
+                    core_diameter_m=float(props.get("coreDiameter", 0.0)),
+                    length_m=float(props.get("length", 0.0)),
+                    inhibited_ends=str(props.get("inhibitedEnds", "")),
+                )
+            )
+            continue
+        if grain_type not in FMM_GRAIN_TYPES:
+            raise ValueError(f"Unsupported grain type: {grain_type}")
+        shared = ("diameter", "coreDiameter", "length", "inhibitedEnds")
         parsed.append(
-            BATESGrain(
+            FMMGrain(
+                grain_type=grain_type,
                 diameter_m=float(props.get("diameter", 0.0)),
                 core_diameter_m=float(props.get("coreDiameter", 0.0)),
                 length_m=float(props.get("length", 0.0)),
                 inhibited_ends=str(props.get("inhibitedEnds", "")),
+                properties=tuple(sorted((key, value) for key, value in props.items() if key not in shared)),
             )
         )
     return parsed
@@ -133,6 +190,6 @@ def spec_from_ric(ric: RicData) -> MotorSpec:
     return MotorSpec(
         config=_parse_config(ric.config),
         propellant=_parse_propellant(ric.propellant),
-        grains=_require_bates(ric.grains),
+        grains=_parse_grains(ric.grains),
         nozzle=_parse_nozzle(ric.nozzle),
     )
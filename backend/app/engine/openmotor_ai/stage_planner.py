@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+from dataclasses import asdict, is_dataclass
+import hashlib
+import json
+import os
+from pathlib import Path
+import pickle
+from typing import Any, Callable, TypeVar
+
+from app.engine.openmotor_ai.engine_versions import openmotor_motorlib_version, trajectory_engine_version
+
+T = TypeVar("T")
+
+
+def _normalize(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return _normalize(asdict(value))
+    if isinstance(value, dict):
+        return {str(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 9)
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    return str(value)
+
+
+def file_digest(path: str | Path | None) -> str | None:
+    if not path:
+        return None
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+class JobStagePlanner:
+    """Caches the outputs of a job's stages under a digest of the inputs each stage actually reads.
+
+    A stage key also folds in the keys of the stages it depends on, so an upstream change invalidates everything
+    downstream of it while a resubmission that only touches, say, launch conditions reuses the motor simulations.
+    Stages can be whole values (``run``) or per-entry mappings (``open_mapping``/``save_mapping``) that grow as later
+    jobs simulate geometries the cache has not seen yet. With no cache directory the planner still keys and reports
+    every stage, it just never hits.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.keys: dict[str, str] = {}
+        self.report: dict[str, dict[str, Any]] = {}
+        self._engines = {"motorlib": openmotor_motorlib_version(), "trajectory": trajectory_engine_version()}
+
+    def key(self, stage: str, inputs: dict[str, Any], depends_on: tuple[str, ...] = ()) -> str:
+        payload = {
+            "stage": stage,
+            "inputs": _normalize(inputs),
+            "upstream": {name: self.keys[name] for name in depends_on},
+            "engines": self._engines,
+        }
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        ).hexdigest()
+        self.keys[stage] = digest
+        return digest
+
+    def run(
+        self,
+        stage: str,
+        inputs: dict[str, Any],
+        compute: Callable[[], T],
+        depends_on: tuple[str, ...] = (),
+        cache_if: Callable[[T], bool] | None = None,
+    ) -> T:
+        key = self.key(stage, inputs, depends_on)
+        cached = self._load(stage, key)
+        if cached is not None:
+            self.report[stage] = {"key": key, "status": "hit"}
+            return cached
+        value = compute()
+        if cache_if is None or cache_if(value):
+            self._store(stage, key, value)
+        self.report[stage] = {"key": key, "status": "miss"}
+        return value
+
+    def open_mapping(self, stage: str, key: str) -> dict[Any, Any]:
+        cached = self._load(stage, key)
+        return dict(cached) if isinstance(cached, dict) else {}
+
+    def save_mapping(self, stage: str, part: str, key: str, mapping: dict[Any, Any], reused: int) -> None:
+        # Merge with whatever another job stored meanwhile rather than overwrite it.
+        merged = {**self.open_mapping(stage, key), **mapping}
+        computed = len(mapping) - reused
+        if computed > 0:
+            self._store(stage, key, merged)
+        entry = self.report.setdefault(stage, {"parts": {}, "reused": 0, "computed": 0})
+        entry["parts"][part] = {"key": key, "status": _mapping_status(reused, computed)}
+        entry["reused"] += reused
+        entry["computed"] += max(computed, 0)
+        entry["status"] = _mapping_status(entry["reused"], entry["computed"])
+
+    def mark(self, stage: str, status: str, **details: Any) -> None:
+        self.report[stage] = {"key": self.keys.get(stage), "status": status, **details}
+
+    def _path(self, stage: str, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / stage / f"{key}.pkl"
+
+    def _load(self, stage: str, key: str) -> Any:
+        path = self._path(stage, key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("rb") as handle:
+                return pickle.load(handle)
+        except Exception:
+            return None
+
+    def _store(self, stage: str, key: str, value: Any) -> None:
+        path = self._path(stage, key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp_path.open("wb") as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except OSError:
+            pass  # The cache is best-effort, the job still has the value in memory
+
+
+def _mapping_status(reused: int, computed: int) -> str:
+    if computed <= 0:
+        return "hit" if reused else "miss"
+    return "partial" if reused else "miss"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+from typing import Callable, Generic, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class HalvingPolicy:
+    # Screening only pays off once there are more arms than survivors to spare.
+    min_arms: int = 6
+    reduction: int = 3
+    min_fidelity: float = 1.0 / 9.0
+    min_survivors: int = 3
+
+
+@dataclass(frozen=True)
+class HalvingResult(Generic[T]):
+    survivors: list[T]
+    rounds: list[dict[str, object]]
+
+
+def fidelity_schedule(policy: HalvingPolicy) -> list[float]:
+    fidelities: list[float] = []
+    fidelity = max(policy.min_fidelity, 1e-6)
+    while fidelity < 1.0 - 1e-9:
+        fidelities.append(fidelity)
+        fidelity *= max(policy.reduction, 2)
+    return fidelities
+
+
+def successive_halving(
+    arms: Sequence[T],
+    evaluate: Callable[[T, float], float | None],
+    *,
+    label: Callable[[T], str],
+    policy: HalvingPolicy | None = None,
+) -> HalvingResult[T]:
+    """Screen arms on partial budgets before the caller runs the survivors at full budget.
+
+    Each round scores every remaining arm with ``evaluate(arm, fidelity)`` (lower is better, None for an arm that
+    produced nothing usable) and keeps the best 1/reduction of them. Ties and survivors keep the input order, so a
+    preferred ordering of the arms still breaks ties. Rounds refer to arms by their position in ``arms``, since
+    labels are only for display and need not be unique.
+    """
+    policy = policy or HalvingPolicy()
+    alive = list(range(len(arms)))
+    rounds: list[dict[str, object]] = []
+    if len(alive) < policy.min_arms:
+        return HalvingResult(survivors=list(arms), rounds=rounds)
+
+    for fidelity in fidelity_schedule(policy):
+        if len(alive) <= policy.min_survivors:
+            break
+        losses = [evaluate(arms[arm], fidelity) for arm in alive]
+        order = sorted(
+            range(len(alive)),
+            key=lambda idx: (losses[idx] is None, losses[idx] if losses[idx] is not None else 0.0, idx),
+        )
+        keep_count = max(policy.min_survivors, math.ceil(len(alive) / max(policy.reduction, 2)))
+        kept = sorted(order[:keep_count])
+        rounds.append(
+            {
+                "round": len(rounds),
+                "fidelity": fidelity,
+                "scores": [
+                    {"arm": arm, "label": label(arms[arm]), "loss": loss} for arm, loss in zip(alive, losses)
+                ],
+                "kept": [alive[idx] for idx in kept],
+                "eliminated": [alive[idx] for idx in sorted(order[keep_count:])],
+            }
+        )
+        alive = [alive[idx] for idx in kept]
+    return HalvingResult(survivors=[arms[arm] for arm in alive], rounds=rounds)
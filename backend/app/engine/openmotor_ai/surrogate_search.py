@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Sequence
+
+import numpy as np
+from scipy.linalg import cho_factor, cho_solve
+from scipy.special import ndtr
+
+_LENGTH_SCALES = (0.1, 0.2, 0.35, 0.6, 1.0)
+_NOISE = 1e-6
+# Failed runs have no constraint margin; treat them as clearly infeasible.
+_FAILED_CONSTRAINT = 1.0
+
+
+@dataclass(frozen=True)
+class SurrogateObservation:
+    # Lower is better; None when the run produced no usable metrics.
+    objective: float | None
+    # Feasible when <= 0; None when the run failed outright.
+    constraint: float | None
+
+
+@dataclass(frozen=True)
+class SurrogateSearchResult:
+    observations: dict[int, SurrogateObservation]
+    simulations: int
+    batches: int
+    candidate_count: int
+    stop_reason: str
+
+
+def _unit_cube(points: Sequence[Sequence[float]]) -> np.ndarray:
+    x = np.asarray(points, dtype=float)
+    low = x.min(axis=0)
+    span = x.max(axis=0) - low
+    keep = span > 0
+    return (x[:, keep] - low[keep]) / span[keep]
+
+
+def _matern52(a: np.ndarray, b: np.ndarray, length_scale: float) -> np.ndarray:
+    d = np.sqrt(np.maximum(((a[:, None, :] - b[None, :, :]) ** 2).sum(axis=-1), 0.0)) / length_scale
+    root5 = np.sqrt(5.0) * d
+    return (1.0 + root5 + (5.0 / 3.0) * d * d) * np.exp(-root5)
+
+
+class _GaussianProcess:
+    def __init__(self, x: np.ndarray, y: np.ndarray, length_scale: float | None = None) -> None:
+        self.x = x
+        self.mean = float(y.mean())
+        self.std = float(y.std()) or 1.0
+        z = (y - self.mean) / self.std
+        if length_scale is None:
+            length_scale = max(_LENGTH_SCALES, key=lambda ls: self._log_likelihood(z, ls))
+        self.length_scale = length_scale
+        self._factor = cho_factor(self._gram(length_scale), lower=True)
+        self._alpha = cho_solve(self._factor, z)
+
+    def _gram(self, length_scale: float) -> np.ndarray:
+        return _matern52(self.x, self.x, length_scale) + _NOISE * np.eye(len(self.x))
+
+    def _log_likelihood(self, z: np.ndarray, length_scale: float) -> float:
+        try:
+            factor = cho_factor(self._gram(length_scale), lower=True)
+        except np.linalg.LinAlgError:
+            return float("-inf")
+        alpha = cho_solve(factor, z)
+        return float(-0.5 * z @ alpha - np.log(np.diag(factor[0])).sum())
+
+    def predict(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        k = _matern52(x, self.x, self.length_scale)
+        mu = k @ self._alpha
+        v = cho_solve(self._factor, k.T)
+        var = np.maximum(1.0 - (k * v.T).sum(axis=1), 1e-12)
+        return mu * self.std + self.mean, np.sqrt(var) * self.std
+
+
+def _initial_design(x: np.ndarray, size: int, rng: np.random.Generator) -> list[int]:
+    # Greedy maximin over the lattice, so the first batch spreads across every dimension.
+    chosen = [int(rng.integers(len(x)))]
+    dist = np.linalg.norm(x - x[chosen[0]], axis=1)
+    while len(chosen) < min(size, len(x)):
+        idx = int(np.argmax(dist))
+        if dist[idx] <= 0:
+            break
+        chosen.append(idx)
+        dist = np.minimum(dist, np.linalg.norm(x - x[idx], axis=1))
+    return chosen
+
+
+def _acquisition(
+    x_obs: np.ndarray,
+    objectives: np.ndarray,
+    objective_mask: np.ndarray,
+    constraints: np.ndarray,
+    x_pool: np.ndarray,
+    length_scales: tuple[float | None, float | None],
+) -> tuple[np.ndarray, tuple[float | None, float | None], tuple[np.ndarray, np.ndarray]]:
+    constraint_gp = _GaussianProcess(x_obs, constraints, length_scales[1])
+    c_mu, c_sigma = constraint_gp.predict(x_pool)
+    feasibility = ndtr(-c_mu / c_sigma)
+    feasible = objective_mask & (constraints <= 0)
+    if not feasible.any() or objective_mask.sum() < 2:
+        # Nothing feasible to improve on yet: look for feasibility first.
+        return feasibility, (length_scales[0], constraint_gp.length_scale), (c_mu, np.zeros_like(c_mu))
+    objective_gp = _GaussianProcess(x_obs[objective_mask], objectives[objective_mask], length_scales[0])
+    mu, sigma = objective_gp.predict(x_pool)
+    best = objectives[feasible].min()
+    z = (best - mu) / sigma
+    improvement = (best - mu) * ndtr(z) + sigma * np.exp(-0.5 * z * z) / np.sqrt(2.0 * np.pi)
+    scaled = improvement / objective_gp.std
+    return scaled * feasibility, (objective_gp.length_scale, constraint_gp.length_scale), (c_mu, mu)
+
+
+def surrogate_minimize(
+    points: Sequence[Sequence[float]],
+    evaluate: Callable[[list[int]], list[SurrogateObservation]],
+    *,
+    budget: int,
+    batch_size: int = 4,
+    initial_size: int | None = None,
+    min_acquisition: float = 1e-4,
+    seed: int = 0,
+    should_stop: Callable[[], bool] | None = None,
+) -> SurrogateSearchResult:
+    """Constrained Bayesian optimisation over a finite candidate lattice.
+
+    Proposals come in batches: each pick is fantasised at its predicted mean (kriging believer) before the next one is
+    chosen, so a batch can be evaluated in parallel. The acquisition is expected improvement weighted by the
+    probability that the constraint margin is <= 0. ``should_stop`` is polled before every batch after the initial
+    design; a stop ends the search with what has been observed so far.
+    """
+    x = _unit_cube(points) if len(points) else np.zeros((0, 0))
+    budget = max(0, min(budget, len(points)))
+    batch_size = max(1, batch_size)
+    rng = np.random.default_rng(seed)
+    observations: dict[int, SurrogateObservation] = {}
+    batches = 0
+    stop_reason = "exhausted"
+
+    def _run(indices: list[int]) -> None:
+        nonlocal batches
+        for idx, obs in zip(indices, evaluate(indices)):
+            observations[idx] = obs
+        batches += 1
+
+    if budget and x.shape[1] == 0:
+        # A single-point lattice (or all dimensions fixed) leaves nothing to model.
+        _run([0])
+    elif budget:
+        dims = x.shape[1]
+        _run(_initial_design(x, min(budget, initial_size or max(batch_size, 2 * dims + 1)), rng))
+
+    while len(observations) < len(points):
+        if len(observations) >= budget:
+            stop_reason = "budget"
+            break
+        if should_stop is not None and should_stop():
+            stop_reason = "stopped"
+            break
+        observed = list(observations)
+        pool = np.array([idx for idx in range(len(points)) if idx not in observations])
+        x_obs = x[observed]
+        objectives = np.array([observations[i].objective or 0.0 for i in observed])
+        objective_mask = np.array([observations[i].objective is not None for i in observed])
+        constraints = np.array(
+            [
+                _FAILED_CONSTRAINT if observations[i].constraint is None else observations[i].constraint
+                for i in observed
+            ]
+        )
+        # Hyperparameters are refit once per batch and held fixed while fantasising within it.
+        length_scales: tuple[float | None, float | None] = (None, None)
+        batch: list[int] = []
+        for _ in range(min(batch_size, budget - len(observations), len(pool))):
+            scores, length_scales, (c_mu, mu) = _acquisition(
+                x_obs, objectives, objective_mask, constraints, x[pool], length_scales
+            )
+            scores[np.isin(pool, batch)] = -np.inf
+            pick = int(np.argmax(scores))
+            if not batch and scores[pick] < min_acquisition and (objective_mask & (constraints <= 0)).any():
+                break
+            batch.append(int(pool[pick]))
+            # Kriging believer: pretend the pick landed on the surrogate's prediction.
+            x_obs = np.vstack([x_obs, x[pool[pick]]])
+            objectives = np.append(objectives, mu[pick])
+            objective_mask = np.append(objective_mask, bool(objective_mask.any()))
+            constraints = np.append(constraints, c_mu[pick])
+        if not batch:
+            stop_reason = "converged"
+            break
+        _run(batch)
+    return SurrogateSearchResult(
+        observations=observations,
+        simulations=len(observations),
+        batches=batches,
+        candidate_count=len(points),
+        stop_reason=stop_reason,
+    )
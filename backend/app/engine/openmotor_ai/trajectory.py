@@ -4,6 +4,8 @@ from dataclasses import dataclass
 import math
 import xml.etree.ElementTree as ET
 
+import numpy as np
+
 from app.engine.openmotor_ai.motorlib_adapter import simulate_motorlib_with_result
 from app.engine.openmotor_ai.spec import MotorSpec
 from app.engine.openmotor_ai.eng_parser import EngData, load_eng
@@ -28,6 +30,13 @@ class ApogeeResult:
     burnout_time_s: float
 
 
+@dataclass(frozen=True)
+class BatchApogeeResult:
+    apogee_m: np.ndarray
+    max_velocity_m_s: np.ndarray
+    max_mach: np.ndarray
+
+
 def _float_or_zero(text: str | None) -> float:
     try:
         return float(text) if text is not None else 0.0
@@ -98,6 +107,21 @@ def _isa_speed_of_sound(alt_m: float, sea_level_temp_k: float | None = None) ->
     return math.sqrt(gamma * r * t)
 
 
+def _isa_state_array(alt_m: np.ndarray, sea_level_temp_k: float | None = None) -> tuple[np.ndarray, np.ndarray]:
+    # Vectorised _isa_density / _isa_speed_of_sound: returns (density, speed of sound).
+    alt_m = np.maximum(alt_m, 0.0)
+    t0 = sea_level_temp_k if sea_level_temp_k is not None else 288.15
+    lapse = -0.0065
+    r = 287.05287
+    t_low = t0 + lapse * np.minimum(alt_m, 11000.0)
+    p_low = 101325.0 * (t_low / t0) ** (-G0 / (lapse * r))
+    p_high = 22632.06 * np.exp(-G0 * (alt_m - 11000.0) / (r * 216.65))
+    low = alt_m <= 11000.0
+    t = np.where(low, t_low, 216.65)
+    p = np.where(low, p_low, p_high)
+    return p / (r * t), np.sqrt(1.4 * r * t)
+
+
 def _cd_from_mach(mach: float, cd_max: float, mach_max: float, ramp: bool) -> float:
     if not ramp or mach_max <= 0:
         return cd_max
@@ -123,6 +147,70 @@ def _interp(x: float, xs: list[float], ys: list[float]) -> float:
     return ys[-1]
 
 
+def simulate_constant_thrust_apogees(
+    *,
+    thrust_n: np.ndarray,
+    burn_time_s: np.ndarray,
+    dry_mass_kg: float,
+    isp_s: float,
+    ref_diameter_m: float,
+    cd_max: float = 0.5,
+    mach_max: float = 2.0,
+    cd_ramp: bool = False,
+    launch_altitude_m: float = 0.0,
+    temperature_k: float | None = None,
+    timestep_s: float = 0.02,
+    coast_timestep_s: float = 0.1,
+    max_time_s: float = 600.0,
+) -> BatchApogeeResult:
+    """Fly a batch of vertical single-stage rockets with constant-thrust motors side by side.
+
+    Same point-mass model as simulate_single_stage_apogee_params (ISA atmosphere, Mach-dependent Cd, inverse-square
+    gravity), but the motor is an ideal constant-thrust burn whose mass flow follows from the Isp, so thousands of
+    candidates integrate in one vectorised loop without a motorlib run each.
+    """
+    thrust = np.asarray(thrust_n, dtype=float)
+    burn = np.asarray(burn_time_s, dtype=float)
+    mass_flow = thrust / max(isp_s * G0, 1e-9)
+    mass = dry_mass_kg + mass_flow * burn
+    ref_area = math.pi * (ref_diameter_m / 2.0) ** 2
+    h = np.full(thrust.shape, float(launch_altitude_m))
+    v = np.zeros(thrust.shape)
+    apogee = h.copy()
+    max_v = np.zeros(thrust.shape)
+    max_mach = np.zeros(thrust.shape)
+    active = np.ones(thrust.shape, dtype=bool)
+    t = 0.0
+    while active.any() and t <= max_time_s:
+        burning = t < burn
+        # Fine steps while any motor burns; once the whole batch is coasting a coarser step is enough.
+        dt = timestep_s if (burning & active).any() else coast_timestep_s
+        rho, sound = _isa_state_array(h, temperature_k)
+        mach = np.abs(v) / sound
+        if cd_ramp and mach_max > 0:
+            cd = cd_max * np.minimum(mach / mach_max, 1.0)
+        else:
+            cd = cd_max
+        drag = np.sign(v) * 0.5 * rho * v * v * cd * ref_area
+        g = G0 * (R_EARTH_M / (R_EARTH_M + h)) ** 2
+        accel = (np.where(burning, thrust, 0.0) - drag) / mass - g
+        # Rockets still on the pad (thrust below weight) stay put instead of sinking.
+        accel = np.where((h <= launch_altitude_m) & (v <= 0.0) & (accel < 0.0), 0.0, accel)
+        v = np.where(active, v + accel * dt, v)
+        h = np.where(active, h + v * dt, h)
+        mass = np.where(active & burning, np.maximum(mass - mass_flow * dt, dry_mass_kg), mass)
+        max_v = np.maximum(max_v, v)
+        max_mach = np.maximum(max_mach, np.abs(v) / sound)
+        apogee = np.maximum(apogee, h)
+        t += dt
+        active &= burning | (v > 0.0)
+    return BatchApogeeResult(
+        apogee_m=apogee,
+        max_velocity_m_s=max_v,
+        max_mach=max_mach,
+    )
+
+
 def _simulate_stage(
     spec: MotorSpec,
     start_mass_kg: float,
@@ -1,36 +1,345 @@
-from typing import Any
+# Har Har Mahadev
+from __future__ import annotations
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+import hashlib
+import json
+import multiprocessing
+from pathlib import Path
+from typing import Any, Callable
 
 import numpy as np
 
+from app.engine.openmotor_ai.motorlib_adapter import (
+    ConstraintViolation,
+    SimulationLimits,
+    metrics_from_simresult,
+    simulate_motorlib_with_result,
+)
+from app.engine.openmotor_ai.openmotor_pipeline import (
+    VehicleParams,
+    _apply_scales,
+    _default_base_spec,
+    _load_propellant_specs,
+    _normalize_spec_for_motorlib,
+    _total_mass_from_dry,
+)
+from app.engine.openmotor_ai.ric_parser import load_ric
+from app.engine.openmotor_ai.spec import MotorSpec, spec_from_ric
+from app.engine.openmotor_ai.trajectory import simulate_single_stage_apogee_params
+
+SCALE_NAMES = ("diameter_scale", "length_scale", "core_scale", "throat_scale", "exit_scale")
+_DEFAULT_BOUNDS = {
+    "diameter_scale": (1.0, 1.0),
+    "length_scale": (0.5, 2.0),
+    "core_scale": (0.5, 2.0),
+    "throat_scale": (0.5, 3.0),
+    "exit_scale": (0.8, 1.5),
+}
+_OBJECTIVES = ("max_impulse", "impulse", "apogee")
+# Any feasible motor beats a constraint violation, which beats a motor that failed to simulate.
+_INFEASIBLE_LOSS = 1.0e6
+_FAILED_LOSS = 1.0e9
+_CHECKPOINT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ObjectiveContext:
+    base: MotorSpec
+    objective: str
+    limits: SimulationLimits
+    grain_count: int | None = None
+    target_impulse_ns: float | None = None
+    target_apogee_ft: float | None = None
+    dry_mass_kg: float | None = None
+    ref_diameter_m: float = 0.1
+    cd_max: float = 0.5
+    mach_max: float = 2.0
+    cd_ramp: bool = False
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    # Lower is better.
+    loss: float
+    metrics: dict[str, float] | None
+    reason: str | None = None
+
+
+def _scaled_spec(context: ObjectiveContext, vector: tuple[float, ...]) -> MotorSpec:
+    scales = dict(zip(SCALE_NAMES, vector))
+    return _normalize_spec_for_motorlib(
+        _apply_scales(base=context.base, grain_count=context.grain_count, **scales)
+    )
+
+
+def evaluate_scales(context: ObjectiveContext, vector: tuple[float, ...]) -> Evaluation:
+    # Module level and exception-free so it can run in a pool worker.
+    spec = _scaled_spec(context, vector)
+    try:
+        _, sim = simulate_motorlib_with_result(spec, limits=context.limits)
+    except ConstraintViolation as exc:
+        return Evaluation(_INFEASIBLE_LOSS * (1.0 + exc.value / exc.limit), None, "constraint_violation")
+    except Exception as exc:
+        return Evaluation(_FAILED_LOSS, None, f"simulation_failed: {exc}")
+    metrics = metrics_from_simresult(sim)
+    if context.objective == "max_impulse":
+        return Evaluation(-metrics["total_impulse"], metrics)
+    if context.objective == "impulse":
+        target = context.target_impulse_ns or 0.0
+        return Evaluation(abs(metrics["total_impulse"] - target) / max(target, 1e-9), metrics)
+    try:
+        apogee = simulate_single_stage_apogee_params(
+            stage=spec,
+            ref_diameter_m=context.ref_diameter_m,
+            total_mass_kg=_total_mass_from_dry(context.dry_mass_kg or 0.0, metrics),
+            cd_max=context.cd_max,
+            mach_max=context.mach_max,
+            cd_ramp=context.cd_ramp,
+        )
+    except Exception as exc:
+        return Evaluation(_FAILED_LOSS, None, f"trajectory_failed: {exc}")
+    apogee_ft = apogee.apogee_m * 3.28084
+    metrics = metrics | {"apogee_ft": apogee_ft, "max_velocity_m_s": apogee.max_velocity_m_s}
+    target = context.target_apogee_ft or 0.0
+    return Evaluation(abs(apogee_ft - target) / max(target, 1e-9), metrics)
+
+
+def _parse_bounds(raw: dict[str, Any] | None) -> dict[str, tuple[float, float]]:
+    bounds = dict(_DEFAULT_BOUNDS)
+    if raw and ("min" in raw or "max" in raw):
+        # The flat form bounded the old one-dimensional toy objective; it has no meaning for motor scales.
+        raise ValueError(
+            "bounds takes a range per scale factor, e.g. {\"length_scale\": {\"min\": 0.5, \"max\": 2.0}}; "
+            f"the flat {{\"min\", \"max\"}} form is no longer supported (scales: {', '.join(SCALE_NAMES)})"
+        )
+    if raw:
+        for name, entry in raw.items():
+            if name not in bounds:
+                raise ValueError(f"Unknown scale bound: {name}")
+            if not isinstance(entry, dict):
+                raise ValueError(f"bounds.{name} must be an object with min and/or max")
+            lower = float(entry.get("min", bounds[name][0]))
+            upper = float(entry.get("max", bounds[name][1]))
+            if lower > upper:
+                raise ValueError(f"bounds.{name}.min must not exceed bounds.{name}.max")
+            bounds[name] = (lower, upper)
+    if any(lower <= 0 for lower, _ in bounds.values()):
+        raise ValueError("scale bounds must be positive")
+    return bounds
+
+
+def _objective_context(params: dict[str, Any]) -> ObjectiveContext:
+    if params.get("base_ric_path"):
+        base = spec_from_ric(load_ric(params["base_ric_path"]))
+    else:
+        names = [params["propellant"]] if params.get("propellant") else None
+        propellant = _load_propellant_specs(
+            preset_path=params.get("preset_path"),
+            allowed_propellant_families=None,
+            allowed_propellant_names=names,
+        )[0]
+        base = _default_base_spec(
+            VehicleParams(
+                ref_diameter_m=float(params.get("ref_diameter_m", 0.1)),
+                rocket_length_in=float(params.get("rocket_length_in", 60.0)),
+            ),
+            propellant,
+        )
+
+    objective = params.get("objective")
+    if objective is None:
+        if params.get("target_apogee_ft"):
+            objective = "apogee"
+        elif params.get("target_impulse_ns"):
+            objective = "impulse"
+        else:
+            objective = "max_impulse"
+    if objective not in _OBJECTIVES:
+        raise ValueError(f"objective must be one of {', '.join(_OBJECTIVES)}")
+    if objective == "impulse" and not params.get("target_impulse_ns"):
+        raise ValueError("target_impulse_ns is required for the impulse objective")
+    if objective == "apogee" and not (params.get("target_apogee_ft") and params.get("total_mass_kg")):
+        raise ValueError("target_apogee_ft and total_mass_kg are required for the apogee objective")
+
+    constraints = params.get("constraints") or {}
+    max_pressure_psi = constraints.get("max_pressure_psi")
+    return ObjectiveContext(
+        base=_normalize_spec_for_motorlib(base),
+        objective=objective,
+        limits=SimulationLimits(
+            max_pressure_pa=float(max_pressure_psi) * 6894.757 if max_pressure_psi else None,
+            max_kn=float(constraints["max_kn"]) if constraints.get("max_kn") else None,
+        ),
+        grain_count=params.get("grain_count"),
+        target_impulse_ns=params.get("target_impulse_ns"),
+        target_apogee_ft=params.get("target_apogee_ft"),
+        dry_mass_kg=params.get("total_mass_kg"),
+        ref_diameter_m=float(params.get("ref_diameter_m", 0.1)),
+        cd_max=float(params.get("cd_max", 0.5)),
+        mach_max=float(params.get("mach_max", 2.0)),
+        cd_ramp=bool(params.get("cd_ramp", False)),
+    )
 
-def run_evolutionary_optimization(params: dict[str, Any]) -> dict[str, Any]:
+
+def _fingerprint(params: dict[str, Any]) -> str:
+    relevant = {key: value for key, value in params.items() if key not in ("checkpoint_path", "workers")}
+    return hashlib.sha256(json.dumps(relevant, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def _load_checkpoint(path: Path, fingerprint: str) -> dict[str, Any] | None:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if state.get("version") != _CHECKPOINT_VERSION or state.get("fingerprint") != fingerprint:
+        return None
+    return state
+
+
+def _write_checkpoint(path: Path, state: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(state), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+def _latin_hypercube(rng: np.random.Generator, size: int, lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    strata = np.stack([rng.permutation(size) for _ in range(len(lower))], axis=1)
+    unit = (strata + rng.random((size, len(lower)))) / size
+    return lower + unit * (upper - lower)
+
+
+def _evaluate_population(
+    context: ObjectiveContext, vectors: np.ndarray, executor: Executor | None
+) -> list[Evaluation]:
+    candidates = [tuple(float(value) for value in row) for row in vectors]
+    if executor is None:
+        return [evaluate_scales(context, vector) for vector in candidates]
+    return list(executor.map(evaluate_scales, [context] * len(candidates), candidates))
+
+
+def run_evolutionary_optimization(
+    params: dict[str, Any],
+    progress_cb: Callable[[dict[str, Any]], None] | None = None,
+) -> dict[str, Any]:
+    """Differential evolution (rand/1/bin) over the five MotorSpec scale factors.
+
+    Every candidate is a motorlib simulation of the scaled base motor, scored by the chosen objective: total impulse
+    (maximised), distance to a target impulse, or distance to a target apogee. When a checkpoint path is given the
+    population and RNG state are written after every generation, and a re-run with the same params resumes there.
+    """
     population_size = int(params.get("population_size", 30))
     iterations = int(params.get("iterations", 25))
-    bounds = params.get("bounds", {"min": 0.0, "max": 1.0})
-
-    lower = float(bounds.get("min", 0.0))
-    upper = float(bounds.get("max", 1.0))
     if population_size <= 0 or iterations <= 0:
         raise ValueError("population_size and iterations must be positive")
-    if lower >= upper:
-        raise ValueError("bounds.min must be less than bounds.max")
+    if population_size < 4:
+        raise ValueError("population_size must be at least 4 for differential evolution")
+    mutation = float(params.get("mutation", 0.7))
+    crossover = float(params.get("crossover", 0.9))
+    if not 0.0 < mutation <= 2.0 or not 0.0 <= crossover <= 1.0:
+        raise ValueError("mutation must be in (0, 2] and crossover in [0, 1]")
+    seed = int(params.get("seed", 0))
+    workers = int(params.get("workers", 1))
+    bounds = _parse_bounds(params.get("bounds"))
+    context = _objective_context(params)
+    lower = np.array([bounds[name][0] for name in SCALE_NAMES])
+    upper = np.array([bounds[name][1] for name in SCALE_NAMES])
+
+    checkpoint_path = Path(params["checkpoint_path"]) if params.get("checkpoint_path") else None
+    fingerprint = _fingerprint(params)
+    state = _load_checkpoint(checkpoint_path, fingerprint) if checkpoint_path else None
+    rng = np.random.default_rng(seed)
+
+    # Daemonic processes (e.g. Celery prefork children) cannot start a pool of their own.
+    executor: ProcessPoolExecutor | None = None
+    if workers > 1 and not multiprocessing.current_process().daemon:
+        executor = ProcessPoolExecutor(max_workers=min(workers, population_size))
+    try:
+        if state is not None:
+            rng.bit_generator.state = state["rng_state"]
+            population = np.array(state["population"], dtype=float)
+            evaluations = [Evaluation(**entry) for entry in state["evaluations"]]
+            history: list[dict[str, Any]] = state["history"]
+            start_generation = int(state["generation"])
+            simulations = int(state["simulations"])
+        else:
+            population = _latin_hypercube(rng, population_size, lower, upper)
+            evaluations = _evaluate_population(context, population, executor)
+            history = []
+            start_generation = 0
+            simulations = population_size
 
-    rng = np.random.default_rng()
-    best_candidate = None
-    best_score = float("-inf")
+        for generation in range(start_generation, iterations):
+            trials = np.empty_like(population)
+            for idx in range(population_size):
+                others = [other for other in range(population_size) if other != idx]
+                a, b, c = rng.choice(others, size=3, replace=False)
+                mutant = population[a] + mutation * (population[b] - population[c])
+                cross = rng.random(len(SCALE_NAMES)) < crossover
+                cross[rng.integers(len(SCALE_NAMES))] = True
+                trials[idx] = np.clip(np.where(cross, mutant, population[idx]), lower, upper)
+            trial_evaluations = _evaluate_population(context, trials, executor)
+            simulations += population_size
+            improved = 0
+            for idx, trial in enumerate(trial_evaluations):
+                if trial.loss <= evaluations[idx].loss:
+                    population[idx] = trials[idx]
+                    evaluations[idx] = trial
+                    improved += 1
 
-    for _ in range(iterations):
-        population = rng.uniform(lower, upper, population_size)
-        scores = -np.square(population - (lower + upper) / 2.0)
-        best_idx = int(np.argmax(scores))
-        if scores[best_idx] > best_score:
-            best_score = float(scores[best_idx])
-            best_candidate = float(population[best_idx])
+            losses = np.array([evaluation.loss for evaluation in evaluations])
+            best_idx = int(np.argmin(losses))
+            entry = {
+                "generation": generation + 1,
+                "best_loss": float(losses[best_idx]),
+                "mean_loss": float(losses.mean()),
+                "feasible": int(sum(1 for evaluation in evaluations if evaluation.metrics is not None)),
+                "improved": improved,
+                "simulations": simulations,
+            }
+            history.append(entry)
+            if checkpoint_path:
+                _write_checkpoint(
+                    checkpoint_path,
+                    {
+                        "version": _CHECKPOINT_VERSION,
+                        "fingerprint": fingerprint,
+                        "generation": generation + 1,
+                        "population": population.tolist(),
+                        "evaluations": [
+                            {"loss": e.loss, "metrics": e.metrics, "reason": e.reason} for e in evaluations
+                        ],
+                        "rng_state": rng.bit_generator.state,
+                        "history": history,
+                        "simulations": simulations,
+                    },
+                )
+            if progress_cb:
+                progress_cb({**entry, "iterations": iterations, "population_size": population_size})
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
+    losses = np.array([evaluation.loss for evaluation in evaluations])
+    best_idx = int(np.argmin(losses))
+    best = evaluations[best_idx]
     return {
-        "best_candidate": best_candidate,
-        "best_score": best_score,
+        "strategy": "differential_evolution",
+        "objective": context.objective,
+        "best_candidate": {
+            "scales": {name: float(value) for name, value in zip(SCALE_NAMES, population[best_idx])},
+            "metrics": best.metrics,
+            "reason": best.reason,
+        },
+        # Higher is better: total impulse for max_impulse, minus the relative error for the target objectives.
+        "best_score": -float(best.loss),
         "population_size": population_size,
         "iterations": iterations,
-        "bounds": {"min": lower, "max": upper},
+        "bounds": {name: {"min": low, "max": high} for name, (low, high) in bounds.items()},
+        "seed": seed,
+        "simulations": simulations,
+        "resumed_from_generation": start_generation if state is not None else None,
+        "history": history,
     }
@@ -1,9 +1,24 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+import copy
+import hashlib
+import json
 from typing import Any
 
 import numpy as np
 
+from app.engine.openmotor_ai.trajectory import G0, simulate_constant_thrust_apogees
+
+_ISP_S = 200.0
+_DEFAULT_DIAMETER_M = 0.1
+_SCALE_BOUNDS = (0.5, 2.0)
+# Without a thrust target the base thrust is only a rough guess, so the search may go far below it.
+_OPEN_SCALE_BOUNDS = (0.02, 2.0)
+_BURN_TIME_BOUNDS_S = (0.2, 12.0)
+_RESULT_CACHE_SIZE = 256
+_RESULT_CACHE: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+
 
 def _require_positive(value: float, name: str) -> float:
     if value <= 0:
@@ -11,8 +26,35 @@ def _require_positive(value: float, name: str) -> float:
     return value
 
 
+def _payload_hash(payload: dict[str, Any]) -> str:
+    normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def run_input_optimization(
     user_input: dict[str, Any], iterations: int = 25, population_size: int = 30
+) -> dict[str, Any]:
+    """Recommend inputs by flying a batch of constant-thrust rockets per iteration.
+
+    Results are cached per payload hash and search size, so re-optimising a stored input is free. Callers get a
+    deep copy and may mutate it.
+    """
+    iterations = int(_require_positive(iterations, "iterations"))
+    population_size = int(_require_positive(population_size, "population_size"))
+    key = (_payload_hash(user_input), iterations, population_size)
+    cached = _RESULT_CACHE.get(key)
+    if cached is None:
+        cached = _optimize(user_input, iterations, population_size, seed=int(key[0][:8], 16))
+        _RESULT_CACHE[key] = cached
+        while len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+            _RESULT_CACHE.popitem(last=False)
+    else:
+        _RESULT_CACHE.move_to_end(key)
+    return copy.deepcopy(cached)
+
+
+def _optimize(
+    user_input: dict[str, Any], iterations: int, population_size: int, seed: int
 ) -> dict[str, Any]:
     target_apogee_m = _require_positive(
         float(user_input.get("target_apogee_m", 0.0)), "target_apogee_m"
@@ -41,51 +83,66 @@ def run_input_optimization(
 
     base_thrust_n = target_thrust_n or max(1000.0, target_apogee_m * 8.0)
     base_payload_kg = payload_mass_kg or max(5.0, (max_total_mass_kg or 50.0) * 0.15)
-
+    # Airframe, recovery and motor hardware scale with the payload; propellant comes on top of this.
+    dry_mass_kg = max(base_payload_kg * 4.0, base_payload_kg + 10.0)
+    ref_diameter_m = max_diameter_m or _DEFAULT_DIAMETER_M
+    aim_apogee_m = target_apogee_m + altitude_margin_m
+
+    def _evaluate(scales: np.ndarray, burn_times: np.ndarray) -> list[dict[str, float]]:
+        thrust = base_thrust_n * scales
+        flights = simulate_constant_thrust_apogees(
+            thrust_n=thrust,
+            burn_time_s=burn_times,
+            dry_mass_kg=dry_mass_kg,
+            isp_s=_ISP_S,
+            ref_diameter_m=ref_diameter_m,
+        )
+        total_mass = dry_mass_kg + thrust * burn_times / (_ISP_S * G0)
+        score = -np.abs(flights.apogee_m - aim_apogee_m)
+        if max_mach is not None:
+            score -= np.maximum(flights.max_mach - max_mach, 0.0) * 1000.0
+        if max_total_mass_kg is not None:
+            score -= np.maximum(total_mass - max_total_mass_kg, 0.0) * 100.0
+        return [
+            {
+                "scale": float(scales[idx]),
+                "score": float(score[idx]),
+                "estimated_apogee_m": float(flights.apogee_m[idx]),
+                "estimated_max_mach": float(flights.max_mach[idx]),
+                "estimated_thrust_n": float(thrust[idx]),
+                "estimated_burn_time_s": float(burn_times[idx]),
+                "estimated_total_impulse_ns": float(thrust[idx] * burn_times[idx]),
+                "estimated_total_mass_kg": float(total_mass[idx]),
+            }
+            for idx in range(len(scales))
+        ]
+
+    # Narrowing box search over (thrust scale, burn time): each iteration stratifies the box, flies the whole
+    # population in one batch and halves the box around the best candidate so far.
+    rng = np.random.default_rng(seed)
+    scale_bounds = _SCALE_BOUNDS if target_thrust_n else _OPEN_SCALE_BOUNDS
+    scale_low, scale_high = scale_bounds
+    burn_low, burn_high = _BURN_TIME_BOUNDS_S
     best = None
-    best_score = float("-inf")
     history: list[dict[str, Any]] = []
-
-    low, high = 0.8, 1.2
     for iteration in range(iterations):
-        scales = np.linspace(low, high, population_size)
-        iteration_best = None
-        iteration_best_score = float("-inf")
-        for scale in scales:
-            thrust_n = base_thrust_n * float(scale)
-            estimated_apogee_m = thrust_n * 0.1
-            estimated_max_mach = min(3.0, 0.2 + thrust_n / 20000.0)
-            score = -abs(estimated_apogee_m - target_apogee_m)
-            if max_mach is not None and estimated_max_mach > max_mach:
-                score -= (estimated_max_mach - max_mach) * 1000.0
-
-            if score > iteration_best_score:
-                iteration_best_score = score
-                iteration_best = {
-                    "scale": float(scale),
-                    "score": float(score),
-                    "estimated_apogee_m": float(estimated_apogee_m),
-                    "estimated_max_mach": float(estimated_max_mach),
-                    "estimated_thrust_n": float(thrust_n),
-                }
-        if iteration_best:
-            history.append({"iteration": iteration + 1, **iteration_best})
-            if iteration_best_score > best_score:
-                best_score = iteration_best_score
-                best = iteration_best
-            span = max(0.05, (high - low) * 0.5)
-            low = max(0.5, iteration_best["scale"] - span / 2.0)
-            high = min(2.0, iteration_best["scale"] + span / 2.0)
-
-    best = best or {
-        "scale": 1.0,
-        "score": float("-inf"),
-        "estimated_apogee_m": base_thrust_n * 0.1,
-        "estimated_max_mach": min(3.0, 0.2 + base_thrust_n / 20000.0),
-        "estimated_thrust_n": base_thrust_n,
-    }
-
-    estimated_total_mass_kg = max(base_payload_kg * 4.0, base_payload_kg + 10.0)
+        strata = (rng.permutation(population_size) + rng.random(population_size)) / population_size
+        scales = scale_low + strata * (scale_high - scale_low)
+        strata = (rng.permutation(population_size) + rng.random(population_size)) / population_size
+        burn_times = burn_low + strata * (burn_high - burn_low)
+        candidates = _evaluate(scales, burn_times)
+        iteration_best = max(candidates, key=lambda candidate: candidate["score"])
+        history.append({"iteration": iteration + 1, **iteration_best})
+        if best is None or iteration_best["score"] > best["score"]:
+            best = iteration_best
+        scale_span = max(0.02, (scale_high - scale_low) * 0.5)
+        burn_span = max(0.05, (burn_high - burn_low) * 0.5)
+        scale_low = max(scale_bounds[0], best["scale"] - scale_span / 2.0)
+        scale_high = min(scale_bounds[1], best["scale"] + scale_span / 2.0)
+        burn_low = max(_BURN_TIME_BOUNDS_S[0], best["estimated_burn_time_s"] - burn_span / 2.0)
+        burn_high = min(_BURN_TIME_BOUNDS_S[1], best["estimated_burn_time_s"] + burn_span / 2.0)
+
+    estimated_total_mass_kg = best["estimated_total_mass_kg"]
     if max_total_mass_kg is not None:
         estimated_total_mass_kg = min(estimated_total_mass_kg, max_total_mass_kg)
 
@@ -107,6 +164,9 @@ def run_input_optimization(
             "estimated_total_mass_kg": estimated_total_mass_kg,
             "best_scale": best["scale"],
             "score": best["score"],
+            "estimated_burn_time_s": best["estimated_burn_time_s"],
+            "estimated_total_impulse_ns": best["estimated_total_impulse_ns"],
+            "evaluations": iterations * population_size,
         },
         "iterations": history,
     }
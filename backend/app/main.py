@@ -15,7 +15,8 @@ from app.api.v1.routes_optimization import router as optimization_router
 from app.api.v1.routes_ork import router as ork_router
 from app.api.v1.routes_simulation_legacy import router as simulation_legacy_router
 from app.core.config import get_settings
-from app.db.queries import create_jobs_table, create_user_inputs_table
+from app.db.queries import create_job_progress_table, create_jobs_table, create_user_inputs_table
+from app.db.session import close_pool, pool_stats
 from app.engine.openmotor_ai.ric_writer import normalize_ric_text
 
 logger = logging.getLogger("arx.backend")
@@ -47,6 +48,11 @@ def health_check():
     return {"status": "ok"}
 
 
+@app.get("/health/db")
+def db_health_check():
+    return {"status": "ok", "pool": pool_stats()}
+
+
 @app.get("/api/v1/downloads/{file_path:path}")
 def download_artifact(file_path: str):
     candidate = (downloads_dir / file_path).resolve()
@@ -83,6 +89,7 @@ def download_artifact(file_path: str):
 def on_startup():
     try:
         create_jobs_table()
+        create_job_progress_table()
         create_user_inputs_table()
         logger.info("jobs table ensured")
     except Exception as exc:  # pragma: no cover - surfaced during startup
@@ -90,6 +97,11 @@ def on_startup():
         raise
 
 
+@app.on_event("shutdown")
+def on_shutdown():
+    close_pool()
+
+
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception):
     logger.exception("unhandled error: %s", exc)
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+# Per-candidate lists of a mission-target result. They grow with the sweep, so large ones live in files next to
+# the job's other artifacts and the jobs row keeps a pointer, the row count and the first few rows. A dotted name is
+# a list nested inside the result.
+RESULT_SECTIONS = ("candidates", "ranked", "rejected", "pareto.candidates")
+RESULT_SECTION_FORMAT = "jsonl.gz"
+
+
+def _section_rows(result: dict[str, Any], section: str) -> Any:
+    value: Any = result
+    for part in section.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def _replace_section(result: dict[str, Any], section: str, rows: list[Any]) -> dict[str, Any]:
+    head, _, rest = section.partition(".")
+    if not rest:
+        return {**result, head: rows}
+    return {**result, head: _replace_section(result[head], rest, rows)}
+
+
+def _write_rows(path: Path, rows: list[Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as handle:
+        for row in rows:
+            handle.write(json.dumps(row, separators=(",", ":")))
+            handle.write("\n")
+    # Readers never see a half-written section, even if the worker dies mid-write.
+    os.replace(tmp_path, path)
+
+
+def store_result_sections(result: dict[str, Any], store_dir: Path, *, inline_top_k: int) -> dict[str, Any]:
+    """Move every section longer than ``inline_top_k`` rows into ``store_dir`` and return the slimmed result.
+
+    Each stored section keeps its first ``inline_top_k`` rows inline, which for ``ranked`` are the best candidates.
+    ``result_sections`` records the path and full row count of each stored section.
+    """
+    slim = dict(result)
+    sections: dict[str, dict[str, Any]] = {}
+    for section in RESULT_SECTIONS:
+        rows = _section_rows(result, section)
+        if not isinstance(rows, list) or len(rows) <= inline_top_k:
+            continue
+        path = (store_dir / f"{section}.{RESULT_SECTION_FORMAT}").resolve()
+        _write_rows(path, rows)
+        sections[section] = {"path": str(path), "count": len(rows), "format": RESULT_SECTION_FORMAT}
+        slim = _replace_section(slim, section, rows[:inline_top_k])
+    if sections:
+        slim["result_sections"] = sections
+    return slim
+
+
+def iter_result_section(result: dict[str, Any], section: str) -> Iterator[dict[str, Any]]:
+    """Rows of ``section``, from its stored file when there is one, else from the inline list."""
+    stored = (result.get("result_sections") or {}).get(section)
+    if stored is None:
+        yield from _section_rows(result, section) or []
+        return
+    with gzip.open(stored["path"], "rt", encoding="utf-8") as handle:
+        for line in handle:
+            yield json.loads(line)
+
+
+def parse_result_filters(filters: list[str]) -> dict[str, str]:
+    parsed: dict[str, str] = {}
+    for item in filters:
+        key, sep, value = item.partition(":")
+        if not sep or not key:
+            raise ValueError(f"filter must look like field:value, got {item!r}")
+        parsed[key] = value
+    return parsed
+
+
+def _filter_text(value: Any) -> str:
+    # Booleans and nulls are matched in their JSON spelling, so within_tolerance:true works.
+    if value is None or isinstance(value, bool):
+        return json.dumps(value)
+    return str(value)
+
+
+def read_result_section(
+    result: dict[str, Any],
+    section: str,
+    *,
+    offset: int = 0,
+    limit: int | None = None,
+    filters: dict[str, str] | None = None,
+) -> tuple[int, list[dict[str, Any]]]:
+    """One page of ``section`` rows matching every ``field: value`` filter, and the total number of matches."""
+    filters = filters or {}
+    total = 0
+    page: list[dict[str, Any]] = []
+    for row in iter_result_section(result, section):
+        if any(_filter_text(row.get(key)) != value for key, value in filters.items()):
+            continue
+        if total >= offset and (limit is None or len(page) < limit):
+            page.append(row)
+        total += 1
+    return total, page
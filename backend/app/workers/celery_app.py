@@ -1,6 +1,9 @@
 from celery import Celery
+from celery.signals import worker_process_init
+from kombu import Queue
 
 from app.core.config import get_settings
+from app.workers.routing import BATCH_QUEUE, INTERACTIVE_QUEUE, PRIORITY_STEPS, TASK_ROUTES
 
 settings = get_settings()
 
@@ -15,5 +18,28 @@ celery_app.conf.update(
     task_soft_time_limit=settings.celery_task_soft_time_limit,
     task_time_limit=settings.celery_task_time_limit,
     task_track_started=True,
-    broker_transport_options={"visibility_timeout": settings.celery_task_time_limit},
+    broker_transport_options={
+        "visibility_timeout": settings.celery_task_time_limit,
+        "priority_steps": PRIORITY_STEPS,
+        "sep": ":",
+        "queue_order_strategy": "priority",
+    },
+    task_queues=(Queue(INTERACTIVE_QUEUE), Queue(BATCH_QUEUE)),
+    task_default_queue=BATCH_QUEUE,
+    task_routes=TASK_ROUTES,
+    # A worker holding a prefetched sweep would make the next job wait behind it.
+    worker_prefetch_multiplier=1,
+    # Warm-up runs in worker_process_init, and a child that has not reported in by this timeout is killed and
+    # respawned. Celery's 4s default is shorter than loading scipy and skfmm, let alone starting the JVM.
+    worker_proc_alive_timeout=settings.worker_proc_alive_timeout_s,
 )
+
+
+@worker_process_init.connect
+def _warm_worker_process(**_kwargs) -> None:
+    # Runs in each pool child after the fork, so the JVM is never started in the parent.
+    if not settings.worker_warmup:
+        return
+    from app.workers.warmup import warm_worker_process
+
+    warm_worker_process(include_openrocket=settings.worker_warmup_openrocket)
@@ -0,0 +1,60 @@
+import json
+import logging
+from typing import Any
+
+import redis
+
+from app.core.config import get_settings
+
+logger = logging.getLogger("arx.backend.events")
+
+TERMINAL_EVENTS = frozenset({"completed", "failed", "cancelled"})
+_CANCEL_TTL_S = 24 * 3600
+
+_client: redis.Redis | None = None
+
+
+def job_events_channel(job_id: str) -> str:
+    return f"arx:jobs:{job_id}:events"
+
+
+def job_cancel_key(job_id: str) -> str:
+    return f"arx:jobs:{job_id}:cancel"
+
+
+def _get_client() -> redis.Redis:
+    # redis-py reconnects after a fork on its own, so one client per module is safe under Celery prefork.
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(get_settings().redis_url)
+    return _client
+
+
+def job_event_name(payload: dict[str, Any]) -> str:
+    return "candidate" if payload.get("last_status") in ("winner", "candidate") else "progress"
+
+
+def encode_job_event(event: str, payload: dict[str, Any], seq: int | None = None) -> str:
+    return json.dumps({"event": event, "seq": seq, "payload": payload}, default=str)
+
+
+def publish_job_event(job_id: str, event: str, payload: dict[str, Any], seq: int | None = None) -> None:
+    try:
+        _get_client().publish(job_events_channel(job_id), encode_job_event(event, payload, seq))
+    except redis.RedisError as exc:
+        # Progress events are also in job_progress and the final state is on the job row, so a stream
+        # subscriber that misses a publish still catches up on reconnect.
+        logger.warning("job event publish failed for %s: %s", job_id, exc)
+
+
+def request_job_cancel(job_id: str) -> None:
+    _get_client().set(job_cancel_key(job_id), "1", ex=_CANCEL_TTL_S)
+
+
+def job_cancel_requested(job_id: str) -> bool:
+    try:
+        return bool(_get_client().exists(job_cancel_key(job_id)))
+    except redis.RedisError as exc:
+        # Keep searching rather than abandon a job because Redis blinked.
+        logger.warning("job cancel check failed for %s: %s", job_id, exc)
+        return False
@@ -0,0 +1,80 @@
+import math
+from typing import Any
+
+from app.core.config import get_settings
+
+INTERACTIVE_QUEUE = "interactive"
+BATCH_QUEUE = "batch"
+
+# Where each task goes when it is sent without an explicit route. Enqueue paths that can size the job use
+# ``job_route`` instead, which may move a cheap batch job onto the interactive queue.
+TASK_ROUTES = {
+    "run_motor_first": {"queue": INTERACTIVE_QUEUE},
+    "run_input_optimization": {"queue": INTERACTIVE_QUEUE},
+    "run_sync_job": {"queue": INTERACTIVE_QUEUE},
+    "run_optimization": {"queue": BATCH_QUEUE},
+    "run_mission_target": {"queue": BATCH_QUEUE},
+    "run_mission_shard": {"queue": BATCH_QUEUE},
+    "reduce_mission_shards": {"queue": BATCH_QUEUE},
+}
+
+# Redis has no native priorities; kombu emulates them with one list per step, and 0 is served first.
+PRIORITY_STEPS = list(range(10))
+
+_MISSION_SCALE_KEYS = ("diameter_scales", "length_scales", "core_scales", "throat_scales", "exit_scales")
+_MOTOR_FIRST_SCALE_KEYS = ("diameter_scales", "length_scales", "mass_scales")
+_MOTOR_FIRST_DEFAULT_AXIS = 3
+# Differential evolution runs generation after generation of full motorlib simulations and checkpoints between
+# them; even the default run would hold an interactive worker for minutes, so its size only sets the priority.
+_BATCH_ONLY_JOB_TYPES = ("optimize",)
+
+
+def _grid_size(space: dict[str, Any] | None, keys: tuple[str, ...], default_axis: int = 1) -> int:
+    space = space or {}
+    size = 1
+    for key in keys:
+        size *= len(space.get(key) or ()) or default_axis
+    return size
+
+
+def _mission_propellant_count(params: dict[str, Any]) -> int:
+    from app.engine.openmotor_ai.openmotor_pipeline import _PREFERRED_PROPELLANT_ORDER
+
+    names = params.get("allowed_propellant_names")
+    if names:
+        return len(names)
+    # A family filter or the full library is sized like the default shortlist; screening trims both anyway.
+    return len(_PREFERRED_PROPELLANT_ORDER)
+
+
+def estimate_job_cost(job_type: str, params: dict[str, Any]) -> int:
+    """Rough number of simulations a job will run, from the inputs alone.
+
+    Only used to pick a queue and priority, so it needs to order jobs correctly, not predict run time.
+    """
+    if job_type == "mission_target":
+        search = params.get("search") or {}
+        grid = _grid_size(search, _MISSION_SCALE_KEYS)
+        if search.get("max_simulations"):
+            grid = min(grid, int(search["max_simulations"]))
+        splits = len(params.get("split_ratios") or ()) or 1
+        stages = int(params.get("stage_count") or 1) if params.get("target_only") else 2
+        return grid * splits * stages * _mission_propellant_count(params)
+    if job_type == "motor_first":
+        return _grid_size(params.get("design_space"), _MOTOR_FIRST_SCALE_KEYS, _MOTOR_FIRST_DEFAULT_AXIS)
+    if job_type in ("optimize", "optimize_input"):
+        return int(params.get("iterations", 25)) * int(params.get("population_size", 30))
+    raise ValueError(f"Unknown job type: {job_type}")
+
+
+def job_route(job_type: str, params: dict[str, Any]) -> dict[str, Any]:
+    """``apply_async`` options for a job: the interactive queue when it is cheap enough, else batch.
+
+    Evolutionary optimization always goes to batch. Within a queue, cheaper jobs get a better (lower) priority, one
+    step per order of magnitude of cost.
+    """
+    cost = estimate_job_cost(job_type, params)
+    interactive = job_type not in _BATCH_ONLY_JOB_TYPES and cost <= get_settings().interactive_max_cost
+    queue = INTERACTIVE_QUEUE if interactive else BATCH_QUEUE
+    priority = min(int(math.log10(max(cost, 1))), PRIORITY_STEPS[-1])
+    return {"queue": queue, "priority": priority}
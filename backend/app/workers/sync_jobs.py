@@ -0,0 +1,29 @@
+from typing import Any, Callable
+
+
+def _module_r_auto_build(params: dict[str, Any]) -> dict[str, Any]:
+    from app.api.v1.routes_module_r import run_parametric_build
+
+    return run_parametric_build(**params).model_dump(mode="json")
+
+
+def _openrocket_like_legacy(params: dict[str, Any]) -> dict[str, Any]:
+    from app.api.v1.routes_simulation_legacy import run_openrocket_like_legacy
+
+    return run_openrocket_like_legacy(params)
+
+
+# Endpoint work the API runs on a worker through ``app.api.v1.offload``, by job type.
+SYNC_JOB_RUNNERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "module_r_auto_build": _module_r_auto_build,
+    "openrocket_like_legacy": _openrocket_like_legacy,
+}
+
+
+def sync_job_error_status(exc: Exception) -> int:
+    # The HTTP status the endpoint answered with when it ran the work inline.
+    if isinstance(exc, FileNotFoundError):
+        return 404
+    if isinstance(exc, ValueError):
+        return 400
+    return 500
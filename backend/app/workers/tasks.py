@@ -3,15 +3,24 @@ from pathlib import Path
 import time
 from typing import Any
 
-from app.api.v1.v1_mappers import compute_inputs_hash
-from app.db.queries import update_job
+from celery import chord
+
+from app.api.v1.v1_mappers import JOB_INPUT_FILE_KEYS, compute_inputs_hash
+from app.core.config import get_settings
+from app.db.queries import append_job_progress, update_job
 from app.engine.openmotor_ai.engine_versions import openmotor_motorlib_version, trajectory_engine_version
 from app.engine.optimizer.evolutionary import run_evolutionary_optimization
 from app.engine.optimizer.input_optimizer import run_input_optimization
+from app.services.result_store import store_result_sections
 from app.workers.celery_app import celery_app
+from app.workers.events import job_cancel_requested, job_event_name, publish_job_event
+from app.workers.routing import job_route
+from app.workers.sync_jobs import SYNC_JOB_RUNNERS, sync_job_error_status
 
 logger = logging.getLogger("arx.backend.worker")
 
+_SEARCH_DEADLINE_SHARE = 0.8
+
 
 def _json_safe(value):
     if isinstance(value, dict):
@@ -26,15 +35,40 @@ def _json_safe(value):
     return value
 
 
+def _report_progress(job_id: str, payload: dict[str, Any]) -> None:
+    payload = _json_safe(payload)
+    seq = append_job_progress(job_id, payload)
+    publish_job_event(job_id, job_event_name(payload), payload, seq=seq)
+
+
+def _finish_job(
+    job_id: str,
+    status: str,
+    result: dict[str, Any] | None = None,
+    error: str | None = None,
+) -> None:
+    update_job(job_id, status=status, result=result, error=error)
+    # Stream subscribers only learn that the job ended; the result itself is read once from the job row.
+    publish_job_event(job_id, status, {"error": error} if error else {})
+
+
 @celery_app.task(bind=True, name="run_optimization")
 def run_optimization_task(self, job_id: str, params: dict[str, Any]) -> None:
     update_job(job_id, status="running")
     try:
-        result = run_evolutionary_optimization(params)
-        update_job(job_id, status="completed", result=result)
+        base_output = params.get("output_dir", "backend/tests")
+        checkpoint_path = str(Path(base_output) / "jobs" / job_id / "evolutionary_checkpoint.json")
+
+        def progress_cb(payload: dict[str, Any]) -> None:
+            _report_progress(job_id, payload)
+
+        result = run_evolutionary_optimization(
+            {"checkpoint_path": checkpoint_path, **params}, progress_cb=progress_cb
+        )
+        _finish_job(job_id, status="completed", result=_json_safe(result))
     except Exception as exc:
         logger.exception("optimization failed: %s", exc)
-        update_job(job_id, status="failed", error=str(exc))
+        _finish_job(job_id, status="failed", error=str(exc))
         raise
 
 
@@ -59,17 +93,17 @@ def run_motor_first_task(self, job_id: str, params: dict[str, Any]) -> None:
             ai_prompt=params.get("ai_prompt"),
         )
         result = {
-            "inputs_hash": compute_inputs_hash(params),
+            "inputs_hash": compute_inputs_hash(params, JOB_INPUT_FILE_KEYS["motor_first"]),
             "engine_versions": {
                 "trajectory_engine": trajectory_engine_version(),
                 "openmotor_motorlib": openmotor_motorlib_version(),
             },
             "motor_first_result": result,
         }
-        update_job(job_id, status="completed", result=result)
+        _finish_job(job_id, status="completed", result=result)
     except Exception as exc:
         logger.exception("motor-first failed: %s", exc)
-        update_job(job_id, status="failed", error=str(exc))
+        _finish_job(job_id, status="failed", error=str(exc))
         raise
 
 
@@ -88,26 +122,96 @@ def run_input_optimization_task(
         iterations = int(params.get("iterations", 25))
         population_size = int(params.get("population_size", 30))
         result = run_input_optimization(payload, iterations=iterations, population_size=population_size)
-        update_job(job_id, status="completed", result=result)
+        _finish_job(job_id, status="completed", result=result)
     except Exception as exc:
         logger.exception("input optimization failed: %s", exc)
-        update_job(job_id, status="failed", error=str(exc))
+        _finish_job(job_id, status="failed", error=str(exc))
+        raise
+
+
+def _mission_design_kwargs(params: dict[str, Any]) -> dict[str, Any]:
+    # Arguments shared by plan_mission_shards and mission_targeted_design_shard, rebuilt from params in every task.
+    from app.engine.openmotor_ai.openmotor_pipeline import StageSearchConfig, TrajectoryTargets, TwoStageConstraints
+
+    return {
+        "base_ric_path": params["base_ric_path"],
+        "stage1_ric_path": params.get("stage1_ric_path"),
+        "rkt_path": params["rkt_path"],
+        "targets": TrajectoryTargets(
+            apogee_ft=params.get("target_apogee_ft"),
+            max_velocity_m_s=params.get("max_velocity_m_s"),
+            tolerance_pct=params.get("tolerance_pct", 0.02),
+        ),
+        "constraints": TwoStageConstraints(**params["constraints"]),
+        "search": StageSearchConfig(**params["search"]),
+        "split_ratios": params["split_ratios"],
+        "cd_max": params.get("cd_max", 0.5),
+        "mach_max": params.get("mach_max", 2.0),
+        "cd_ramp": params.get("cd_ramp", False),
+        "total_mass_kg": params.get("total_mass_kg"),
+        "separation_delay_s": params.get("separation_delay_s", 0.0),
+        "ignition_delay_s": params.get("ignition_delay_s", 0.0),
+        "allowed_propellant_families": params.get("allowed_propellant_families"),
+        "allowed_propellant_names": params.get("allowed_propellant_names"),
+        "preset_path": params.get("preset_path"),
+        "stage_cache_dir": str(Path(params.get("output_dir", "backend/tests")) / "stage_cache"),
+    }
+
+
+def _mission_result_payload(result: dict[str, Any], params: dict[str, Any], job_id: str) -> dict[str, Any]:
+    from app.engine.openmotor_ai.openmotor_pipeline import _resolve_output_dir
+
+    engine_versions = {
+        "openmotor_motorlib": openmotor_motorlib_version(),
+        "trajectory_engine": trajectory_engine_version(),
+    }
+    # Full candidate logs and rejects go to compressed files, so polls and reports don't re-read megabytes of JSONB.
+    result = store_result_sections(
+        _json_safe(result),
+        _resolve_output_dir(params.get("output_dir", "backend/tests")) / "jobs" / job_id / "results",
+        inline_top_k=get_settings().result_inline_top_k,
+    )
+    return _json_safe(
+        {
+            "openmotor_motorlib_result": result,
+            "inputs_hash": compute_inputs_hash(params, JOB_INPUT_FILE_KEYS["mission_target"]),
+            "engine_versions": engine_versions,
+        }
+    )
+
+
+@celery_app.task(bind=True, name="run_sync_job")
+def run_sync_job_task(self, job_id: str, job_type: str, params: dict[str, Any]) -> None:
+    update_job(job_id, status="running")
+    try:
+        result = SYNC_JOB_RUNNERS[job_type](params)
+        _finish_job(job_id, status="completed", result=_json_safe(result))
+    except Exception as exc:
+        logger.exception("%s failed: %s", job_type, exc)
+        # The waiting request answers with the status the endpoint would have raised inline.
+        _finish_job(job_id, status="failed", result={"error_status": sync_job_error_status(exc)}, error=str(exc))
         raise
 
 
 @celery_app.task(bind=True, name="run_mission_target")
 def run_mission_target_task(self, job_id: str, params: dict[str, Any]) -> None:
+    if job_cancel_requested(job_id):
+        _finish_job(job_id, status="cancelled")
+        return
     update_job(job_id, status="running")
     try:
         from app.engine.openmotor_ai.openmotor_pipeline import (
             StageSearchConfig,
             TrajectoryTargets,
             TwoStageConstraints,
-            mission_targeted_design,
+            mission_targeted_design_shard,
             mission_targeted_design_target_only,
+            plan_mission_shards,
+            reduce_mission_shards,
             VehicleParams,
         )
         from app.engine.openmotor_ai.scoring import ScoreWeights
+        from app.engine.openmotor_ai.search_deadline import SearchDeadline
 
         constraints = TwoStageConstraints(**params["constraints"])
         search = StageSearchConfig(**params["search"])
@@ -120,22 +224,25 @@ def run_mission_target_task(self, job_id: str, params: dict[str, Any]) -> None:
         base_output = params.get("output_dir", "backend/tests")
         output_dir = str(Path(base_output) / "jobs" / job_id)
 
-        if params.get("target_only"):
-            start_time = time.time()
-            last_update = 0.0
+        start_time = time.time()
+        last_update = 0.0
+        # Stop searching well before the soft time limit, so ranking and artifact export still fit.
+        deadline = SearchDeadline.after(
+            get_settings().celery_task_soft_time_limit * _SEARCH_DEADLINE_SHARE,
+            cancelled=lambda: job_cancel_requested(job_id),
+        )
 
-            def progress_cb(payload: dict[str, object]) -> None:
-                nonlocal last_update
-                now = time.time()
+        def progress_cb(payload: dict[str, object]) -> None:
+            nonlocal last_update
+            now = time.time()
+            # Attempts are throttled; winners and candidates are always reported as soon as they exist.
+            if payload.get("last_status") not in ("winner", "candidate"):
                 if now - last_update < 3.0:
                     return
                 last_update = now
-                update_job(
-                    job_id,
-                    status="running",
-                    result={"progress": payload | {"elapsed_s": int(now - start_time)}},
-                )
+            _report_progress(job_id, payload | {"elapsed_s": int(now - start_time)})
 
+        if params.get("target_only"):
             vehicle_params = params.get("vehicle_params") or {}
             total_mass_kg = params.get("total_mass_kg") or vehicle_params.get("total_mass_kg")
             ref_diameter_m = vehicle_params.get("ref_diameter_m")
@@ -172,54 +279,130 @@ def run_mission_target_task(self, job_id: str, params: dict[str, Any]) -> None:
                 allowed_propellant_names=params.get("allowed_propellant_names"),
                 preset_path=params.get("preset_path"),
                 weights=weights,
+                stage_cache_dir=str(Path(base_output) / "stage_cache"),
                 vehicle_params=VehicleParams(
                     ref_diameter_m=ref_diameter_m,
                     rocket_length_in=rocket_length_in,
                 ),
                 progress_cb=progress_cb,
+                deadline=deadline,
             )
         else:
-            result = mission_targeted_design(
-                base_ric_path=params["base_ric_path"],
-                stage1_ric_path=params.get("stage1_ric_path"),
-                output_dir=output_dir,
-                rkt_path=params["rkt_path"],
+            design_kwargs = _mission_design_kwargs(params)
+            # Shards run here share the screening searches in memory; fanned-out shards read them back from the plan.
+            stage_cache: dict = {}
+            plan = plan_mission_shards(
+                **design_kwargs,
                 total_target_impulse_ns=params.get("total_target_impulse_ns"),
-                targets=targets,
-                constraints=constraints,
-                search=search,
-                split_ratios=params["split_ratios"],
-                cd_max=params.get("cd_max", 0.5),
-                mach_max=params.get("mach_max", 2.0),
-                cd_ramp=params.get("cd_ramp", False),
-                total_mass_kg=params.get("total_mass_kg"),
-                separation_delay_s=params.get("separation_delay_s", 0.0),
-                ignition_delay_s=params.get("ignition_delay_s", 0.0),
-                allowed_propellant_families=params.get("allowed_propellant_families"),
-                allowed_propellant_names=params.get("allowed_propellant_names"),
-                preset_path=params.get("preset_path"),
-                weights=weights,
-                vehicle_params=None,
+                stage_cache=stage_cache,
+                deadline=deadline,
             )
-        engine_versions = {
-            "openmotor_motorlib": openmotor_motorlib_version(),
-            "trajectory_engine": trajectory_engine_version(),
-        }
-        result_payload = _json_safe(
-            {
-                "openmotor_motorlib_result": result,
-                "inputs_hash": compute_inputs_hash(params),
-                "engine_versions": engine_versions,
-            }
-        )
-        update_job(
+            if len(plan["propellant_indices"]) > 1:
+                # One sub-task per screened propellant spreads the sweep over the fleet; the reducer finishes the job.
+                # Both stay on the queue and priority the job was routed with.
+                _report_progress(job_id, {"last_status": "fan_out", "shards": len(plan["propellant_indices"])})
+                route = job_route("mission_target", params)
+                chord(
+                    [
+                        run_mission_shard_task.s(job_id, params, plan, index).set(**route)
+                        for index in plan["propellant_indices"]
+                    ]
+                )(reduce_mission_shards_task.s(job_id, params, plan).set(**route))
+                return
+            shards = [
+                mission_targeted_design_shard(
+                    **design_kwargs,
+                    output_dir=output_dir,
+                    total_target_impulse_ns=plan["total_target_impulse_ns"],
+                    propellant_index=index,
+                    progress_cb=progress_cb,
+                    stage_cache=stage_cache,
+                    deadline=deadline,
+                )
+                for index in plan["propellant_indices"]
+            ]
+            result = reduce_mission_shards(
+                plan, shards, targets=targets, constraints=constraints, search=search, weights=weights
+            )
+        _finish_job(
             job_id,
-            status="completed",
-            result=result_payload,
+            status="cancelled" if deadline.reason == "cancelled" else "completed",
+            result=_mission_result_payload(result, params, job_id),
         )
     except Exception as exc:
         logger.exception("mission target failed: %s", exc)
-        update_job(job_id, status="failed", error=str(exc))
+        _finish_job(job_id, status="failed", error=str(exc))
+        raise
+
+
+@celery_app.task(bind=True, name="run_mission_shard")
+def run_mission_shard_task(
+    self, job_id: str, params: dict[str, Any], plan: dict[str, Any], propellant_index: int
+) -> dict[str, Any]:
+    if job_cancel_requested(job_id):
+        # The reducer still runs and ranks what the other shards found before the cancellation.
+        return {"candidates": [], "logs": [], "rejected": [], "search_stats": {}, "stopped": "cancelled"}
+    try:
+        from app.engine.openmotor_ai.openmotor_pipeline import mission_targeted_design_shard
+        from app.engine.openmotor_ai.search_deadline import SearchDeadline
+
+        output_dir = str(Path(params.get("output_dir", "backend/tests")) / "jobs" / job_id)
+
+        def progress_cb(payload: dict[str, object]) -> None:
+            _report_progress(job_id, payload | {"propellant_index": propellant_index})
+
+        shard = mission_targeted_design_shard(
+            **_mission_design_kwargs(params),
+            output_dir=output_dir,
+            total_target_impulse_ns=plan["total_target_impulse_ns"],
+            propellant_index=propellant_index,
+            progress_cb=progress_cb,
+            stage_cache_key=plan.get("stage_cache_key"),
+            # Each shard is its own task, so it gets its own share of the soft time limit.
+            deadline=SearchDeadline.after(
+                get_settings().celery_task_soft_time_limit * _SEARCH_DEADLINE_SHARE,
+                cancelled=lambda: job_cancel_requested(job_id),
+            ),
+        )
+        _report_progress(
+            job_id,
+            {
+                "last_status": "shard_done",
+                "propellant_index": propellant_index,
+                "candidates": len(shard["candidates"]),
+            },
+        )
+        return shard
+    except Exception as exc:
+        # A failed shard fails the job; the chord then never calls the reducer.
+        logger.exception("mission shard %s failed: %s", propellant_index, exc)
+        _finish_job(job_id, status="failed", error=str(exc))
         raise
 
 
+@celery_app.task(bind=True, name="reduce_mission_shards")
+def reduce_mission_shards_task(
+    self, shards: list[dict[str, Any]], job_id: str, params: dict[str, Any], plan: dict[str, Any]
+) -> None:
+    try:
+        from app.engine.openmotor_ai.openmotor_pipeline import reduce_mission_shards
+        from app.engine.openmotor_ai.scoring import ScoreWeights
+
+        design_kwargs = _mission_design_kwargs(params)
+        result = reduce_mission_shards(
+            plan,
+            shards,
+            targets=design_kwargs["targets"],
+            constraints=design_kwargs["constraints"],
+            search=design_kwargs["search"],
+            weights=ScoreWeights(**params["weights"]) if params.get("weights") else None,
+        )
+        _finish_job(
+            job_id,
+            status="cancelled" if job_cancel_requested(job_id) else "completed",
+            result=_mission_result_payload(result, params, job_id),
+        )
+    except Exception as exc:
+        logger.exception("mission reduce failed: %s", exc)
+        _finish_job(job_id, status="failed", error=str(exc))
+        raise
@@ -0,0 +1,63 @@
+import logging
+import time
+from typing import Callable
+
+logger = logging.getLogger("arx.backend.worker")
+
+
+def _warm_motorlib() -> None:
+    from app.engine.openmotor_ai.motorlib_adapter import _ensure_motorlib
+
+    _ensure_motorlib()
+    # motorlib pulls in scipy and skfmm, which are most of the cold-start cost.
+    from motorlib.grains import grainTypes  # noqa: F401
+    from motorlib.motor import Motor  # noqa: F401
+
+
+def _warm_propellants() -> None:
+    from app.engine.openmotor_ai.openmotor_pipeline import (
+        _PREFERRED_PROPELLANT_ORDER,
+        _load_propellant_specs,
+    )
+
+    # The unfiltered library and the mission-target default order cover most submissions.
+    _load_propellant_specs(preset_path=None, allowed_propellant_families=None, allowed_propellant_names=None)
+    _load_propellant_specs(
+        preset_path=None,
+        allowed_propellant_families=None,
+        allowed_propellant_names=_PREFERRED_PROPELLANT_ORDER,
+    )
+
+
+def _warm_openrocket() -> None:
+    from app.engine.openrocket.runner import ensure_openrocket_initialized
+
+    ensure_openrocket_initialized()
+
+
+def warm_worker_process(include_openrocket: bool = False) -> dict[str, float | str]:
+    """Load the shared read-only engine state once per worker process instead of in its first task.
+
+    Returns seconds per step, or the error for a step that failed. A failed step is only logged: the task that
+    needs it will load it again and report the error against the job.
+    """
+    steps: list[tuple[str, Callable[[], None]]] = [
+        ("motorlib", _warm_motorlib),
+        ("propellants", _warm_propellants),
+    ]
+    if include_openrocket:
+        steps.append(("openrocket", _warm_openrocket))
+    report: dict[str, float | str] = {}
+    started = time.perf_counter()
+    for name, step in steps:
+        step_started = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:
+            logger.warning("worker warm-up step %s failed: %s", name, exc)
+            report[name] = f"failed: {exc}"
+            continue
+        report[name] = round(time.perf_counter() - step_started, 3)
+    report["total"] = round(time.perf_counter() - started, 3)
+    logger.info("worker warm-up finished: %s", report)
+    return report
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 
 from app.core.config import get_settings
@@ -25,6 +26,35 @@ class EngineTests(unittest.TestCase):
         self.assertIn("best_candidate", result)
         self.assertIn("best_score", result)
 
+    def test_legacy_flat_bounds_are_rejected(self):
+        with self.assertRaises(ValueError) as ctx:
+            run_evolutionary_optimization({"bounds": {"min": 0.0, "max": 1.0}})
+        self.assertIn("length_scale", str(ctx.exception))
+
+    def test_evolutionary_optimization_resumes_from_checkpoint(self):
+        params = {
+            "population_size": 6,
+            "iterations": 4,
+            "seed": 7,
+            "target_impulse_ns": 3000.0,
+            "constraints": {"max_pressure_psi": 1000.0, "max_kn": 500.0},
+        }
+        uninterrupted = run_evolutionary_optimization(params)
+
+        def _crash_after_two(payload):
+            if payload["generation"] == 2:
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as tmp:
+            checkpointed = {**params, "checkpoint_path": os.path.join(tmp, "checkpoint.json")}
+            with self.assertRaises(KeyboardInterrupt):
+                run_evolutionary_optimization(checkpointed, progress_cb=_crash_after_two)
+            resumed = run_evolutionary_optimization(checkpointed)
+
+        self.assertEqual(resumed["resumed_from_generation"], 2)
+        self.assertEqual(resumed["best_candidate"], uninterrupted["best_candidate"])
+        self.assertEqual(resumed["history"], uninterrupted["history"])
+
     def test_openrocket_requires_jar(self):
         os.environ["OPENROCKET_JAR"] = ""
         get_settings.cache_clear()
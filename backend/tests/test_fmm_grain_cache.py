@@ -0,0 +1,88 @@
+import unittest
+
+from app.engine.openmotor_ai.motorlib_adapter import _ensure_motorlib
+
+_ensure_motorlib()
+
+import mathlib  # noqa: E402
+from mathlib import _find_perimeter  # noqa: E402
+from motorlib import grain  # noqa: E402
+from motorlib.grains.bates import BatesGrain  # noqa: E402
+from motorlib.grains.finocyl import Finocyl  # noqa: E402
+
+
+def _finocyl(length_m: float) -> Finocyl:
+    item = Finocyl()
+    item.setProperties(
+        {
+            "diameter": 0.083,
+            "length": length_m,
+            "coreDiameter": 0.03,
+            "finWidth": 0.004,
+            "finLength": 0.015,
+            "numFins": 6,
+            "inhibitedEnds": "Neither",
+        }
+    )
+    item.initGeometry(201)
+    item.generateCoreMap()
+    return item
+
+
+class FmmGrainCacheTests(unittest.TestCase):
+    def setUp(self):
+        grain.regressionMapCache.clear()
+
+    def test_same_cross_section_reuses_regression_map(self):
+        first = _finocyl(0.1)
+        first.generateRegressionMap()
+        second = _finocyl(0.2)
+        second.generateRegressionMap()
+        self.assertEqual(grain.regressionMapCache.misses, 1)
+        self.assertEqual(grain.regressionMapCache.hits, 1)
+        self.assertIs(first.regressionMap, second.regressionMap)
+        self.assertEqual(first.getFaceArea(0.002), second.getFaceArea(0.002))
+
+    def test_face_counts_match_per_level_scan(self):
+        item = _finocyl(0.1)
+        item.generateRegressionMap()
+        valid = ~item.mask
+        for i in range(len(item.regressionEntry.faceCounts)):
+            level = i / item.mapDim
+            expected = (item.regressionMap.data[valid] > level).sum()
+            self.assertEqual(item.regressionEntry.faceCounts[i], expected)
+
+    def test_perimeter_curve_matches_single_level_kernel(self):
+        item = _finocyl(0.1)
+        item.generateRegressionMap()
+        levels = [0.0, 0.05, 0.1, 0.2]
+        curve = mathlib.find_perimeter_curve(item.regressionMap, levels)
+        for level, perimeter in zip(levels, curve):
+            expected = _find_perimeter._get_perimeter_numpy(
+                item.regressionMap, level, False, False
+            )[0]
+            self.assertAlmostEqual(perimeter, expected, places=6)
+        self.assertGreater(item.getCorePerimeter(0.001), 0)
+
+    def test_contours_close_around_the_core(self):
+        item = _finocyl(0.1)
+        item.generateRegressionMap()
+        perimeter, contours = mathlib.find_perimeter(item.regressionMap, 0.05, including_contours=True)
+        self.assertTrue(contours)
+        self.assertTrue(all(contour.shape[1] == 2 for contour in contours))
+        self.assertTrue(any((contour[0] == contour[-1]).all() for contour in contours))
+        self.assertGreater(perimeter, 0)
+
+    def test_grain_regression_plots_include_contours(self):
+        bates = BatesGrain()
+        bates.setProperties(
+            {"diameter": 0.083, "length": 0.1, "coreDiameter": 0.03, "inhibitedEnds": "Neither"}
+        )
+        for item in (_finocyl(0.1), bates):
+            _, _, contours, lengths = item.getRegressionData(101)
+            self.assertTrue(any(contours))
+            self.assertGreater(max(lengths.values()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -26,3 +26,15 @@ class InputOptimizerTests(unittest.TestCase):
         self.assertIn("summary", result)
         self.assertIn("iterations", result)
         self.assertGreater(len(result["iterations"]), 0)
+
+    def test_recommendation_flies_to_target_apogee(self):
+        result = run_input_optimization({"target_apogee_m": 3000.0, "payload_mass_kg": 5.0})
+        self.assertAlmostEqual(result["summary"]["estimated_apogee_m"], 3000.0, delta=30.0)
+
+    def test_results_are_cached_per_payload(self):
+        payload = {"target_apogee_m": 2000.0, "max_mach": 0.8}
+        first = run_input_optimization(payload, iterations=4, population_size=8)
+        first["summary"]["score"] = None
+        second = run_input_optimization(payload, iterations=4, population_size=8)
+        self.assertIsNotNone(second["summary"]["score"])
+        self.assertEqual(second["iterations"], first["iterations"])
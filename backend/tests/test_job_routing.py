@@ -0,0 +1,49 @@
+import unittest
+
+from app.workers.routing import BATCH_QUEUE, INTERACTIVE_QUEUE, estimate_job_cost, job_route
+
+
+def _mission_params(axis, splits, names=("APCP",)):
+    scales = [1.0] * axis
+    return {
+        "search": {
+            "diameter_scales": scales,
+            "length_scales": scales,
+            "core_scales": scales,
+            "throat_scales": scales,
+            "exit_scales": scales,
+        },
+        "split_ratios": [0.5] * splits,
+        "allowed_propellant_names": list(names),
+    }
+
+
+class JobRoutingTests(unittest.TestCase):
+    def test_mission_cost_scales_with_grid_splits_and_propellants(self):
+        self.assertEqual(estimate_job_cost("mission_target", _mission_params(2, 3)), 32 * 3 * 2)
+        self.assertEqual(
+            estimate_job_cost("mission_target", _mission_params(2, 3, names=("APCP", "KNSB"))), 32 * 3 * 2 * 2
+        )
+
+    def test_max_simulations_caps_the_grid(self):
+        params = _mission_params(4, 1)
+        params["search"]["max_simulations"] = 10
+        self.assertEqual(estimate_job_cost("mission_target", params), 10 * 2)
+
+    def test_cheap_jobs_go_interactive_and_sweeps_go_to_batch(self):
+        self.assertEqual(job_route("mission_target", _mission_params(1, 1))["queue"], INTERACTIVE_QUEUE)
+        self.assertEqual(job_route("motor_first", {"design_space": None})["queue"], INTERACTIVE_QUEUE)
+        sweep = job_route("mission_target", _mission_params(6, 11))
+        self.assertEqual(sweep["queue"], BATCH_QUEUE)
+        self.assertGreater(sweep["priority"], job_route("mission_target", _mission_params(2, 1))["priority"])
+
+    def test_evolutionary_optimization_always_goes_to_batch(self):
+        small = {"iterations": 2, "population_size": 4}
+        self.assertEqual(job_route("optimize", small)["queue"], BATCH_QUEUE)
+        self.assertEqual(job_route("optimize", {})["queue"], BATCH_QUEUE)
+        self.assertEqual(job_route("optimize_input", {})["queue"], INTERACTIVE_QUEUE)
+        self.assertLess(job_route("optimize", small)["priority"], job_route("optimize", {})["priority"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,653 @@
+import itertools
+import math
+import tempfile
+import unittest
+from dataclasses import replace
+from functools import partial
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.engine.openmotor_ai import openmotor_pipeline as pipeline
+from app.engine.openmotor_ai.motorlib_adapter import (
+    ConstraintViolation,
+    SimulationLimits,
+    simulate_motorlib_with_result,
+)
+from app.engine.openmotor_ai.openmotor_pipeline import TwoStageConstraints, VehicleParams
+from app.engine.openmotor_ai.search_deadline import SearchDeadline
+from app.engine.openmotor_ai.search_session import TargetSearchSession
+from app.engine.openmotor_ai.stage_planner import JobStagePlanner
+from app.engine.openmotor_ai.smart_nozzle_architect import SmartNozzleArchitect, SmartNozzleConfig
+from app.engine.openmotor_ai.successive_halving import HalvingPolicy, successive_halving
+from app.engine.openmotor_ai.surrogate_search import SurrogateObservation, surrogate_minimize
+from app.engine.openmotor_ai.spec import FMMGrain, PropellantSpec, PropellantTab
+
+
+def _propellant() -> PropellantSpec:
+    return PropellantSpec(
+        name="Test KNSB",
+        density_kg_m3=1841.0,
+        tabs=[
+            PropellantTab(
+                a=3.5e-05, n=0.32, k=1.2, m=28.0, t=1700.0,
+                min_pressure_pa=1.0e5, max_pressure_pa=1.0e7,
+            )
+        ],
+    )
+
+
+def _base_spec():
+    return pipeline._default_base_spec(
+        VehicleParams(ref_diameter_m=0.1, rocket_length_in=60.0), _propellant()
+    )
+
+
+class ThroatSolveTests(unittest.TestCase):
+    def test_oversized_throat_is_sized_for_target_pressure(self):
+        base = _base_spec()
+        oversized = pipeline._with_throat(base, base.nozzle.throat_diameter_m * 4.0)
+        spec, steps, sim = pipeline._simulate_with_throat_solve(oversized)
+        self.assertLess(spec.nozzle.throat_diameter_m, oversized.nozzle.throat_diameter_m)
+        self.assertTrue(steps)
+        target = base.config.max_pressure_pa * pipeline._THROAT_SOLVE_PRESSURE_FRAC
+        self.assertAlmostEqual(sim.getMaxPressure() / target, 1.0, delta=0.15)
+
+    def test_predicted_throat_over_the_limits_falls_back_to_bisection(self):
+        base = _base_spec()
+        oversized = pipeline._with_throat(base, base.nozzle.throat_diameter_m * 4.0)
+        target = base.config.max_pressure_pa * pipeline._THROAT_SOLVE_PRESSURE_FRAC
+        limits = SimulationLimits(max_pressure_pa=target * 0.5)
+        predicted = pipeline._predict_throat_diameter_m(oversized, target)
+        spec, steps, sim = pipeline._simulate_with_throat_solve(oversized, limits=limits)
+        self.assertGreater(spec.nozzle.throat_diameter_m, predicted)
+        self.assertTrue(steps)
+        self.assertLessEqual(sim.getMaxPressure(), limits.max_pressure_pa)
+
+    def test_violation_after_a_success_keeps_the_success(self):
+        base = _base_spec()
+        outcomes = iter(["thrustless", "ok", "violation", "violation", "violation", "violation"])
+        tried: list[float] = []
+
+        def fake_simulate(candidate, limits=None):
+            tried.append(candidate.nozzle.throat_diameter_m)
+            outcome = next(outcomes)
+            if outcome == "thrustless":
+                raise RuntimeError("Motor did not generate thrust")
+            if outcome == "violation":
+                raise ConstraintViolation("peak_chamber_pressure", 1.0, 2.0, 0.1)
+            return [], "sim"
+
+        with patch.object(pipeline, "_predict_throat_diameter_m", return_value=None), patch(
+            "app.engine.openmotor_ai.motorlib_adapter.simulate_motorlib_with_result", fake_simulate
+        ):
+            spec, _, sim = pipeline._simulate_with_throat_solve(base)
+        self.assertEqual(sim, "sim")
+        self.assertEqual(spec.nozzle.throat_diameter_m, tried[1])
+
+    def test_working_throat_is_left_alone(self):
+        base = _base_spec()
+        spec, _, _ = pipeline._simulate_with_throat_solve(base)
+        self.assertEqual(spec, base)
+
+
+class ConstraintAbortTests(unittest.TestCase):
+    def test_pressure_limit_aborts_before_burnout(self):
+        base = _base_spec()
+        _, full = simulate_motorlib_with_result(base)
+        limit = full.getMaxPressure() * 0.8
+        with self.assertRaises(ConstraintViolation) as ctx:
+            simulate_motorlib_with_result(base, limits=SimulationLimits(max_pressure_pa=limit))
+        self.assertEqual(ctx.exception.constraint, "peak_chamber_pressure")
+        self.assertGreater(ctx.exception.value, limit)
+        self.assertLess(ctx.exception.time_s, full.getBurnTime())
+
+    def test_limits_above_peak_match_unconstrained_run(self):
+        base = _base_spec()
+        _, full = simulate_motorlib_with_result(base)
+        limits = SimulationLimits(
+            max_pressure_pa=full.getMaxPressure() * 1.01,
+            max_kn=full.getPeakKN() * 1.01,
+            max_mass_flux_kg_m2_s=full.getPeakMassFlux() * 1.01,
+        )
+        _, limited = simulate_motorlib_with_result(base, limits=limits)
+        self.assertEqual(limited.getImpulse(), full.getImpulse())
+
+    def test_stage_grid_logs_typed_rejection(self):
+        base = _base_spec()
+        search = pipeline.StageSearchConfig(
+            diameter_scales=[1.0], length_scales=[1.0], core_scales=[1.0],
+            throat_scales=[1.0], exit_scales=[1.0], grain_count=len(base.grains),
+        )
+        constraints = TwoStageConstraints(max_pressure_psi=50.0, max_kn=1000.0, max_vehicle_length_in=200.0)
+        reject_log: list[dict[str, object]] = []
+        cache: dict = {}
+        result = pipeline._search_stage(
+            base, 1000.0, search, constraints, reject_log=reject_log, cache=cache
+        )
+        self.assertIsNone(result)
+        self.assertEqual(reject_log[0]["reason"], "constraint_violation")
+        self.assertEqual(reject_log[0]["constraint"], "peak_chamber_pressure")
+        self.assertEqual(list(cache.values()), [None])
+
+
+class TargetSearchSessionTests(unittest.TestCase):
+    def _find(self, architect, session, impulse_ns):
+        return architect.find_optimal_motor(
+            target_apogee_ft=5000.0,
+            dry_mass_lbs=8.0,
+            max_pressure_psi=800.0,
+            rocket_dims={"diameter": 3.0, "max_length": 60.0},
+            propellant=_propellant(),
+            base_spec=_base_spec(),
+            simulate_apogee=None,
+            required_impulse_ns=impulse_ns,
+            sim_cache=session.sim_cache,
+        )
+
+    def test_rescaled_target_reuses_simulated_motors(self):
+        architect = SmartNozzleArchitect(
+            SmartNozzleConfig(max_grains=2, length_step_in=1.0, core_step_in=0.25, throat_multipliers=(1.0, 1.4))
+        )
+        session = TargetSearchSession()
+        first = self._find(architect, session, 1200.0)
+        session.record_iteration(target_impulse_ns=1200.0, winner_count=len(first), best_apogee_ft=None)
+        again = self._find(architect, session, 1200.0)
+        session.record_iteration(target_impulse_ns=1200.0, winner_count=len(again), best_apogee_ft=None)
+        self.assertTrue(session.sim_cache)
+        self.assertEqual(session.iterations[1]["simulations"], 0)
+        self.assertEqual([r.metrics for r in again], [r.metrics for r in first])
+
+    def test_same_named_propellants_do_not_share_simulations(self):
+        architect = SmartNozzleArchitect(
+            SmartNozzleConfig(max_grains=2, length_step_in=1.0, core_step_in=0.25, throat_multipliers=(1.0, 1.4))
+        )
+        session = TargetSearchSession()
+        variant = replace(_propellant(), density_kg_m3=1700.0)
+        for propellant in (_propellant(), variant):
+            architect.find_optimal_motor(
+                target_apogee_ft=5000.0,
+                dry_mass_lbs=8.0,
+                max_pressure_psi=800.0,
+                rocket_dims={"diameter": 3.0, "max_length": 60.0},
+                propellant=propellant,
+                base_spec=_base_spec(),
+                simulate_apogee=None,
+                required_impulse_ns=1200.0,
+                sim_cache=session.sim_cache,
+            )
+        owners = {key[0] for key in session.sim_cache}
+        self.assertEqual(owners, {pipeline.propellant_key(_propellant()), pipeline.propellant_key(variant)})
+
+    def test_next_target_impulse_only_rescales_shortfalls(self):
+        session = TargetSearchSession(max_iterations=1)
+        session.record_iteration(target_impulse_ns=1000.0, winner_count=1, best_apogee_ft=2500.0)
+        self.assertAlmostEqual(session.next_target_impulse(1000.0, 2500.0, 10000.0, 0.02), 2000.0)
+        self.assertIsNone(session.next_target_impulse(1000.0, 9900.0, 10000.0, 0.02))
+        session.record_iteration(target_impulse_ns=2000.0, winner_count=1, best_apogee_ft=5000.0)
+        self.assertIsNone(session.next_target_impulse(2000.0, 5000.0, 10000.0, 0.02))
+
+
+class SurrogateSearchTests(unittest.TestCase):
+    def test_finds_constrained_grid_optimum_with_fewer_evaluations(self):
+        values = [0.8, 0.9, 1.0, 1.1, 1.2]
+        points = list(itertools.product(values, repeat=5))
+
+        def _observe(point):
+            diameter, length, core, throat, _ = point
+            impulse = 1000.0 * diameter**2 * length * (1.0 - 0.3 * core)
+            pressure_margin = 500.0 * diameter**2 * length / throat**2 / 600.0 - 1.0
+            return SurrogateObservation(objective=abs(impulse - 900.0) / 900.0, constraint=pressure_margin)
+
+        outcome = surrogate_minimize(
+            points, lambda indices: [_observe(points[idx]) for idx in indices], budget=120, batch_size=4
+        )
+        feasible = [obs.objective for obs in outcome.observations.values() if obs.constraint <= 0]
+        truth = min(
+            obs.objective for obs in map(_observe, points) if obs.constraint <= 0
+        )
+        self.assertAlmostEqual(min(feasible), truth)
+        self.assertLess(outcome.simulations, len(points) // 10)
+
+    def test_unknown_strategy_is_rejected(self):
+        search = pipeline.StageSearchConfig(
+            diameter_scales=[1.0], length_scales=[1.0], core_scales=[1.0],
+            throat_scales=[1.0], exit_scales=[1.0], strategy="annealing",
+        )
+        constraints = TwoStageConstraints(max_pressure_psi=1000.0, max_kn=1000.0, max_vehicle_length_in=200.0)
+        with self.assertRaises(ValueError):
+            pipeline._search_stage(_base_spec(), 1000.0, search, constraints)
+
+
+class LengthBisectionTests(unittest.TestCase):
+    def _search(self, strategy):
+        return pipeline.StageSearchConfig(
+            diameter_scales=[1.0], length_scales=[0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2],
+            core_scales=[1.5], throat_scales=[2.5, 3.0], exit_scales=[1.0], strategy=strategy,
+        )
+
+    def test_bisect_matches_grid_with_fewer_simulations(self):
+        constraints = TwoStageConstraints(max_pressure_psi=5000.0, max_kn=2000.0, max_vehicle_length_in=500.0)
+        cache = {}
+        bisect_stats = {}
+        bisected = pipeline._search_stage(
+            _base_spec(), 20000.0, self._search("bisect"), constraints, stats=bisect_stats, cache=cache
+        )
+        self.assertEqual(bisect_stats["monotonic_fallbacks"], 0)
+        self.assertLess(bisect_stats["simulations"], bisect_stats["grid_points"])
+        self.assertEqual(len(cache), bisect_stats["simulations"])
+
+        grid_stats = {}
+        gridded = pipeline._search_stage(
+            _base_spec(), 20000.0, self._search("grid"), constraints, stats=grid_stats, cache=cache
+        )
+        self.assertEqual(bisected.scales, gridded.scales)
+        # Points probed by the bisection are reused from the shared cache.
+        self.assertEqual(grid_stats["simulations"], grid_stats["grid_points"] - bisect_stats["simulations"])
+
+    def test_monotonicity_check(self):
+        def _stage(impulse):
+            return pipeline.StageResult(spec=None, metrics={"total_impulse": impulse}, log={})
+
+        self.assertTrue(pipeline._line_is_monotonic({0: _stage(1.0), 3: _stage(2.0), 5: None, 7: None}))
+        self.assertFalse(pipeline._line_is_monotonic({0: _stage(2.0), 3: _stage(1.0)}))
+        self.assertFalse(pipeline._line_is_monotonic({0: None, 3: _stage(1.0)}))
+
+
+class CoarseToFineTests(unittest.TestCase):
+    def _finocyl_spec(self):
+        base = _base_spec()
+        grain = base.grains[0]
+        finocyl = FMMGrain(
+            grain_type="Finocyl",
+            diameter_m=grain.diameter_m,
+            core_diameter_m=grain.core_diameter_m,
+            length_m=grain.length_m,
+            inhibited_ends=grain.inhibited_ends,
+            properties=(("finLength", 0.012), ("finWidth", 0.004), ("numFins", 6)),
+        )
+        return replace(base, grains=[finocyl, finocyl], config=replace(base.config, map_dim=400))
+
+    def _search(self, coarse_map_dim):
+        return pipeline.StageSearchConfig(
+            diameter_scales=[1.0], length_scales=[0.6, 0.8, 1.0, 1.2], core_scales=[1.0],
+            throat_scales=[3.0, 4.0], exit_scales=[1.0], coarse_map_dim=coarse_map_dim,
+        )
+
+    def test_coarse_screening_confirms_the_fine_optimum(self):
+        constraints = TwoStageConstraints(max_pressure_psi=5000.0, max_kn=2000.0, max_vehicle_length_in=500.0)
+        spec = self._finocyl_spec()
+        fine_found = []
+        fine = pipeline._search_stage(spec, 2000.0, self._search(None), constraints, found=fine_found)
+        coarse_found = []
+        pipeline._search_stage(
+            replace(spec, config=replace(spec.config, map_dim=250)),
+            2000.0,
+            self._search(None),
+            constraints,
+            found=coarse_found,
+        )
+        stats = {}
+        screened = pipeline._search_stage(spec, 2000.0, self._search(250), constraints, stats=stats)
+
+        self.assertEqual(screened.scales, fine.scales)
+        self.assertEqual(screened.spec.config.map_dim, 400)
+        self.assertEqual(screened.metrics["total_impulse"], fine.metrics["total_impulse"])
+        resolution = stats["resolution"]
+        self.assertEqual(resolution["coarse_simulations"], len(coarse_found))
+        self.assertLess(resolution["fine_simulations"], len(fine_found))
+        # The drift the shortlist measured covers the coarse metrics of the motors it confirmed.
+        fine_by_scales = {stage.scales: stage for stage in fine_found}
+        ranked = sorted(coarse_found, key=lambda stage: abs(stage.metrics["total_impulse"] - 2000.0))
+        for coarse in ranked[: pipeline.StageSearchConfig.fine_shortlist]:
+            exact = fine_by_scales[coarse.scales].metrics
+            impulse_error = abs(coarse.metrics["total_impulse"] - exact["total_impulse"]) / exact["total_impulse"]
+            pressure_error = (
+                abs(coarse.metrics["peak_chamber_pressure"] - exact["peak_chamber_pressure"])
+                / exact["peak_chamber_pressure"]
+            )
+            self.assertLessEqual(impulse_error * 100.0, resolution["impulse_error_pct"] + 1e-9)
+            self.assertLessEqual(pressure_error * 100.0, resolution["peak_pressure_error_pct"] + 1e-9)
+
+
+class SuccessiveHalvingTests(unittest.TestCase):
+    def test_dominated_arms_are_dropped_on_partial_budgets(self):
+        calls = []
+
+        def _evaluate(arm, fidelity):
+            calls.append((arm, fidelity))
+            return None if arm == 0 else float(arm)
+
+        outcome = successive_halving(
+            list(range(18)), _evaluate, label=str, policy=HalvingPolicy(reduction=3, min_survivors=3)
+        )
+        self.assertEqual(outcome.survivors, [1, 2, 3])
+        self.assertEqual([len(round_info["kept"]) for round_info in outcome.rounds], [6, 3])
+        self.assertIn(0, outcome.rounds[0]["eliminated"])
+        # 18 arms at 1/9 budget plus 6 at 1/3 instead of 18 full runs.
+        self.assertEqual(len(calls), 24)
+
+    def test_rounds_tell_apart_arms_with_the_same_label(self):
+        outcome = successive_halving(
+            list(range(6)), lambda arm, fidelity: float(arm), label=lambda arm: "dup", policy=HalvingPolicy()
+        )
+        scores = outcome.rounds[0]["scores"]
+        self.assertEqual([entry["arm"] for entry in scores], list(range(6)))
+        self.assertEqual(outcome.rounds[0]["eliminated"], [3, 4, 5])
+
+    def test_small_arm_counts_skip_screening(self):
+        outcome = successive_halving([1, 2, 3], lambda arm, fidelity: float(arm), label=str)
+        self.assertEqual(outcome.survivors, [1, 2, 3])
+        self.assertEqual(outcome.rounds, [])
+
+    def test_partial_search_is_a_subset_of_the_full_lattice(self):
+        search = pipeline.StageSearchConfig(
+            diameter_scales=[1.0], length_scales=[0.6, 0.8, 1.0, 1.2, 1.4],
+            core_scales=[0.8, 1.0, 1.2], throat_scales=[0.9, 1.0, 1.1], exit_scales=[1.0],
+        )
+        partial = pipeline._search_at_fidelity(search, 1.0 / 9.0)
+        full = set(pipeline._stage_lattice(search, None, None))
+        thinned = pipeline._stage_lattice(partial, None, None)
+        self.assertTrue(set(thinned) <= full)
+        self.assertLess(len(thinned), len(full) / 3)
+
+
+class JobStagePlannerTests(unittest.TestCase):
+    def _plan(self, cache_dir, wind_speed_m_s):
+        planner = JobStagePlanner(cache_dir)
+        calls = []
+        planner.run("propellants", {"names": ["KNSB"]}, lambda: calls.append("propellants") or [_propellant()])
+        grid_key = planner.key("stage_grid.KNSB", {"max_pressure_psi": 1000.0}, depends_on=("propellants",))
+        sims = planner.open_mapping("stage_grid", grid_key)
+        reused = len(sims)
+        sims.setdefault(("KNSB", 3), {"total_impulse": 1.0})
+        planner.save_mapping("stage_grid", "KNSB", grid_key, sims, reused)
+        planner.key("trajectory", {"wind_speed_m_s": wind_speed_m_s}, depends_on=("propellants",))
+        planner.run(
+            "pairing", {}, lambda: calls.append("pairing") or {"winners": []},
+            depends_on=("stage_grid.KNSB", "trajectory"),
+        )
+        return planner.report, calls
+
+    def test_resubmission_only_reruns_changed_stages(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first, first_calls = self._plan(cache_dir, 0.0)
+            repeat, repeat_calls = self._plan(cache_dir, 0.0)
+            windy, windy_calls = self._plan(cache_dir, 4.0)
+        self.assertEqual(first_calls, ["propellants", "pairing"])
+        self.assertEqual({stage: entry["status"] for stage, entry in first.items()}, {
+            "propellants": "miss", "stage_grid": "miss", "pairing": "miss",
+        })
+        self.assertEqual(repeat_calls, [])
+        self.assertTrue(all(entry["status"] == "hit" for entry in repeat.values()))
+        # A launch-condition change keeps the motor simulations and only re-runs what flies them.
+        self.assertEqual(windy_calls, ["pairing"])
+        self.assertEqual(windy["stage_grid"]["status"], "hit")
+        self.assertEqual(windy["pairing"]["status"], "miss")
+
+
+class SearchDeadlineTests(unittest.TestCase):
+    def test_expired_deadline_stops_and_sticks(self):
+        deadline = SearchDeadline.after(0.0)
+        self.assertTrue(deadline.should_stop())
+        self.assertTrue(deadline.should_stop())
+        self.assertEqual(deadline.reason, "deadline")
+
+    def test_cancellation_is_polled_once_per_interval(self):
+        polls = []
+        deadline = SearchDeadline(cancelled=lambda: polls.append(1) or False, poll_interval_s=60.0)
+        self.assertFalse(any(deadline.should_stop() for _ in range(5)))
+        self.assertEqual(len(polls), 1)
+
+    def test_architect_stops_before_simulating(self):
+        session = TargetSearchSession()
+        results = SmartNozzleArchitect(SmartNozzleConfig(max_grains=2)).find_optimal_motor(
+            target_apogee_ft=5000.0,
+            dry_mass_lbs=8.0,
+            max_pressure_psi=800.0,
+            rocket_dims={"diameter": 3.0, "max_length": 60.0},
+            propellant=_propellant(),
+            base_spec=_base_spec(),
+            simulate_apogee=None,
+            required_impulse_ns=1200.0,
+            sim_cache=session.sim_cache,
+            deadline=SearchDeadline(cancelled=lambda: True),
+        )
+        self.assertEqual(results, [])
+        self.assertEqual(session.sim_cache, {})
+
+    def test_stage_searches_stop_before_simulating(self):
+        constraints = TwoStageConstraints(max_pressure_psi=1500.0, max_kn=1000.0, max_vehicle_length_in=200.0)
+        for strategy in ("grid", "bisect", "bayesian"):
+            search = pipeline.StageSearchConfig(
+                diameter_scales=[1.0], length_scales=[0.8, 1.0], core_scales=[1.0],
+                throat_scales=[1.0], exit_scales=[1.0], strategy=strategy,
+            )
+            stats: dict[str, object] = {}
+            result = pipeline._search_stage(
+                _base_spec(), 1000.0, search, constraints, stats=stats, deadline=SearchDeadline.after(0.0)
+            )
+            self.assertIsNone(result)
+            self.assertEqual(stats.get("simulations", 0), 0, strategy)
+
+
+class PropellantSpecCacheTests(unittest.TestCase):
+    def test_repeat_loads_share_frozen_specs(self):
+        first = pipeline._load_propellant_specs(
+            preset_path=None, allowed_propellant_families=None, allowed_propellant_names=None
+        )
+        first.clear()
+        second = pipeline._load_propellant_specs(
+            preset_path=None, allowed_propellant_families=None, allowed_propellant_names=None
+        )
+        third = pipeline._load_propellant_specs(
+            preset_path=None, allowed_propellant_families=None, allowed_propellant_names=None
+        )
+        self.assertTrue(second)
+        self.assertIsNot(second, third)
+        self.assertTrue(all(a is b for a, b in zip(second, third)))
+
+    def test_same_named_propellants_get_separate_stage_cache_keys(self):
+        base = _base_spec()
+        variant = replace(base, propellant=replace(base.propellant, density_kg_m3=1700.0))
+        self.assertEqual(variant.propellant.name, base.propellant.name)
+        self.assertNotEqual(pipeline._base_spec_cache_key(variant), pipeline._base_spec_cache_key(base))
+
+    def test_unknown_names_still_raise(self):
+        with self.assertRaises(RuntimeError):
+            pipeline._load_propellant_specs(
+                preset_path=None, allowed_propellant_families=["no-such-family"], allowed_propellant_names=None
+            )
+
+
+class BoundedPoolTests(unittest.TestCase):
+    def test_outcomes_keep_submission_order(self):
+        calls = [partial(math.sqrt, float(value)) for value in (16, 9, -1, 4, 1)]
+        serial = pipeline._run_bounded(calls, workers=1)
+        pooled = pipeline._run_bounded(calls, workers=2)
+        self.assertEqual(serial, pooled)
+        self.assertEqual([status for status, _ in pooled], ["ok", "ok", "error", "ok", "ok"])
+        self.assertEqual(pooled[3], ("ok", 2.0))
+
+
+class PairMemoTests(unittest.TestCase):
+    def test_repeated_stage_pairs_fly_once_per_propellant(self):
+        base = _base_spec()
+        stage1_base = pipeline._with_throat(base, base.nozzle.throat_diameter_m * 0.9)
+
+        def fake_search(prop_base, target_impulse_ns, search, constraints, **kwargs):
+            # Every split lands on the same lattice point, as neighbouring ratios often do on a coarse grid.
+            stage = kwargs["reject_context"]["stage"]
+            impulse = 1000.0 if stage == "stage0" else 500.0
+            return pipeline.StageResult(spec=prop_base, metrics={"total_impulse": impulse}, log={})
+
+        flown: list[tuple[object, ...]] = []
+
+        def fake_flight(*, stage0, stage1, **kwargs):
+            flown.append((pipeline._base_spec_cache_key(stage0), pipeline._base_spec_cache_key(stage1)))
+            return SimpleNamespace(apogee_m=float("nan"), max_velocity_m_s=float("nan"))
+
+        variant = replace(_propellant(), density_kg_m3=1700.0)
+        search_stats: dict[str, object] = {}
+        with patch.object(pipeline, "_load_mission_bases", return_value=(base, stage1_base)), patch.object(
+            pipeline, "_search_stage", fake_search
+        ), patch.object(pipeline, "simulate_two_stage_apogee", fake_flight), tempfile.TemporaryDirectory() as tmp:
+            _, _, logs, rejected = pipeline._pair_mission_stages(
+                base_ric_path="stage0.ric",
+                stage1_ric_path="stage1.ric",
+                output_root=Path(tmp),
+                rkt_path="vehicle.rkt",
+                total_target_impulse_ns=1500.0,
+                targets=pipeline.TrajectoryTargets(apogee_ft=10000.0, max_velocity_m_s=None),
+                constraints=TwoStageConstraints(
+                    max_pressure_psi=750.0, max_kn=300.0, max_vehicle_length_in=200.0, max_stage_length_ratio=1.15
+                ),
+                search=pipeline.StageSearchConfig(
+                    diameter_scales=[1.0], length_scales=[1.0], core_scales=[1.0], throat_scales=[1.0], exit_scales=[1.0]
+                ),
+                split_ratios=[0.4, 0.5, 0.6],
+                cd_max=0.5,
+                mach_max=2.0,
+                cd_ramp=False,
+                total_mass_kg=None,
+                separation_delay_s=0.0,
+                ignition_delay_s=0.0,
+                survivors=[_propellant(), variant],
+                stage_cache={},
+                search_stats=search_stats,
+                progress_cb=None,
+            )
+        self.assertEqual(search_stats["pair_tasks"], 6)
+        self.assertEqual(search_stats["pair_flights"], 2)
+        # The two propellants share a name but not a spec, so each flies its own pair.
+        self.assertEqual(len(set(flown)), 2)
+        self.assertEqual(
+            {key[0][0] for key in flown},
+            {pipeline.propellant_key(_propellant()), pipeline.propellant_key(variant)},
+        )
+        self.assertEqual([entry["reason"] for entry in rejected], ["simulation_failed", "simulation_failed"])
+        self.assertEqual(logs, [])
+
+
+class MissionShardTests(unittest.TestCase):
+    def _design_kwargs(self) -> dict[str, object]:
+        return dict(
+            base_ric_path="stage0.ric",
+            stage1_ric_path=None,
+            rkt_path=None,
+            targets=pipeline.TrajectoryTargets(apogee_ft=10000.0, max_velocity_m_s=None),
+            constraints=TwoStageConstraints(
+                max_pressure_psi=1500.0, max_kn=1000.0, max_vehicle_length_in=200.0, max_stage_length_ratio=2.0
+            ),
+            search=pipeline.StageSearchConfig(
+                diameter_scales=[1.0],
+                length_scales=[0.6, 0.8, 1.0, 1.2],
+                core_scales=[1.0],
+                throat_scales=[1.0],
+                exit_scales=[1.0],
+            ),
+            split_ratios=[0.5],
+            cd_max=0.5,
+            mach_max=2.0,
+            cd_ramp=False,
+            total_mass_kg=None,
+            separation_delay_s=0.0,
+            ignition_delay_s=0.0,
+        )
+
+    def test_shards_start_from_the_screening_searches(self):
+        base = _base_spec()
+        propellants = [_propellant(), replace(_propellant(), density_kg_m3=1700.0)]
+        halving = HalvingPolicy(min_arms=2, reduction=2, min_fidelity=0.5, min_survivors=1)
+        with patch.object(pipeline, "_load_mission_bases", return_value=(base, base)), patch.object(
+            pipeline, "_load_mission_propellants", return_value=propellants
+        ), tempfile.TemporaryDirectory() as tmp:
+            plan = pipeline.plan_mission_shards(
+                **self._design_kwargs(),
+                total_target_impulse_ns=2000.0,
+                propellant_halving=halving,
+                stage_cache_dir=tmp,
+            )
+            self.assertGreater(plan["search_stats"]["simulations"], 0)
+            (index,) = plan["propellant_indices"]
+            shard_kwargs = dict(
+                self._design_kwargs(),
+                output_dir=tmp,
+                total_target_impulse_ns=plan["total_target_impulse_ns"],
+                propellant_index=index,
+            )
+            fresh = pipeline.mission_targeted_design_shard(**shard_kwargs)
+            screened = pipeline.mission_targeted_design_shard(
+                **shard_kwargs, stage_cache_dir=tmp, stage_cache_key=plan["stage_cache_key"]
+            )
+        self.assertEqual(fresh["search_stats"]["simulations"], 4)
+        self.assertEqual(screened["search_stats"]["simulations"], 2)
+
+    def test_cancelled_shard_marks_the_result_stopped(self):
+        base = _base_spec()
+        kwargs = self._design_kwargs()
+        with patch.object(pipeline, "_load_mission_bases", return_value=(base, base)), patch.object(
+            pipeline, "_load_mission_propellants", return_value=[_propellant()]
+        ), tempfile.TemporaryDirectory() as tmp:
+            shard = pipeline.mission_targeted_design_shard(
+                **kwargs,
+                output_dir=tmp,
+                total_target_impulse_ns=2000.0,
+                propellant_index=0,
+                deadline=SearchDeadline(cancelled=lambda: True),
+            )
+        self.assertEqual(shard["stopped"], "cancelled")
+        self.assertEqual(shard["search_stats"].get("simulations", 0), 0)
+        plan = {
+            "total_target_impulse_ns": 2000.0,
+            "propellant_indices": [0],
+            "rejected": [],
+            "propellant_screening": {"rounds": [], "survivors": ["Test KNSB"]},
+            "stopped": None,
+        }
+        result = pipeline.reduce_mission_shards(
+            plan, [shard], targets=kwargs["targets"], constraints=kwargs["constraints"], search=kwargs["search"]
+        )
+        self.assertEqual(result["summary"]["stopped"], "cancelled")
+
+    def test_reduce_merges_shards_in_plan_order(self):
+        plan = {
+            "total_target_impulse_ns": 1000.0,
+            "propellant_indices": [0, 2],
+            "rejected": [{"propellant": "B", "reason": "eliminated_by_screening", "round": "0"}],
+            "propellant_screening": {"rounds": [], "survivors": ["A", "C"]},
+            "search_stats": {"strategy": "grid", "evaluated": 4},
+        }
+        shards = [
+            {
+                "candidates": [],
+                "logs": [],
+                "rejected": [{"propellant": "A", "reason": "no_feasible_stage_pair"}],
+                "search_stats": {"strategy": "grid", "evaluated": 10, "pair_flights": 0},
+            },
+            {
+                "candidates": [],
+                "logs": [],
+                "rejected": [{"propellant": "C", "reason": "no_feasible_stage_pair"}],
+                "search_stats": {"strategy": "grid", "evaluated": 7, "pair_flights": 0},
+            },
+        ]
+        result = pipeline.reduce_mission_shards(
+            plan,
+            shards,
+            targets=pipeline.TrajectoryTargets(apogee_ft=10000.0, max_velocity_m_s=None),
+            constraints=TwoStageConstraints(
+                max_pressure_psi=750.0, max_kn=300.0, max_vehicle_length_in=200.0, max_stage_length_ratio=1.15
+            ),
+            search=pipeline.StageSearchConfig(
+                diameter_scales=[1.0], length_scales=[1.0], core_scales=[1.0], throat_scales=[1.0], exit_scales=[1.0]
+            ),
+        )
+        self.assertEqual([entry["propellant"] for entry in result["rejected"]], ["B", "A", "C"])
+        self.assertEqual(result["search_stats"]["evaluated"], 21)
+        self.assertEqual(result["summary"]["status"], "no_viable_candidates")
+        self.assertEqual(result["estimated_total_impulse_ns"], 1000.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from app.services.result_store import (
+    parse_result_filters,
+    read_result_section,
+    store_result_sections,
+)
+
+
+def _result(count):
+    return {
+        "summary": {"status": "ok"},
+        "candidates": [
+            {"name": f"c{idx}", "propellant": "APCP" if idx % 2 else "KNSB", "within_tolerance": idx % 3 == 0}
+            for idx in range(count)
+        ],
+        "ranked": [{"name": f"c{idx}", "total_score": 1.0 - idx / count} for idx in range(count)],
+        "rejected": [{"propellant": "KNSB", "reason": "no_feasible_stage_pair"}],
+    }
+
+
+class ResultStoreTests(unittest.TestCase):
+    def test_large_sections_move_out_and_keep_top_k_inline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            slim = store_result_sections(_result(50), Path(tmp), inline_top_k=5)
+            self.assertEqual(len(slim["candidates"]), 5)
+            self.assertEqual([row["name"] for row in slim["ranked"]], ["c0", "c1", "c2", "c3", "c4"])
+            self.assertEqual(slim["rejected"], [{"propellant": "KNSB", "reason": "no_feasible_stage_pair"}])
+            self.assertEqual(set(slim["result_sections"]), {"candidates", "ranked"})
+            self.assertEqual(slim["result_sections"]["candidates"]["count"], 50)
+
+            total, page = read_result_section(slim, "ranked", offset=10, limit=3)
+            self.assertEqual(total, 50)
+            self.assertEqual([row["name"] for row in page], ["c10", "c11", "c12"])
+
+    def test_filters_match_json_spelling(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            slim = store_result_sections(_result(12), Path(tmp), inline_top_k=5)
+            filters = parse_result_filters(["propellant:APCP", "within_tolerance:true"])
+            total, page = read_result_section(slim, "candidates", filters=filters)
+            self.assertEqual(total, 2)
+            self.assertEqual([row["name"] for row in page], ["c3", "c9"])
+
+    def test_nested_pareto_candidates_are_stored(self):
+        result = _result(3)
+        result["pareto"] = {
+            "front": ["c0"],
+            "candidates": [{"name": f"c{idx}", "pareto_rank": idx // 4} for idx in range(12)],
+        }
+        with tempfile.TemporaryDirectory() as tmp:
+            slim = store_result_sections(result, Path(tmp), inline_top_k=5)
+            self.assertEqual(len(slim["pareto"]["candidates"]), 5)
+            self.assertEqual(slim["pareto"]["front"], ["c0"])
+            self.assertEqual(len(result["pareto"]["candidates"]), 12)
+            total, page = read_result_section(
+                slim, "pareto.candidates", filters=parse_result_filters(["pareto_rank:0"])
+            )
+            self.assertEqual(total, 4)
+            self.assertEqual([row["name"] for row in page], ["c0", "c1", "c2", "c3"])
+
+    def test_small_results_stay_inline(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = _result(3)
+            slim = store_result_sections(result, Path(tmp), inline_top_k=5)
+            self.assertEqual(slim, result)
+            self.assertEqual(read_result_section(slim, "candidates", offset=1)[0], 3)
+
+    def test_malformed_filter_is_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_result_filters(["propellant"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,26 @@
+import tempfile
 import unittest
+from pathlib import Path
 
 from app.api.v1.schemas import OptimizationRequest
+from app.api.v1.v1_mappers import JOB_INPUT_FILE_KEYS, compute_inputs_hash
 
 
 class SchemaTests(unittest.TestCase):
     def test_optimization_request_defaults(self):
         data = OptimizationRequest()
         self.assertEqual(data.params, {})
+
+
+class InputsHashTests(unittest.TestCase):
+    def test_input_files_are_hashed_by_content(self):
+        keys = JOB_INPUT_FILE_KEYS["motor_first"]
+        with tempfile.TemporaryDirectory() as tmp:
+            first = Path(tmp) / "a.ric"
+            copy = Path(tmp) / "b.ric"
+            first.write_text("motor: 1", encoding="utf-8")
+            copy.write_text("motor: 1", encoding="utf-8")
+            original = compute_inputs_hash({"motor_ric_path": str(first)}, keys)
+            self.assertEqual(compute_inputs_hash({"motor_ric_path": str(copy)}, keys), original)
+            first.write_text("motor: 2", encoding="utf-8")
+            self.assertNotEqual(compute_inputs_hash({"motor_ric_path": str(first)}, keys), original)
@@ -0,0 +1,56 @@
+import unittest
+
+from app.engine.openmotor_ai.scoring import (
+    Candidate,
+    ScoreWeights,
+    pareto_fronts,
+    pareto_report,
+    rerank_pareto,
+    score_candidates,
+)
+
+
+def _candidate(name, apogee_ft, isp, peak_pressure, peak_kn, stage_length_in):
+    return Candidate(
+        name=name,
+        metrics={
+            "delivered_specific_impulse": isp,
+            "peak_chamber_pressure": peak_pressure,
+            "peak_kn": peak_kn,
+            "port_to_throat_ratio": 2.0,
+        },
+        apogee_ft=apogee_ft,
+        vehicle_length_in=100.0,
+        stage_length_in=stage_length_in,
+    )
+
+
+CANDIDATES = [
+    _candidate("tall", 12000.0, 180.0, 5.0e6, 300.0, 60.0),
+    _candidate("efficient", 9000.0, 210.0, 4.0e6, 250.0, 50.0),
+    _candidate("dominated", 8500.0, 170.0, 5.5e6, 320.0, 65.0),
+    _candidate("compact", 7000.0, 175.0, 3.0e6, 200.0, 30.0),
+]
+
+
+class ParetoTests(unittest.TestCase):
+    def test_non_dominated_sort(self):
+        report = pareto_report(CANDIDATES, p_max=6.0e6, kn_max=400.0)
+        self.assertEqual(sorted(report["front"]), ["compact", "efficient", "tall"])
+        ranks = {entry["name"]: entry["pareto_rank"] for entry in report["candidates"]}
+        self.assertEqual(ranks["dominated"], 1)
+        vectors = [entry["objectives"] for entry in sorted(report["candidates"], key=lambda e: e["index"])]
+        self.assertEqual(pareto_fronts(vectors), [[0, 1, 3], [2]])
+
+    def test_rerank_matches_fresh_scoring(self):
+        report = pareto_report(CANDIDATES, p_max=6.0e6, kn_max=400.0)
+        for weights in (ScoreWeights(), ScoreWeights(apogee=0.0, packaging=1.0)):
+            fresh = score_candidates(CANDIDATES, p_max=6.0e6, kn_max=400.0, weights=weights)
+            reranked = rerank_pareto(report, weights)
+            self.assertEqual([entry["name"] for entry in reranked], [item.candidate.name for item in fresh])
+            for entry, item in zip(reranked, fresh):
+                self.assertAlmostEqual(entry["total_score"], item.total_score)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1 +1 @@
-from ._find_perimeter import find_perimeter
\ No newline at end of file
+from ._find_perimeter import find_perimeter, find_perimeter_curve
@@ -81,21 +81,180 @@ def find_perimeter(image, level,
     if image.ndim != 2:
         raise ValueError('Only 2D arrays are supported.')
     if _get_perimeter is None:
-        # Fallback: approximate perimeter by counting cell edge transitions.
-        mask = image > float(level)
-        perim = 0.0
-        for axis in (0, 1):
-            diff = np.diff(mask.astype(np.int8), axis=axis)
-            perim += np.count_nonzero(diff)
-        segments = []
-        return perim, segments
-    (perimeter,segments) = _get_perimeter(image, float(level), fully_connected == 'high', including_contours)
+        (perimeter, segments) = _get_perimeter_numpy(image, float(level), fully_connected == 'high', including_contours)
+    else:
+        (perimeter, segments) = _get_perimeter(image, float(level), fully_connected == 'high', including_contours)
     contours = []
     if including_contours:
         contours = _assemble_contours(segments)
     return perimeter, contours
 
 
+def find_perimeter_curve(image, levels):
+    """Find the contour perimeter of a 2D array at every value in an ascending sequence of levels.
+
+    Gives the same result as calling find_perimeter once per level, but each marching square is only visited for
+    the levels that actually pass through it. For distance maps, where neighbouring values differ by about one
+    cell, that is a handful of levels per square instead of every level.
+
+    Parameters
+    ----------
+    image : 2D ndarray of double
+        Input image in which to find contours.
+    levels : 1D ndarray of double
+        Ascending values at which to measure the perimeter.
+
+    Returns
+    -------
+    perimeters : 1D ndarray of double
+        The perimeter at each level, in the same units as find_perimeter.
+    """
+    levels = np.asarray(levels, dtype=np.float64)
+    perimeters = np.zeros(len(levels))
+    ul, ur, ll, lr = _interior_squares(image, False)
+    low = np.minimum(np.minimum(ul, ur), np.minimum(ll, lr))
+    high = np.maximum(np.maximum(ul, ur), np.maximum(ll, lr))
+    # A square contributes at level L when low <= L < high, which is exactly when its case is not 0 or 15
+    first = np.searchsorted(levels, low, side='left')
+    last = np.searchsorted(levels, high, side='left')
+    spans = last - first
+    for offset in range(int(spans.max(initial=0))):
+        active = spans > offset
+        index = first[active] + offset
+        lengths = _segment_lengths(ul[active], ur[active], ll[active], lr[active], levels[index])
+        perimeters += np.bincount(index, weights=lengths, minlength=len(levels))
+    return perimeters
+
+
+# Rows are the square case, columns are the segment lengths cutting off the ul, ur, ll and lr corners, then the
+# top-to-bottom and left-to-right segments. This mirrors the case table in _find_perimeter_cy.pyx.
+_CASE_SEGMENTS = np.array([
+    [0, 0, 0, 0, 0, 0],
+    [1, 0, 0, 0, 0, 0],
+    [0, 1, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 1],
+    [0, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 1, 0],
+    [0, 1, 1, 0, 0, 0],
+    [0, 0, 0, 1, 0, 0],
+    [0, 0, 0, 1, 0, 0],
+    [1, 0, 0, 1, 0, 0],
+    [0, 0, 0, 0, 1, 0],
+    [0, 0, 1, 0, 0, 0],
+    [0, 0, 0, 0, 0, 1],
+    [0, 1, 0, 0, 0, 0],
+    [1, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0],
+], dtype=np.float64)
+
+# Segment endpoints for the unambiguous cases, in the order the Cython kernel emits them
+_CASE_ENDPOINTS = {
+    1: lambda top, bottom, left, right: (top, left),
+    2: lambda top, bottom, left, right: (right, top),
+    3: lambda top, bottom, left, right: (right, left),
+    4: lambda top, bottom, left, right: (left, bottom),
+    5: lambda top, bottom, left, right: (top, bottom),
+    7: lambda top, bottom, left, right: (right, bottom),
+    8: lambda top, bottom, left, right: (bottom, right),
+    10: lambda top, bottom, left, right: (bottom, top),
+    11: lambda top, bottom, left, right: (bottom, left),
+    12: lambda top, bottom, left, right: (left, right),
+    13: lambda top, bottom, left, right: (top, right),
+    14: lambda top, bottom, left, right: (left, top),
+}
+
+
+def _get_fraction(from_value, to_value, level):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fraction = (level - from_value) / (to_value - from_value)
+    return np.where(to_value == from_value, 0.0, fraction)
+
+
+def _square_case(ul, ur, ll, lr, level):
+    return (
+        (ul > level).astype(np.intp)
+        + (ur > level) * 2
+        + (ll > level) * 4
+        + (lr > level) * 8
+    )
+
+
+def _interior_squares(image, returning_contours):
+    """Corner values of the squares the Cython kernel visits, flattened, with the same edge and radius skips."""
+    array = np.ascontiguousarray(np.ma.getdata(image), dtype=np.float64)
+    rows, cols = array.shape
+    ul = array[3:rows - 4, 3:cols - 4]
+    ur = array[3:rows - 4, 4:cols - 3]
+    ll = array[4:rows - 3, 3:cols - 4]
+    lr = array[4:rows - 3, 4:cols - 3]
+    keep = np.ones(ul.shape, dtype=bool)
+    if not returning_contours:
+        # The compiled kernel halves the shape with C integer division, so this does too
+        r0, c0 = np.ogrid[3:rows - 4, 3:cols - 4]
+        keep = np.hypot(r0 + 0.5 - (rows // 2), c0 + 0.5 - (cols // 2)) <= (rows // 2) - 3
+    return ul[keep], ur[keep], ll[keep], lr[keep]
+
+
+def _segment_lengths(ul, ur, ll, lr, level):
+    square_case = _square_case(ul, ur, ll, lr, level)
+    top = _get_fraction(ul, ur, level)
+    bottom = _get_fraction(ll, lr, level)
+    left = _get_fraction(ll, ul, level)
+    right = _get_fraction(lr, ur, level)
+    terms = np.stack((
+        np.hypot(top, 1 - left),
+        np.hypot(1 - top, 1 - right),
+        np.hypot(left, bottom),
+        np.hypot(1 - bottom, right),
+        np.hypot(top - bottom, 1),
+        np.hypot(right - left, 1),
+    ), axis=-1)
+    return np.einsum('ij,ij->i', _CASE_SEGMENTS[square_case], terms)
+
+
+def _get_perimeter_numpy(image, level, vertex_connect_high, returning_contours):
+    """Vectorized equivalent of _find_perimeter_cy._get_perimeter, used when the extension isn't built."""
+    if returning_contours:
+        return _get_perimeter_with_segments(image, level, vertex_connect_high)
+    ul, ur, ll, lr = _interior_squares(image, False)
+    square_case = _square_case(ul, ur, ll, lr, level)
+    crossing = (square_case != 0) & (square_case != 15)
+    lengths = _segment_lengths(ul[crossing], ur[crossing], ll[crossing], lr[crossing], level)
+    return float(lengths.sum()), []
+
+
+def _get_perimeter_with_segments(image, level, vertex_connect_high):
+    array = np.ascontiguousarray(np.ma.getdata(image), dtype=np.float64)
+    rows, cols = array.shape
+    ul, ur, ll, lr = _interior_squares(array, True)
+    square_case = _square_case(ul, ur, ll, lr, level)
+    crossing = np.flatnonzero((square_case != 0) & (square_case != 15))
+    lengths = _segment_lengths(ul[crossing], ur[crossing], ll[crossing], lr[crossing], level)
+    segments = []
+    for flat in crossing:
+        r0, c0 = divmod(int(flat), cols - 7)
+        r0, c0 = r0 + 3, c0 + 3
+        r1, c1 = r0 + 1, c0 + 1
+        vul, vur, vll, vlr = array[r0, c0], array[r0, c1], array[r1, c0], array[r1, c1]
+        top = r0, c0 + float(_get_fraction(vul, vur, level))
+        bottom = r1, c0 + float(_get_fraction(vll, vlr, level))
+        left = r0 + float(_get_fraction(vul, vll, level)), c0
+        right = r0 + float(_get_fraction(vur, vlr, level)), c1
+        case = int(square_case[flat])
+        if case == 6:
+            if vertex_connect_high:
+                segments.extend(((left, top), (right, bottom)))
+            else:
+                segments.extend(((right, top), (left, bottom)))
+        elif case == 9:
+            if vertex_connect_high:
+                segments.extend(((top, right), (bottom, left)))
+            else:
+                segments.extend(((top, left), (bottom, right)))
+        else:
+            segments.append(_CASE_ENDPOINTS[case](top, bottom, left, right))
+    return float(lengths.sum()), segments
+
 
 def _assemble_contours(segments):
     current_index = 0
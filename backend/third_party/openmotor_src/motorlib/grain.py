@@ -3,7 +3,10 @@ This module includes the base classes from which all grain classes should inheri
 should be instantiated directly.
 """
 
+import hashlib
+import os
 from abc import abstractmethod
+from collections import OrderedDict
 from typing import Tuple, List, Union
 
 import numpy as np
@@ -19,6 +22,95 @@ from .simResult import SimAlert, SimAlertLevel, SimAlertType
 from .constants import maximumRefDiameter, maximumRefLength
 
 
+class RegressionMapEntry:
+    """
+    The geometry-only products of the fast marching method for one core map: the regression map, and the number of
+    propellant pixels left and the core perimeter in pixels at each polled regression level. Everything is in map
+    units, so one entry can serve grains of any diameter or length.
+    """
+
+    def __init__(
+        self, regressionMap: np.ma.MaskedArray, faceCounts: np.ndarray, perimeters: np.ndarray
+    ) -> None:
+        faceCounts.setflags(write=False)
+        perimeters.setflags(write=False)
+        self.regressionMap = regressionMap
+        self.faceCounts = faceCounts
+        self.perimeters = perimeters
+        self.maxDist = float(np.amax(regressionMap))
+
+
+class RegressionMapCache:
+    """
+    A small LRU cache of RegressionMapEntry objects keyed on the core map image and the map dimension. Sweeps that
+    only change grain length or the nozzle keep the same cross section, so the skfmm solve only has to happen once.
+    If cacheDir is set, entries are also persisted there as .npy files and shared between processes.
+    """
+
+    def __init__(self, maxEntries: int = 8, cacheDir: Union[str, None] = None) -> None:
+        self.maxEntries = maxEntries
+        self.cacheDir = cacheDir
+        self.entries: "OrderedDict[Tuple[int, str], RegressionMapEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def makeKey(coreMap: np.ndarray, mapDim: int) -> Tuple[int, str]:
+        digest = hashlib.blake2b(np.ascontiguousarray(coreMap).tobytes(), digest_size=16)
+        return (mapDim, digest.hexdigest())
+
+    def _paths(self, key: Tuple[int, str]) -> Tuple[str, str, str]:
+        stem = os.path.join(self.cacheDir, "fmm_{}_{}".format(*key))
+        return stem + "_map.npy", stem + "_face.npy", stem + "_perim.npy"
+
+    def get(self, key: Tuple[int, str], mask: np.ndarray) -> Union[RegressionMapEntry, None]:
+        entry = self.entries.get(key)
+        if entry is None and self.cacheDir:
+            paths = self._paths(key)
+            if all(os.path.exists(path) for path in paths):
+                mapPath, facePath, perimPath = paths
+                try:
+                    entry = RegressionMapEntry(
+                        np.ma.MaskedArray(np.load(mapPath), mask),
+                        np.load(facePath),
+                        np.load(perimPath),
+                    )
+                except (OSError, ValueError):
+                    entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._remember(key, entry)
+        self.hits += 1
+        return entry
+
+    def put(self, key: Tuple[int, str], entry: RegressionMapEntry) -> None:
+        self._remember(key, entry)
+        if self.cacheDir:
+            mapPath, facePath, perimPath = self._paths(key)
+            try:
+                os.makedirs(self.cacheDir, exist_ok=True)
+                np.save(mapPath, np.ma.getdata(entry.regressionMap))
+                np.save(facePath, entry.faceCounts)
+                np.save(perimPath, entry.perimeters)
+            except OSError:
+                pass  # The disk copy is best-effort, the in-memory entry is still valid
+
+    def _remember(self, key: Tuple[int, str], entry: RegressionMapEntry) -> None:
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+regressionMapCache = RegressionMapCache(cacheDir=os.environ.get("OPENMOTOR_FMM_CACHE_DIR") or None)
+
+
 class Grain(PropertyCollection):
     """
     A basic propellant grain.
@@ -317,6 +409,9 @@ class FmmGrain(PerforatedGrain):
         self.regressionMap = None
         self.faceArea = None
         self.faceAreaFunc = None
+        self.corePerimeter = None
+        self.corePerimeterFunc = None
+        self.regressionEntry = None
 
     def normalize(self, value: float) -> float:
         """
@@ -396,31 +491,52 @@ class FmmGrain(PerforatedGrain):
         """
         Uses the fast marching method to generate an image of how the grain regresses from the core map.
 
-        The map is stored under self.regressionMap.
+        The map is stored under self.regressionMap. Results are shared through regressionMapCache, so grains with
+        the same cross section and map dimension only pay for the distance solve once.
+        """
+        key = RegressionMapCache.makeKey(self.coreMap, self.mapDim)
+        entry = regressionMapCache.get(key, self.mask)
+        if entry is None:
+            masked = np.ma.MaskedArray(self.coreMap, self.mask)
+            cellSize = 1 / self.mapDim
+            regressionMap = skfmm.distance(masked, dx=cellSize) * 2
+            faceCounts = self.countFacePixels(regressionMap)
+            polled = np.arange(len(faceCounts)) / self.mapDim
+            perimeters = mathlib.find_perimeter_curve(regressionMap, polled)
+            entry = RegressionMapEntry(regressionMap, faceCounts, perimeters)
+            regressionMapCache.put(key, entry)
+        self.regressionEntry = entry
+        self.regressionMap = entry.regressionMap
+        self.wallWeb = self.unNormalize(entry.maxDist)
+        polled = np.arange(len(entry.faceCounts)) / self.mapDim
+        self.faceArea = savgol_filter(self.mapToArea(entry.faceCounts), 31, 5)
+        self.faceAreaFunc = interpolate.interp1d(polled, self.faceArea)
+        self.corePerimeter = savgol_filter(self.mapToLength(entry.perimeters), 31, 5)
+        self.corePerimeterFunc = interpolate.interp1d(polled, self.corePerimeter)
+
+    def countFacePixels(self, regressionMap: np.ma.MaskedArray) -> np.ndarray:
+        """
+        Counts the propellant pixels that remain past each polled regression level (every 1 / mapDim in map units).
+
+        The valid distances are sorted once and each level is found by bisection, which gives the same counts as
+        thresholding the whole map at every level.
         """
-        masked = np.ma.MaskedArray(self.coreMap, self.mask)
-        cellSize = 1 / self.mapDim
-        self.regressionMap = skfmm.distance(masked, dx=cellSize) * 2
-        maxDist = np.amax(self.regressionMap)
-        self.wallWeb = self.unNormalize(maxDist)
-        faceArea = []
-        polled = []
         valid = np.logical_not(self.mask)
-        for i in range(int(maxDist * self.mapDim) + 2):
-            polled.append(i / self.mapDim)
-            faceArea.append(
-                self.mapToArea(
-                    np.count_nonzero(
-                        np.logical_and(self.regressionMap > (i / self.mapDim), valid)
-                    )
-                )
-            )
-        self.faceArea = savgol_filter(faceArea, 31, 5)
-        self.faceAreaFunc = interpolate.interp1d(polled, self.faceArea)
+        distances = np.sort(np.ma.getdata(regressionMap)[valid], axis=None)
+        levels = np.arange(int(np.amax(regressionMap) * self.mapDim) + 2) / self.mapDim
+        remaining = distances.size - np.searchsorted(distances, levels, side="right")
+        return remaining.astype(np.float64)
 
     def getCorePerimeter(self, regDist: float) -> float:
+        """
+        Interpolates the core perimeter from the curve sampled at every polled level in generateRegressionMap,
+        rather than running marching squares over the whole regression map each timestep.
+        """
         mapDist = self.normalize(regDist)
-        return self.mapToLength(mathlib.find_perimeter(self.regressionMap, mapDist)[0])
+        index = int(mapDist * self.mapDim)
+        if index >= len(self.corePerimeter) - 1:
+            return 0  # Past burnout
+        return max(float(self.corePerimeterFunc(mapDist)), 0)
 
     def getFaceArea(self, regDist: float):
         mapDist = self.normalize(regDist)
@@ -10,7 +10,13 @@ from .grains import EndBurningGrain, grainTypes
 from .nozzle import Nozzle
 from .propellant import Propellant
 from .properties import FloatProperty, IntProperty, PropertyCollection
-from .simResult import SimAlert, SimAlertLevel, SimAlertType, SimulationResult
+from .simResult import (
+    SimAlert,
+    SimAlertLevel,
+    SimAlertType,
+    SimLimitViolation,
+    SimulationResult,
+)
 from .grain import Grain
 
 
@@ -186,14 +192,39 @@ class Motor:
 
         return max(M, 0)
 
-    def runSimulation(self, callback=None) -> SimulationResult:
+    def checkLimits(self, simRes, limits) -> bool:
+        """Compares the latest value of each limited channel against its limit. Limits are a dictionary of channel
+        name to maximum value, where a limit of None is ignored and multi-value channels are compared by their largest
+        entry. The first crossing is recorded on the result along with an error alert, and True is returned."""
+        if not limits:
+            return False
+        for channel, limit in limits.items():
+            if limit is None:
+                continue
+            value = simRes.channels[channel].getLast()
+            if isinstance(value, (list, tuple)):
+                value = max(value, default=0)
+            if value > limit:
+                time = simRes.channels["time"].getLast()
+                simRes.limitViolation = SimLimitViolation(channel, limit, value, time)
+                desc = "{} exceeded limit of {:.6g} at {:.4f} s".format(
+                    simRes.channels[channel].name, limit, time
+                )
+                simRes.addAlert(
+                    SimAlert(SimAlertLevel.ERROR, SimAlertType.CONSTRAINT, desc, "Motor")
+                )
+                return True
+        return False
+
+    def runSimulation(self, callback=None, limits=None) -> SimulationResult:
         """Runs a simulation of the motor and returns a simRes instance with the results. Constraints are checked,
         including the number of grains, if the motor has a propellant set, and if the grains have geometry errors. If
         all of these tests are passed, the motor's operation is simulated by calculating Kn, using this value to get
         pressure, and using pressure to determine thrust and other statistics. The next timestep is then prepared by
         using the pressure to determine how the motor will regress in the given timestep at the current pressure.
         This process is repeated and regression tracked until all grains have burned out, when the results and any
-        warnings are returned."""
+        warnings are returned. If limits are passed (see checkLimits), the simulation stops at the first timestep that
+        crosses one instead of running to burnout."""
         burnoutWebThres = self.config.getProperty("burnoutWebThres")
         burnoutThrustThres = self.config.getProperty("burnoutThrustThres")
         dTime = self.config.getProperty("timestep")
@@ -275,6 +306,8 @@ class Motor:
         simRes.channels["exitPressure"].addData(0)
         simRes.channels["dThroat"].addData(0)
         simRes.channels["machNumber"].addData([0 for grain in self.grains])
+        if self.checkLimits(simRes, limits):
+            return simRes
 
         # Check port/throat ratio and add a warning if it is not large enough
         aftPort = self.grains[-1].getPortArea(0)
@@ -377,6 +410,9 @@ class Motor:
             change = dTime * ((-2 * slagRate) + (2 * erosionRate))
             simRes.channels["dThroat"].addData(dThroat + change)
 
+            if self.checkLimits(simRes, limits):
+                return simRes
+
             if callback is not None:
                 # Uses the grain with the largest percentage of its web left
                 progress = max(
@@ -53,6 +53,17 @@ class SimAlert:
         self.location = location
 
 
+class SimLimitViolation:
+    """Records the first limit that a constrained simulation crossed. The channel is the name of the log channel that
+    was checked, the limit and value are in that channel's units, and the time is when the value was observed."""
+
+    def __init__(self, channel, limit, value, time):
+        self.channel = channel
+        self.limit = limit
+        self.value = value
+        self.time = time
+
+
 class LogChannel:
     """A log channel accepts data from a single source throughout a simulation. It has a human-readable name such as
     'Pressure' to help the user interpret the result, a value type that data passed in will be cast to, and a unit to
@@ -131,6 +142,7 @@ class SimulationResult:
 
         self.alerts: List[SimAlert] = []
         self.success = False
+        self.limitViolation = None
 
         self.channels = {
             "time": LogChannel("Time", float, "s"),